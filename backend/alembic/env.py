@@ -0,0 +1,68 @@
+"""Alembic migration environment"""
+
+from logging.config import fileConfig
+
+from alembic import context
+from app.config import settings
+from app.database import Base, build_engine
+from app.models import *  # noqa: F401,F403 - register all models on Base
+from app.models import audit, search
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Leave the search index and audit log partitions out of comparisons"""
+    return search.include_object(
+        object, name, type_, reflected, compare_to
+    ) and audit.include_object(object, name, type_, reflected, compare_to)
+
+
+def get_url() -> str:
+    """Use sqlalchemy.url if set, otherwise the application's DATABASE_URL"""
+    return config.get_main_option("sqlalchemy.url") or settings.database_url
+
+
+def run_migrations_offline() -> None:
+    """Emit migration SQL without connecting to the database"""
+    context.configure(
+        url=get_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=True,
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Run migrations against a live connection"""
+    engine = build_engine(get_url())
+
+    with engine.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            # SQLite cannot ALTER most constraints in place
+            render_as_batch=connection.dialect.name == "sqlite",
+            include_object=include_object,
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+    engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,43 @@
+"""content hash of candidate CV files
+
+candidates.file_hash holds the SHA-256 of the CV file, which names it in the
+content-addressed store. Existing files are moved into the store, and their
+hashes filled in, by ``scripts/migrate_cv_storage.py`` after the upgrade;
+until then their file_hash stays NULL, which the application handles.
+
+Revision ID: 0001a
+Revises: 0001
+Create Date: 2026-10-20 10:02:11.384520
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0001a"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Databases created by init_db() after this change already have it
+    columns = {c["name"] for c in sa.inspect(op.get_bind()).get_columns("candidates")}
+    if "file_hash" in columns:
+        return
+    op.add_column(
+        "candidates", sa.Column("file_hash", sa.String(length=64), nullable=True)
+    )
+    op.create_index(
+        op.f("ix_candidates_file_hash"), "candidates", ["file_hash"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_candidates_file_hash"), table_name="candidates")
+    with op.batch_alter_table("candidates") as batch_op:
+        batch_op.drop_column("file_hash")
@@ -0,0 +1,52 @@
+"""parse cache keyed by file content and parser version
+
+Revision ID: 0001b
+Revises: 0001a
+Create Date: 2026-10-20 10:04:37.915206
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0001b"
+down_revision: Union[str, None] = "0001a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Databases created by init_db() after this change already have it
+    if sa.inspect(op.get_bind()).has_table("parse_cache"):
+        return
+    op.create_table(
+        "parse_cache",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("file_hash", sa.String(length=64), nullable=False),
+        sa.Column("parser_version", sa.String(length=20), nullable=False),
+        sa.Column("taxonomy_version", sa.String(length=64), nullable=False),
+        sa.Column("data", sa.JSON(), nullable=True),
+        sa.Column("raw_text", sa.Text(), nullable=True),
+        sa.Column("hit_count", sa.Integer(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=True,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "file_hash", "parser_version", name="uq_parse_cache_file_parser"
+        ),
+    )
+    op.create_index(op.f("ix_parse_cache_id"), "parse_cache", ["id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_parse_cache_id"), table_name="parse_cache")
+    op.drop_table("parse_cache")
@@ -0,0 +1,73 @@
+"""compressed raw_text
+
+candidates.raw_text and parse_cache.raw_text become binary columns holding
+compressed text. On PostgreSQL TEXT is converted to BYTEA with the
+uncompressed codec prefix, so existing values stay readable; then every
+existing value is compressed in place. The downgrade decompresses them and
+converts the columns back to TEXT.
+
+Revision ID: 0001c
+Revises: 0001b
+Create Date: 2026-10-20 10:07:52.260418
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.utils.compression import compress_column, decompress_column
+
+# revision identifiers, used by Alembic.
+revision: str = "0001c"
+down_revision: Union[str, None] = "0001b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ["candidates", "parse_cache"]
+
+
+def _alter_raw_text(table: str, **kw) -> None:
+    with op.batch_alter_table(table) as batch_op:
+        batch_op.alter_column("raw_text", **kw)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    sqlite = bind.dialect.name == "sqlite"
+    for table in TABLES:
+        columns = {c["name"]: c["type"] for c in sa.inspect(bind).get_columns(table)}
+        # Databases created by init_db() after this change already have it
+        convert = not isinstance(columns["raw_text"], sa.LargeBinary)
+        to_binary = dict(
+            existing_type=sa.Text(),
+            type_=sa.LargeBinary(),
+            postgresql_using="decode('00', 'hex') || convert_to(raw_text, 'UTF8')",
+        )
+
+        # SQLite's batch copy casts plain text to BLOB without a codec prefix,
+        # so values are compressed first there; PostgreSQL needs BYTEA first
+        if convert and not sqlite:
+            _alter_raw_text(table, **to_binary)
+        compress_column(bind, table, "raw_text")
+        if convert and sqlite:
+            _alter_raw_text(table, **to_binary)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for table in TABLES:
+        decompress_column(bind, table, "raw_text")
+        if bind.dialect.name == "sqlite":
+            # Strip the codec byte while the values are still BLOBs
+            op.execute(
+                f"UPDATE {table} SET raw_text = CAST(substr(raw_text, 2) AS TEXT) "
+                f"WHERE typeof(raw_text) = 'blob'"
+            )
+        _alter_raw_text(
+            table,
+            existing_type=sa.LargeBinary(),
+            type_=sa.Text(),
+            postgresql_using="convert_from(substring(raw_text from 2), 'UTF8')",
+        )
@@ -0,0 +1,53 @@
+"""indexes for hot query patterns
+
+Ranking results filter candidate_scores by job_id ordered by rank, cascades
+look scores up by candidate_id, reports filter candidates by parse_status
+and jobs by status, and the audit log is read newest first.
+
+Revision ID: 0002
+Revises: 0001c
+Create Date: 2026-10-19 15:02:11.514203
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_candidate_scores_job_id_rank",
+        "candidate_scores",
+        ["job_id", "rank"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_candidate_scores_candidate_id"),
+        "candidate_scores",
+        ["candidate_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_candidates_parse_status"), "candidates", ["parse_status"], unique=False
+    )
+    op.create_index(
+        op.f("ix_audit_logs_timestamp"), "audit_logs", ["timestamp"], unique=False
+    )
+    op.create_index(op.f("ix_jobs_status"), "jobs", ["status"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_jobs_status"), table_name="jobs")
+    op.drop_index(op.f("ix_audit_logs_timestamp"), table_name="audit_logs")
+    op.drop_index(op.f("ix_candidates_parse_status"), table_name="candidates")
+    op.drop_index(
+        op.f("ix_candidate_scores_candidate_id"), table_name="candidate_scores"
+    )
+    op.drop_index("ix_candidate_scores_job_id_rank", table_name="candidate_scores")
@@ -0,0 +1,51 @@
+"""full-text search index over candidates
+
+SQLite gets an FTS5 external-content table synced by triggers, reading CV
+text through the decompress_text() SQL function. PostgreSQL gets a
+search_vector tsvector column with a GIN index, kept up to date by the
+application because raw_text is stored compressed. Existing candidates are
+indexed as part of the upgrade.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 16:20:43.108734
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from app.models.search import (
+    POSTGRESQL_SEARCH_DDL,
+    POSTGRESQL_SEARCH_DROP,
+    SQLITE_SEARCH_DDL,
+    SQLITE_SEARCH_DROP,
+    rebuild_search_index,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for statement in SQLITE_SEARCH_DDL:
+            op.execute(statement)
+    elif dialect == "postgresql":
+        for statement in POSTGRESQL_SEARCH_DDL:
+            op.execute(statement)
+    rebuild_search_index(op.get_bind())
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for statement in SQLITE_SEARCH_DROP:
+            op.execute(statement)
+    elif dialect == "postgresql":
+        for statement in POSTGRESQL_SEARCH_DROP:
+            op.execute(statement)
@@ -0,0 +1,58 @@
+"""candidate facet tags and precomputed facet counts
+
+candidate_tags holds one row per skill, language, parse status and
+experience band of each candidate, for filtering. facet_counts holds the
+number of candidates per facet value. Both are filled from the existing
+candidates during the upgrade.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 17:41:05.662918
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.models.facets import rebuild_facets
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "candidate_tags",
+        sa.Column("candidate_id", sa.Integer(), nullable=False),
+        sa.Column("facet", sa.String(length=20), nullable=False),
+        sa.Column("value", sa.String(length=255), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["candidate_id"], ["candidates.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("candidate_id", "facet", "value"),
+    )
+    op.create_index(
+        "ix_candidate_tags_facet_value",
+        "candidate_tags",
+        ["facet", "value", "candidate_id"],
+        unique=False,
+    )
+    op.create_table(
+        "facet_counts",
+        sa.Column("facet", sa.String(length=20), nullable=False),
+        sa.Column("value", sa.String(length=255), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("facet", "value"),
+    )
+    rebuild_facets(op.get_bind())
+
+
+def downgrade() -> None:
+    op.drop_table("facet_counts")
+    op.drop_index("ix_candidate_tags_facet_value", table_name="candidate_tags")
+    op.drop_table("candidate_tags")
@@ -0,0 +1,31 @@
+"""monthly audit log partitions
+
+On PostgreSQL audit_logs becomes a table partitioned by month on timestamp,
+with a default partition; existing entries are copied into their months.
+SQLite has no partitioning and keeps the plain table, archived by month
+ranges of ix_audit_logs_timestamp.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 19:02:37.418206
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from app.models.audit import partition_audit_logs, unpartition_audit_logs
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    partition_audit_logs(op.get_bind())
+
+
+def downgrade() -> None:
+    unpartition_audit_logs(op.get_bind())
@@ -0,0 +1,52 @@
+"""materialized pipeline statistics
+
+pipeline_summary holds one row of candidate counts by parse status and job
+counts by status; job_score_stats holds the number of candidate scores and
+the number and sum of non-null total scores per job. Both are filled from the existing rows during the upgrade.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 21:26:48.913054
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.models.pipeline_stats import rebuild_pipeline_stats
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "pipeline_summary",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("candidates", sa.Integer(), nullable=False),
+        sa.Column("candidates_parsed", sa.Integer(), nullable=False),
+        sa.Column("candidates_failed", sa.Integer(), nullable=False),
+        sa.Column("jobs", sa.Integer(), nullable=False),
+        sa.Column("jobs_active", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "job_score_stats",
+        sa.Column("job_id", sa.Integer(), nullable=False),
+        sa.Column("ranked", sa.Integer(), nullable=False),
+        sa.Column("scored", sa.Integer(), nullable=False),
+        sa.Column("score_total", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(["job_id"], ["jobs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("job_id"),
+    )
+    rebuild_pipeline_stats(op.get_bind())
+
+
+def downgrade() -> None:
+    op.drop_table("job_score_stats")
+    op.drop_table("pipeline_summary")
@@ -0,0 +1,32 @@
+"""uniform audit log timestamp format on SQLite
+
+Entries written through the CURRENT_TIMESTAMP server default lack the
+microseconds SQLAlchemy writes, and SQLite compares the two as strings. Pads
+existing short timestamps and adds a trigger padding new ones. No-op on
+PostgreSQL.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-20 09:14:22.507731
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from app.models.audit import normalize_audit_timestamps
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    normalize_audit_timestamps(op.get_bind())
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        op.execute("DROP TRIGGER IF EXISTS audit_logs_timestamp_format")
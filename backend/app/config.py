@@ -1,7 +1,7 @@
 """Application configuration settings"""
 
 import os
-from typing import List
+from typing import List, Optional
 
 from pydantic_settings import BaseSettings
 
@@ -16,15 +16,69 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite:///./cv_sorting.db"
+    database_profile: str = "production"  # production or default
+    database_read_url: Optional[str] = None  # Read replica for read-only routes
+
+    # SQLite production profile
+    sqlite_journal_mode: str = "wal"
+    sqlite_synchronous: str = "normal"
+    sqlite_mmap_size: int = 268435456  # 256MB
+    sqlite_cache_size: int = -65536  # Negative means KiB, so 64MB
+    sqlite_busy_timeout_ms: int = 5000
+
+    # PostgreSQL production profile
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_pre_ping: bool = True
+    db_pool_recycle_seconds: int = 1800
+    db_statement_timeout_ms: int = 30000
 
     # Security
     secret_key: str = "dev-secret-key-change-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    # bcrypt cost; existing hashes are upgraded (or downgraded) on next login
+    bcrypt_rounds: int = 12
+    # Password hashing threads and how many more requests may wait for one
+    password_hash_workers: int = 2
+    password_hash_max_waiting: int = 64
+    # Authenticated users are cached this long; bounds how stale a
+    # deactivation can be in other workers (0 disables the cache)
+    user_cache_ttl_seconds: int = 30
+    user_cache_size: int = 10000
+    # Verified JWTs kept to skip signature checks (0 disables)
+    token_cache_size: int = 10000
 
     # File Storage
     storage_path: str = "./storage"
     max_file_size: int = 10485760  # 10MB
+    archive_max_members: int = 1000
+    archive_max_total_size: int = 524288000  # 500MB uncompressed
+
+    # PDF extraction budget (per file)
+    pdf_max_pages: int = 50
+    pdf_max_chars: int = 200000
+    pdf_time_budget_seconds: float = 20.0
+
+    # Parser sandbox for uploads (per file limits, workers recycled after N files)
+    parser_isolation: bool = True
+    parser_workers: int = 2
+    parser_timeout_seconds: float = 60.0
+    parser_memory_limit_mb: int = 1024
+    parser_max_tasks_per_worker: int = 100
+
+    # Candidate search: rank only the newest N matches of broad queries, flagged
+    # with X-Search-Windowed (0 = rank every match, slower on large databases)
+    search_rank_window: int = 10000
+
+    # Audit log: queue entries and bulk-insert them in the background
+    audit_async_writes: bool = True
+    audit_flush_interval_ms: int = 200
+    audit_batch_size: int = 500
+    # Entries waiting beyond this are written synchronously by the request
+    audit_queue_size: int = 10000
+    # Months older than this are archived to storage/audit_archive (0 = keep)
+    audit_retention_days: int = 365
 
     # CORS
     allowed_origins: List[str] = [
@@ -1,22 +1,182 @@
 """Database configuration and session management"""
 
-from sqlalchemy import create_engine
+from typing import Dict, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from app.config import settings
+from app.utils.compression import decompress_text
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.database_url,
-    connect_args=(
-        {"check_same_thread": False} if "sqlite" in settings.database_url else {}
-    ),
-    echo=settings.debug,
+# asyncio drivers used for each sync database URL scheme
+ASYNC_DRIVERS = (
+    ("sqlite:", "sqlite+aiosqlite:"),
+    ("postgresql+psycopg2:", "postgresql+asyncpg:"),
+    ("postgresql:", "postgresql+asyncpg:"),
 )
 
+
+@event.listens_for(Engine, "connect")
+def _register_sqlite_functions(dbapi_connection, connection_record):
+    """Register SQL functions used by the candidate search index on SQLite"""
+    # sqlite3 connections and the aiosqlite adapter both expose create_function
+    if hasattr(dbapi_connection, "create_function"):
+        dbapi_connection.create_function("decompress_text", 1, _sql_decompress_text)
+
+
+def _sql_decompress_text(value):
+    if value is None or isinstance(value, str):
+        return value
+    return decompress_text(value)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply the production PRAGMAs to every new SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={settings.sqlite_journal_mode}")
+    cursor.execute(f"PRAGMA synchronous={settings.sqlite_synchronous}")
+    cursor.execute(f"PRAGMA mmap_size={settings.sqlite_mmap_size}")
+    cursor.execute(f"PRAGMA cache_size={settings.sqlite_cache_size}")
+    cursor.execute(f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}")
+    cursor.close()
+
+
+def _set_sqlite_query_only(dbapi_connection, connection_record):
+    """Reject writes on read replica connections"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only=ON")
+    cursor.close()
+
+
+def _check_profile(profile: Optional[str]) -> str:
+    profile = profile or settings.database_profile
+    if profile not in ("default", "production"):
+        raise ValueError(f"Unknown database profile: {profile}")
+    return profile
+
+
+def _add_sqlite_listeners(engine: Engine, profile: str, read_only: bool):
+    if profile == "production":
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+    if read_only:
+        event.listen(engine, "connect", _set_sqlite_query_only)
+
+
+def _pool_options(profile: str) -> Dict:
+    """Connection pool settings for server databases"""
+    if profile == "default":
+        return {}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+    }
+
+
+def _postgresql_settings(profile: str, read_only: bool) -> Dict[str, str]:
+    """Server settings applied to each PostgreSQL session"""
+    server_settings = {}
+    if profile == "production":
+        server_settings["statement_timeout"] = str(settings.db_statement_timeout_ms)
+    if read_only:
+        server_settings["default_transaction_read_only"] = "on"
+    return server_settings
+
+
+def build_engine(
+    url: str, profile: Optional[str] = None, read_only: bool = False
+) -> Engine:
+    """
+    Create an engine for ``url`` using an engine profile.
+
+    The "production" profile runs SQLite in WAL mode with tuned PRAGMAs, and
+    gives PostgreSQL a sized, pre-pinged pool with a statement timeout. The
+    "default" profile uses SQLAlchemy's defaults. ``read_only`` engines refuse
+    writes, for use with a read replica.
+    """
+    profile = _check_profile(profile)
+
+    if url.startswith("sqlite"):
+        engine = create_engine(
+            url, connect_args={"check_same_thread": False}, echo=settings.debug
+        )
+        _add_sqlite_listeners(engine, profile, read_only)
+        return engine
+
+    connect_args = {}
+    if url.startswith("postgresql"):
+        server_settings = _postgresql_settings(profile, read_only)
+        if server_settings:
+            connect_args["options"] = " ".join(
+                f"-c {name}={value}" for name, value in server_settings.items()
+            )
+
+    return create_engine(
+        url, connect_args=connect_args, echo=settings.debug, **_pool_options(profile)
+    )
+
+
+def async_url(url: str) -> str:
+    """Swap the driver of a database URL for its asyncio equivalent"""
+    for prefix, async_prefix in ASYNC_DRIVERS:
+        if url.startswith(prefix):
+            return async_prefix + url[len(prefix) :]
+    return url
+
+
+def build_async_engine(
+    url: str, profile: Optional[str] = None, read_only: bool = False
+) -> AsyncEngine:
+    """Create an asyncio engine (aiosqlite/asyncpg) using an engine profile"""
+    profile = _check_profile(profile)
+    url = async_url(url)
+
+    if url.startswith("sqlite"):
+        engine = create_async_engine(url, echo=settings.debug)
+        _add_sqlite_listeners(engine.sync_engine, profile, read_only)
+        return engine
+
+    connect_args = {}
+    if url.startswith("postgresql"):
+        server_settings = _postgresql_settings(profile, read_only)
+        if server_settings:
+            connect_args["server_settings"] = server_settings
+
+    return create_async_engine(
+        url, connect_args=connect_args, echo=settings.debug, **_pool_options(profile)
+    )
+
+
+# Create SQLAlchemy engine
+engine = build_engine(settings.database_url)
+async_engine = build_async_engine(settings.database_url)
+
+# Optional read replica; read-only routes fall back to the primary without one
+if settings.database_read_url:
+    read_engine = build_engine(settings.database_read_url, read_only=True)
+    async_read_engine = build_async_engine(settings.database_read_url, read_only=True)
+else:
+    read_engine, async_read_engine = engine, async_engine
+
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+# Async sessions keep attributes loaded after commit, since lazy loads cannot
+# run implicitly under asyncio
+AsyncSessionLocal = sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+AsyncReadSessionLocal = sessionmaker(
+    bind=async_read_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 # Create Base class for models
 Base = declarative_base()
@@ -31,6 +191,27 @@ def get_db():
         db.close()
 
 
+def get_read_db():
+    """Dependency to get a session for read-only queries (replica if configured)"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    """Dependency to get an async database session"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db():
+    """Dependency to get an async session for read-only queries"""
+    async with AsyncReadSessionLocal() as db:
+        yield db
+
+
 def init_db():
     """Initialize database - create all tables"""
     Base.metadata.create_all(bind=engine)
@@ -4,8 +4,14 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
-from app.database import init_db
+from app.database import engine, init_db
+from app.models.audit import ensure_audit_partitions
 from app.routes import auth, candidates, jobs, matching, reports, users
+from app.services.audit_service import shutdown_audit_writer
+from app.services.parser_pool import shutdown_worker_pool
+from app.services.password_pool import shutdown_password_pool
+from app.services.search_service import SEARCH_WINDOWED_HEADER
+from app.utils.pagination import NEXT_CURSOR_HEADER
 
 # Create FastAPI app
 app = FastAPI(
@@ -21,6 +27,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, SEARCH_WINDOWED_HEADER],
 )
 
 # Include routers
@@ -34,8 +41,18 @@ app.include_router(users.router)
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database on startup"""
+    """Initialize database and upcoming audit log partitions on startup"""
     init_db()
+    with engine.begin() as connection:
+        ensure_audit_partitions(connection)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop worker pools and write out queued audit entries"""
+    shutdown_worker_pool()
+    shutdown_password_pool()
+    shutdown_audit_writer()
 
 
 @app.get("/")
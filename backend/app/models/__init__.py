@@ -9,14 +9,17 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    UniqueConstraint,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 
 from app.database import Base
+from app.models.types import CompressedText
 
 
 class User(Base):
@@ -53,11 +56,14 @@ class Candidate(Base):
     years_of_experience = Column(Float, default=0.0)
     skills = Column(JSON)  # List of skills
     languages = Column(JSON)  # List of languages
-    raw_text = Column(Text)  # Full CV text
-    file_path = Column(String(500))  # Path to original file
-    file_name = Column(String(255))
+    raw_text = deferred(Column(CompressedText))  # Full CV text, loaded on access
+    file_path = Column(String(500))  # Path to content-addressed file
+    file_hash = Column(String(64), index=True)  # SHA-256 of file content
+    file_name = Column(String(255))  # Original upload filename
     file_type = Column(String(20))  # pdf, docx, txt
-    parse_status = Column(String(50), default="pending")  # pending, success, failed
+    parse_status = Column(
+        String(50), default="pending", index=True
+    )  # pending, success, failed
     parse_error = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -68,6 +74,32 @@ class Candidate(Base):
     )
 
 
+class CandidateTag(Base):
+    """One facet value of a candidate (skill, language, status, experience band)"""
+
+    __tablename__ = "candidate_tags"
+    __table_args__ = (
+        # Filtering: WHERE facet = ? AND value IN (...)
+        Index("ix_candidate_tags_facet_value", "facet", "value", "candidate_id"),
+    )
+
+    candidate_id = Column(
+        Integer, ForeignKey("candidates.id", ondelete="CASCADE"), primary_key=True
+    )
+    facet = Column(String(20), primary_key=True)  # skill, language, status, experience
+    value = Column(String(255), primary_key=True)
+
+
+class FacetCount(Base):
+    """Number of candidates per facet value, maintained alongside candidate_tags"""
+
+    __tablename__ = "facet_counts"
+
+    facet = Column(String(20), primary_key=True)
+    value = Column(String(255), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
 class Job(Base):
     """Job position model"""
 
@@ -80,7 +112,7 @@ class Job(Base):
     nice_to_have = Column(JSON)  # List of nice-to-have skills
     minimum_experience = Column(Float, default=0.0)
     keywords = Column(JSON)  # List of keywords for matching
-    status = Column(String(50), default="active")  # active, closed, draft
+    status = Column(String(50), default="active", index=True)  # active, closed, draft
     created_by = Column(Integer, ForeignKey("users.id"))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -98,9 +130,15 @@ class CandidateScore(Base):
     """Candidate ranking scores for specific jobs"""
 
     __tablename__ = "candidate_scores"
+    __table_args__ = (
+        # Ranking results: WHERE job_id = ? ORDER BY rank
+        Index("ix_candidate_scores_job_id_rank", "job_id", "rank"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    candidate_id = Column(Integer, ForeignKey("candidates.id"), nullable=False)
+    candidate_id = Column(
+        Integer, ForeignKey("candidates.id"), nullable=False, index=True
+    )
     job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False)
 
     # Scoring components
@@ -124,6 +162,32 @@ class CandidateScore(Base):
     job = relationship("Job", back_populates="scores")
 
 
+class PipelineSummary(Base):
+    """Candidate and job counts for the pipeline report, a single row"""
+
+    __tablename__ = "pipeline_summary"
+
+    id = Column(Integer, primary_key=True)  # Always 1
+    candidates = Column(Integer, nullable=False, default=0)
+    candidates_parsed = Column(Integer, nullable=False, default=0)
+    candidates_failed = Column(Integer, nullable=False, default=0)
+    jobs = Column(Integer, nullable=False, default=0)
+    jobs_active = Column(Integer, nullable=False, default=0)
+
+
+class JobScoreStats(Base):
+    """Number and sum of candidate scores per job, for average scores"""
+
+    __tablename__ = "job_score_stats"
+
+    job_id = Column(
+        Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True
+    )
+    ranked = Column(Integer, nullable=False, default=0)  # All score rows
+    scored = Column(Integer, nullable=False, default=0)  # Non-null total scores
+    score_total = Column(Float, nullable=False, default=0.0)
+
+
 class AuditLog(Base):
     """Audit log for tracking system actions"""
 
@@ -138,7 +202,33 @@ class AuditLog(Base):
     entity_id = Column(Integer)
     details = Column(JSON)  # Additional context
     ip_address = Column(String(50))
-    timestamp = Column(DateTime(timezone=True), server_default=func.now())
+    timestamp = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
     # Relationships
     user = relationship("User", back_populates="audit_logs")
+
+
+class ParseCache(Base):
+    """Cached CV parse results keyed by file content and parser version"""
+
+    __tablename__ = "parse_cache"
+    __table_args__ = (
+        UniqueConstraint(
+            "file_hash", "parser_version", name="uq_parse_cache_file_parser"
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    file_hash = Column(String(64), nullable=False)  # SHA-256 of file content
+    parser_version = Column(String(20), nullable=False)
+    taxonomy_version = Column(String(64), nullable=False)
+    data = Column(JSON)  # Extracted fields, without raw_text
+    raw_text = Column(CompressedText)  # Reused to refresh taxonomy fields
+    hit_count = Column(Integer, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+
+# Register audit log partitioning, the full-text search index, facet and
+# pipeline stats events
+from app.models import audit, facets, pipeline_stats, search  # noqa: E402,F401
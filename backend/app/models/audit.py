@@ -0,0 +1,194 @@
+"""Monthly partitioning of the audit log
+
+On PostgreSQL ``audit_logs`` is a table partitioned by range on ``timestamp``,
+with one partition per month (``audit_logs_2026_10``) and a default partition
+catching anything outside them. Partitions are created a few months ahead, and
+expired ones are detached and dropped whole by the archiver.
+
+SQLite has no table partitioning, so there a month is the range of the
+``ix_audit_logs_timestamp`` index between two month starts and the archiver
+deletes that range. SQLite also stores timestamps as text and compares them
+as strings, so they are kept in one format there (see
+``SQLITE_TIMESTAMP_DDL``).
+"""
+
+import re
+from datetime import datetime, timezone
+from typing import Iterator, Tuple
+
+from sqlalchemy import event, text
+
+from app.models import AuditLog
+
+# Months of partitions kept ready ahead of the current one
+PARTITION_MONTHS_AHEAD = 3
+
+PARTITION_NAME = re.compile(r"^audit_logs_(\d{4}_\d{2}|default|unpartitioned)$")
+
+POSTGRESQL_PARTITION_DDL = [
+    "ALTER TABLE audit_logs RENAME TO audit_logs_unpartitioned",
+    """
+    ALTER TABLE audit_logs_unpartitioned
+    RENAME CONSTRAINT audit_logs_pkey TO audit_logs_unpartitioned_pkey
+    """,
+    """
+    CREATE TABLE audit_logs (LIKE audit_logs_unpartitioned INCLUDING DEFAULTS)
+    PARTITION BY RANGE (timestamp)
+    """,
+    # The partition key has to be part of the primary key
+    "ALTER TABLE audit_logs ADD PRIMARY KEY (id, timestamp)",
+    "ALTER TABLE audit_logs ADD FOREIGN KEY (user_id) REFERENCES users (id)",
+]
+
+POSTGRESQL_PARTITION_FINISH = [
+    "CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT",
+    "INSERT INTO audit_logs SELECT * FROM audit_logs_unpartitioned",
+    "ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id",
+    "DROP TABLE audit_logs_unpartitioned",
+    "CREATE INDEX ix_audit_logs_id ON audit_logs (id)",
+    "CREATE INDEX ix_audit_logs_timestamp ON audit_logs (timestamp)",
+]
+
+POSTGRESQL_UNPARTITION_DDL = [
+    "ALTER TABLE audit_logs RENAME TO audit_logs_partitioned",
+    """
+    ALTER TABLE audit_logs_partitioned
+    RENAME CONSTRAINT audit_logs_pkey TO audit_logs_partitioned_pkey
+    """,
+    "CREATE TABLE audit_logs (LIKE audit_logs_partitioned INCLUDING DEFAULTS)",
+    "ALTER TABLE audit_logs ADD PRIMARY KEY (id)",
+    'ALTER TABLE audit_logs ALTER COLUMN "timestamp" DROP NOT NULL',
+    "ALTER TABLE audit_logs ADD FOREIGN KEY (user_id) REFERENCES users (id)",
+    "INSERT INTO audit_logs SELECT * FROM audit_logs_partitioned",
+    "ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id",
+    "DROP TABLE audit_logs_partitioned",
+    "CREATE INDEX ix_audit_logs_id ON audit_logs (id)",
+    "CREATE INDEX ix_audit_logs_timestamp ON audit_logs (timestamp)",
+]
+
+
+# SQLite's CURRENT_TIMESTAMP (the server default) writes 'YYYY-MM-DD HH:MM:SS',
+# while SQLAlchemy writes and binds 'YYYY-MM-DD HH:MM:SS.ffffff'. Compared as
+# strings, a short timestamp sorts before the bound value of the very same
+# moment, which breaks cursors and month ranges; pad short ones on insert.
+SQLITE_TIMESTAMP_DDL = [
+    """
+    CREATE TRIGGER IF NOT EXISTS audit_logs_timestamp_format
+    AFTER INSERT ON audit_logs
+    WHEN length(new.timestamp) = 19
+    BEGIN
+        UPDATE audit_logs SET timestamp = new.timestamp || '.000000'
+        WHERE id = new.id;
+    END
+    """,
+    """
+    UPDATE audit_logs SET timestamp = timestamp || '.000000'
+    WHERE length(timestamp) = 19
+    """,
+]
+
+
+def as_utc(moment: datetime) -> datetime:
+    """Timezone-aware UTC datetime; naive values (SQLite) are taken as UTC"""
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+def month_start(moment: datetime) -> datetime:
+    """First instant of the UTC month containing a moment"""
+    moment = as_utc(moment)
+    return datetime(moment.year, moment.month, 1, tzinfo=timezone.utc)
+
+
+def next_month(start: datetime) -> datetime:
+    """First instant of the month after a month start"""
+    if start.month == 12:
+        return start.replace(year=start.year + 1, month=1)
+    return start.replace(month=start.month + 1)
+
+
+def months_between(
+    start: datetime, end: datetime
+) -> Iterator[Tuple[datetime, datetime]]:
+    """(start, end) of every month overlapping [start, end)"""
+    current, end = month_start(start), as_utc(end)
+    while current < end:
+        following = next_month(current)
+        yield current, following
+        current = following
+
+
+def partition_name(start: datetime) -> str:
+    """Name of the partition (and archive) for a month"""
+    return f"audit_logs_{start:%Y_%m}"
+
+
+def ensure_audit_partitions(connection, now: datetime = None) -> None:
+    """Create the partitions for this month and the next few (PostgreSQL only)"""
+    if connection.dialect.name != "postgresql":
+        return
+    start = month_start(now or datetime.now(timezone.utc))
+    end = start
+    for _ in range(PARTITION_MONTHS_AHEAD + 1):
+        end = next_month(end)
+    _create_partitions(connection, start, end)
+
+
+def _create_partitions(connection, start: datetime, end: datetime) -> None:
+    for month, following in months_between(start, end):
+        connection.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {partition_name(month)} "
+                f"PARTITION OF audit_logs "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{following.isoformat()}')"
+            )
+        )
+
+
+def partition_audit_logs(connection) -> None:
+    """Turn a plain PostgreSQL audit_logs table into a partitioned one"""
+    if connection.dialect.name != "postgresql":
+        return
+    for statement in POSTGRESQL_PARTITION_DDL:
+        connection.execute(text(statement))
+
+    # Existing rows need their months in place before they are copied over,
+    # otherwise they land in the default partition
+    oldest = connection.execute(
+        text("SELECT min(timestamp) FROM audit_logs_unpartitioned")
+    ).scalar()
+    if oldest is not None:
+        _create_partitions(connection, oldest, datetime.now(timezone.utc))
+    ensure_audit_partitions(connection)
+
+    for statement in POSTGRESQL_PARTITION_FINISH:
+        connection.execute(text(statement))
+
+
+def unpartition_audit_logs(connection) -> None:
+    """Turn a partitioned PostgreSQL audit_logs table back into a plain one"""
+    if connection.dialect.name != "postgresql":
+        return
+    for statement in POSTGRESQL_UNPARTITION_DDL:
+        connection.execute(text(statement))
+
+
+def normalize_audit_timestamps(connection) -> None:
+    """Store every audit log timestamp in SQLAlchemy's format (SQLite only)"""
+    if connection.dialect.name != "sqlite":
+        return
+    for statement in SQLITE_TIMESTAMP_DDL:
+        connection.execute(text(statement))
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Alembic filter that leaves audit log partitions out of schema comparisons"""
+    return not (type_ == "table" and PARTITION_NAME.match(name))
+
+
+@event.listens_for(AuditLog.__table__, "after_create")
+def create_audit_partitions(target, connection, **kw):
+    """Partition a fresh audit_logs table, or fix its timestamp format on SQLite"""
+    partition_audit_logs(connection)
+    normalize_audit_timestamps(connection)
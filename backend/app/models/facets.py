@@ -0,0 +1,164 @@
+"""Candidate facets for filtering, with precomputed counts
+
+Every candidate has one ``candidate_tags`` row per facet value: each skill,
+each language, its parse status and its experience band. ``facet_counts``
+holds the number of candidates per value. Both are kept up to date by mapper
+events on candidate insert, update and delete, so facet counts can be read
+without touching the candidates table.
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, Set, Tuple
+
+from sqlalchemy import event, select, text
+from sqlalchemy.orm import attributes
+
+from app.models import Candidate, CandidateTag
+
+# Candidate attribute -> facet name
+FACET_FIELDS = {
+    "skills": "skill",
+    "languages": "language",
+    "parse_status": "status",
+    "years_of_experience": "experience",
+}
+
+# (upper bound in years, band label); the last band is open-ended
+EXPERIENCE_BANDS = [(2, "0-2"), (5, "2-5"), (10, "5-10"), (None, "10+")]
+
+ADJUST_FACET_COUNT = text("""
+    INSERT INTO facet_counts (facet, value, count) VALUES (:facet, :value, :delta)
+    ON CONFLICT (facet, value) DO UPDATE SET count = facet_counts.count + excluded.count
+    """)
+
+
+def experience_band(years) -> str:
+    """Experience band label for a number of years"""
+    years = years or 0
+    for upper, label in EXPERIENCE_BANDS:
+        if upper is None or years < upper:
+            return label
+
+
+def facet_values(field: str, value) -> Set[str]:
+    """Facet values contributed by one candidate attribute"""
+    if field in ("skills", "languages"):
+        return {item for item in value or [] if item}
+    if field == "years_of_experience":
+        return {experience_band(value)}
+    return {value} if value else set()
+
+
+def candidate_tags(fields: Dict) -> Set[Tuple[str, str]]:
+    """(facet, value) pairs for the given candidate attributes"""
+    return {
+        (FACET_FIELDS[field], item)
+        for field, value in fields.items()
+        for item in facet_values(field, value)
+    }
+
+
+def _apply(connection, candidate_id: int, removed: Iterable, added: Iterable):
+    tags = CandidateTag.__table__
+    removed, added = list(removed), list(added)
+
+    for facet, value in removed:
+        connection.execute(
+            tags.delete().where(
+                (tags.c.candidate_id == candidate_id)
+                & (tags.c.facet == facet)
+                & (tags.c.value == value)
+            )
+        )
+    if added:
+        connection.execute(
+            tags.insert(),
+            [
+                {"candidate_id": candidate_id, "facet": facet, "value": value}
+                for facet, value in added
+            ],
+        )
+
+    deltas = Counter(added)
+    deltas.subtract(Counter(removed))
+    _adjust_counts(connection, deltas)
+
+
+def _adjust_counts(connection, deltas: Counter):
+    changes = [
+        {"facet": facet, "value": value, "delta": delta}
+        for (facet, value), delta in deltas.items()
+        if delta
+    ]
+    if changes:
+        connection.execute(ADJUST_FACET_COUNT, changes)
+
+
+def _stored_tags(connection, candidate_id: int) -> Set[Tuple[str, str]]:
+    tags = CandidateTag.__table__
+    rows = connection.execute(
+        select(tags.c.facet, tags.c.value).where(tags.c.candidate_id == candidate_id)
+    )
+    return {(facet, value) for facet, value in rows}
+
+
+@event.listens_for(Candidate, "after_insert")
+def add_candidate_facets(mapper, connection, target):
+    """Tag a new candidate and count its facet values"""
+    fields = {field: getattr(target, field) for field in FACET_FIELDS}
+    _apply(connection, target.id, [], candidate_tags(fields))
+
+
+@event.listens_for(Candidate, "after_update")
+def update_candidate_facets(mapper, connection, target):
+    """Re-tag a candidate whose faceted attributes changed"""
+    state = attributes.instance_state(target)
+    changed = {
+        field: state.dict.get(field)
+        for field in FACET_FIELDS
+        if state.attrs[field].history.has_changes()
+    }
+    if not changed:
+        return
+
+    facets = {FACET_FIELDS[field] for field in changed}
+    old = {tag for tag in _stored_tags(connection, target.id) if tag[0] in facets}
+    new = candidate_tags(changed)
+    _apply(connection, target.id, old - new, new - old)
+
+
+@event.listens_for(Candidate, "before_delete")
+def remove_candidate_facets(mapper, connection, target):
+    """Drop a deleted candidate's tags and uncount its facet values"""
+    _apply(connection, target.id, _stored_tags(connection, target.id), [])
+
+
+def rebuild_facets(connection, batch_size: int = 500) -> None:
+    """Recompute candidate_tags and facet_counts from the candidates table"""
+    candidates = Candidate.__table__
+    connection.execute(CandidateTag.__table__.delete())
+    connection.execute(text("DELETE FROM facet_counts"))
+
+    columns = [candidates.c[field] for field in FACET_FIELDS]
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            select(candidates.c.id, *columns)
+            .where(candidates.c.id > last_id)
+            .order_by(candidates.c.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return
+
+        tags, deltas = [], Counter()
+        for row in rows:
+            for facet, value in candidate_tags(
+                {field: row._mapping[field] for field in FACET_FIELDS}
+            ):
+                tags.append({"candidate_id": row.id, "facet": facet, "value": value})
+                deltas[(facet, value)] += 1
+        if tags:
+            connection.execute(CandidateTag.__table__.insert(), tags)
+        _adjust_counts(connection, deltas)
+        last_id = rows[-1].id
@@ -0,0 +1,250 @@
+"""Materialized pipeline statistics
+
+``pipeline_summary`` holds a single row of candidate counts (total, parsed,
+failed) and job counts (total, active); ``job_score_stats`` holds, per job,
+the number of candidate scores and the number and sum of non-null total
+scores, as COUNT(id) and AVG(total_score) would count them. Both are kept up
+to date by mapper events on candidates, jobs and candidate scores, so the
+pipeline report reads them instead of counting the underlying tables.
+"""
+
+from collections import Counter
+
+from sqlalchemy import event, func, select, text
+from sqlalchemy.orm import attributes
+
+from app.models import Candidate, CandidateScore, Job, JobScoreStats, PipelineSummary
+
+SUMMARY_ID = 1
+
+# Candidate parse status -> pipeline_summary column
+PARSE_STATUS_COLUMNS = {"success": "candidates_parsed", "failed": "candidates_failed"}
+
+SUMMARY_COLUMNS = [
+    "candidates",
+    "candidates_parsed",
+    "candidates_failed",
+    "jobs",
+    "jobs_active",
+]
+
+ADJUST_SUMMARY = text("""
+    INSERT INTO pipeline_summary
+        (id, candidates, candidates_parsed, candidates_failed, jobs, jobs_active)
+    VALUES
+        (:id, :candidates, :candidates_parsed, :candidates_failed, :jobs, :jobs_active)
+    ON CONFLICT (id) DO UPDATE SET
+        candidates = pipeline_summary.candidates + excluded.candidates,
+        candidates_parsed =
+            pipeline_summary.candidates_parsed + excluded.candidates_parsed,
+        candidates_failed =
+            pipeline_summary.candidates_failed + excluded.candidates_failed,
+        jobs = pipeline_summary.jobs + excluded.jobs,
+        jobs_active = pipeline_summary.jobs_active + excluded.jobs_active
+    """)
+
+ADJUST_JOB_SCORES = text("""
+    INSERT INTO job_score_stats (job_id, ranked, scored, score_total)
+    VALUES (:job_id, :ranked, :scored, :score_total)
+    ON CONFLICT (job_id) DO UPDATE SET
+        ranked = job_score_stats.ranked + excluded.ranked,
+        scored = job_score_stats.scored + excluded.scored,
+        score_total = job_score_stats.score_total + excluded.score_total
+    """)
+
+
+def candidate_counts(parse_status) -> Counter:
+    """Summary counts contributed by one candidate"""
+    counts = Counter(candidates=1)
+    if parse_status in PARSE_STATUS_COLUMNS:
+        counts[PARSE_STATUS_COLUMNS[parse_status]] += 1
+    return counts
+
+
+def job_counts(status) -> Counter:
+    """Summary counts contributed by one job"""
+    return Counter(jobs=1, jobs_active=int(status == "active"))
+
+
+def _adjust_summary(connection, added: Counter, removed: Counter = None):
+    deltas = Counter(added)
+    deltas.subtract(removed or Counter())
+    if any(deltas.values()):
+        params = {column: deltas[column] for column in SUMMARY_COLUMNS}
+        connection.execute(ADJUST_SUMMARY, {"id": SUMMARY_ID, **params})
+
+
+def score_counts(total_score) -> Counter:
+    """Job score aggregates contributed by one candidate score"""
+    if total_score is None:
+        return Counter(ranked=1)
+    return Counter(ranked=1, scored=1, score_total=total_score)
+
+
+def _adjust_job_scores(
+    connection, job_id: int, added: Counter, removed: Counter = None
+):
+    deltas = Counter(added)
+    deltas.subtract(removed or Counter())
+    connection.execute(
+        ADJUST_JOB_SCORES,
+        {
+            "job_id": job_id,
+            "ranked": deltas["ranked"],
+            "scored": deltas["scored"],
+            "score_total": float(deltas["score_total"]),
+        },
+    )
+
+
+def _changed(target, field: str) -> bool:
+    return attributes.instance_state(target).attrs[field].history.has_changes()
+
+
+def _stored(connection, model, target, *fields):
+    """Row of ``fields`` as stored, before a pending update or delete"""
+    table = model.__table__
+    return connection.execute(
+        select(*(table.c[field] for field in fields)).where(table.c.id == target.id)
+    ).first()
+
+
+@event.listens_for(Candidate, "after_insert")
+def count_new_candidate(mapper, connection, target):
+    """Count a new candidate and its parse status"""
+    _adjust_summary(connection, candidate_counts(target.parse_status))
+
+
+@event.listens_for(Candidate, "before_update")
+def recount_candidate_status(mapper, connection, target):
+    """Move a candidate whose parse status changed between counts"""
+    if not _changed(target, "parse_status"):
+        return
+
+    old = _stored(connection, Candidate, target, "parse_status")
+    _adjust_summary(
+        connection,
+        candidate_counts(target.parse_status),
+        candidate_counts(old.parse_status),
+    )
+
+
+@event.listens_for(Candidate, "before_delete")
+def uncount_candidate(mapper, connection, target):
+    """Uncount a deleted candidate"""
+    old = _stored(connection, Candidate, target, "parse_status")
+    _adjust_summary(connection, Counter(), candidate_counts(old.parse_status))
+
+
+@event.listens_for(Job, "after_insert")
+def count_new_job(mapper, connection, target):
+    """Count a new job and whether it is active"""
+    _adjust_summary(connection, job_counts(target.status))
+
+
+@event.listens_for(Job, "before_update")
+def recount_job_status(mapper, connection, target):
+    """Recount active jobs when a job's status changed"""
+    if not _changed(target, "status"):
+        return
+
+    old = _stored(connection, Job, target, "status")
+    _adjust_summary(connection, job_counts(target.status), job_counts(old.status))
+
+
+@event.listens_for(Job, "before_delete")
+def uncount_job(mapper, connection, target):
+    """Uncount a deleted job and drop its score stats"""
+    old = _stored(connection, Job, target, "status")
+    _adjust_summary(connection, Counter(), job_counts(old.status))
+    reset_job_scores(connection, target.id)
+
+
+@event.listens_for(CandidateScore, "after_insert")
+def add_job_score(mapper, connection, target):
+    """Add a new ranking score to its job's aggregates"""
+    _adjust_job_scores(connection, target.job_id, score_counts(target.total_score))
+
+
+@event.listens_for(CandidateScore, "before_update")
+def update_job_score(mapper, connection, target):
+    """Apply a changed total score to its job's aggregates"""
+    if not _changed(target, "total_score"):
+        return
+
+    old = _stored(connection, CandidateScore, target, "total_score")
+    _adjust_job_scores(
+        connection,
+        target.job_id,
+        score_counts(target.total_score),
+        score_counts(old.total_score),
+    )
+
+
+@event.listens_for(CandidateScore, "before_delete")
+def remove_job_score(mapper, connection, target):
+    """Remove a deleted score, e.g. of a deleted candidate, from its job"""
+    old = _stored(connection, CandidateScore, target, "job_id", "total_score")
+    _adjust_job_scores(connection, old.job_id, Counter(), score_counts(old.total_score))
+
+
+def reset_job_scores(connection, job_id: int) -> None:
+    """
+    Drop a job's score aggregates, alongside a bulk delete of its scores
+
+    Query-level deletes bypass the mapper events, so re-ranking calls this
+    after clearing a job's previous scores.
+    """
+    connection.execute(
+        JobScoreStats.__table__.delete().where(JobScoreStats.job_id == job_id)
+    )
+
+
+def rebuild_pipeline_stats(connection) -> None:
+    """Recompute pipeline_summary and job_score_stats from the source tables"""
+    candidates, jobs = Candidate.__table__, Job.__table__
+    scores = CandidateScore.__table__
+    connection.execute(JobScoreStats.__table__.delete())
+    connection.execute(PipelineSummary.__table__.delete())
+
+    summary = {"id": SUMMARY_ID}
+    summary.update(
+        connection.execute(
+            select(
+                func.count().label("candidates"),
+                *(
+                    func.count()
+                    .filter(candidates.c.parse_status == status)
+                    .label(column)
+                    for status, column in PARSE_STATUS_COLUMNS.items()
+                ),
+            ).select_from(candidates)
+        )
+        .one()
+        ._mapping
+    )
+    summary.update(
+        connection.execute(
+            select(
+                func.count().label("jobs"),
+                func.count().filter(jobs.c.status == "active").label("jobs_active"),
+            ).select_from(jobs)
+        )
+        .one()
+        ._mapping
+    )
+    connection.execute(PipelineSummary.__table__.insert(), summary)
+
+    connection.execute(
+        JobScoreStats.__table__.insert().from_select(
+            ["job_id", "ranked", "scored", "score_total"],
+            select(
+                scores.c.job_id,
+                func.count(),
+                func.count(scores.c.total_score),
+                func.coalesce(func.sum(scores.c.total_score), 0.0),
+            )
+            .join(jobs, jobs.c.id == scores.c.job_id)
+            .group_by(scores.c.job_id),
+        )
+    )
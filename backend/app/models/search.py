@@ -0,0 +1,190 @@
+"""Full-text search index over candidates
+
+SQLite uses an FTS5 external-content table kept in sync by triggers. Its
+content is read through a view that decompresses ``raw_text`` with the
+``decompress_text()`` SQL function registered on every SQLite connection.
+
+PostgreSQL cannot decompress ``raw_text`` server-side, so a ``search_vector``
+tsvector column (with a GIN index) is filled in by mapper events whenever a
+candidate's name, skills or CV text change.
+"""
+
+from sqlalchemy import DDL, event, select, text
+from sqlalchemy.orm import attributes
+
+from app.models import Candidate
+
+# Columns in the index, weighted in that order when ranking
+SEARCH_FIELDS = ("name", "skills", "raw_text")
+
+SQLITE_SEARCH_DDL = [
+    """
+    CREATE VIEW IF NOT EXISTS candidates_search_content AS
+    SELECT id, name, skills, decompress_text(raw_text) AS raw_text FROM candidates
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS candidates_fts USING fts5(
+        name, skills, raw_text,
+        content='candidates_search_content',
+        content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS candidates_fts_insert AFTER INSERT ON candidates
+    BEGIN
+        INSERT INTO candidates_fts(rowid, name, skills, raw_text)
+        VALUES (new.id, new.name, new.skills, decompress_text(new.raw_text));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS candidates_fts_delete AFTER DELETE ON candidates
+    BEGIN
+        INSERT INTO candidates_fts(candidates_fts, rowid, name, skills, raw_text)
+        VALUES ('delete', old.id, old.name, old.skills, decompress_text(old.raw_text));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS candidates_fts_update
+    AFTER UPDATE OF name, skills, raw_text ON candidates
+    BEGIN
+        INSERT INTO candidates_fts(candidates_fts, rowid, name, skills, raw_text)
+        VALUES ('delete', old.id, old.name, old.skills, decompress_text(old.raw_text));
+        INSERT INTO candidates_fts(rowid, name, skills, raw_text)
+        VALUES (new.id, new.name, new.skills, decompress_text(new.raw_text));
+    END
+    """,
+]
+
+SQLITE_SEARCH_DROP = [
+    "DROP TRIGGER IF EXISTS candidates_fts_update",
+    "DROP TRIGGER IF EXISTS candidates_fts_delete",
+    "DROP TRIGGER IF EXISTS candidates_fts_insert",
+    "DROP TABLE IF EXISTS candidates_fts",
+    "DROP VIEW IF EXISTS candidates_search_content",
+]
+
+POSTGRESQL_SEARCH_DDL = [
+    "ALTER TABLE candidates ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    """
+    CREATE INDEX IF NOT EXISTS ix_candidates_search_vector
+    ON candidates USING gin (search_vector)
+    """,
+]
+
+POSTGRESQL_SEARCH_DROP = [
+    "DROP INDEX IF EXISTS ix_candidates_search_vector",
+    "ALTER TABLE candidates DROP COLUMN IF EXISTS search_vector",
+]
+
+# Schema objects managed here rather than by the models, hidden from autogenerate
+SEARCH_SCHEMA_OBJECTS = {
+    "candidates_fts",
+    "candidates_fts_config",
+    "candidates_fts_data",
+    "candidates_fts_docsize",
+    "candidates_fts_idx",
+    "search_vector",
+    "ix_candidates_search_vector",
+}
+
+UPDATE_SEARCH_VECTOR = text("""
+    UPDATE candidates SET search_vector =
+        setweight(to_tsvector('english', coalesce(:name, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(:skills, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(:raw_text, '')), 'C')
+    WHERE id = :id
+    """)
+
+
+def rebuild_search_index(connection, batch_size: int = 500) -> None:
+    """Re-index every candidate, e.g. after creating the index on existing data"""
+    if connection.dialect.name == "sqlite":
+        connection.execute(
+            text("INSERT INTO candidates_fts(candidates_fts) VALUES ('rebuild')")
+        )
+        return
+    if connection.dialect.name != "postgresql":
+        return
+
+    candidates = Candidate.__table__
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            select(
+                candidates.c.id,
+                candidates.c.name,
+                candidates.c.skills,
+                candidates.c.raw_text,
+            )
+            .where(candidates.c.id > last_id)
+            .order_by(candidates.c.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return
+        connection.execute(
+            UPDATE_SEARCH_VECTOR,
+            [
+                _search_document(row.id, row.name, row.skills, row.raw_text)
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+
+def _search_document(candidate_id, name, skills, raw_text):
+    return {
+        "id": candidate_id,
+        "name": name,
+        "skills": " ".join(skills or []),
+        "raw_text": raw_text,
+    }
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Alembic filter that leaves the search index out of schema comparisons"""
+    return name not in SEARCH_SCHEMA_OBJECTS
+
+
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(
+        Candidate.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite")
+    )
+for statement in SQLITE_SEARCH_DROP:
+    event.listen(
+        Candidate.__table__, "before_drop", DDL(statement).execute_if(dialect="sqlite")
+    )
+for statement in POSTGRESQL_SEARCH_DDL:
+    event.listen(
+        Candidate.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="postgresql"),
+    )
+
+
+@event.listens_for(Candidate, "after_insert")
+@event.listens_for(Candidate, "after_update")
+def update_search_vector(mapper, connection, target):
+    """Refresh a candidate's tsvector on PostgreSQL when indexed fields change"""
+    if connection.dialect.name != "postgresql":
+        return
+
+    state = attributes.instance_state(target)
+    if not any(state.attrs[field].history.has_changes() for field in SEARCH_FIELDS):
+        return
+
+    if "raw_text" in state.dict:
+        raw_text = target.raw_text
+    else:
+        # Deferred and not loaded; read it without touching the session mid-flush
+        raw_text = connection.scalar(
+            select(Candidate.__table__.c.raw_text).where(
+                Candidate.__table__.c.id == target.id
+            )
+        )
+
+    connection.execute(
+        UPDATE_SEARCH_VECTOR,
+        _search_document(target.id, target.name, target.skills, raw_text),
+    )
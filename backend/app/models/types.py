@@ -0,0 +1,41 @@
+"""Custom column types"""
+
+from sqlalchemy.types import LargeBinary, TypeDecorator
+
+from app.utils.compression import compress_text, decompress_text
+
+
+class _Blob(LargeBinary):
+    """LargeBinary that passes through legacy TEXT values instead of failing"""
+
+    def result_processor(self, dialect, coltype):
+        def process(value):
+            if value is None or isinstance(value, str):
+                return value
+            return bytes(value)
+
+        return process
+
+
+class CompressedText(TypeDecorator):
+    """
+    Text column stored compressed (zstd when installed, otherwise zlib).
+
+    Values are compressed on write and decompressed when loaded, so ORM code
+    keeps seeing plain strings. Rows written before compression was enabled
+    are still returned as-is until ``scripts/compress_raw_text.py`` rewrites
+    them.
+    """
+
+    impl = _Blob
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return compress_text(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, str):
+            return value
+        return decompress_text(value)
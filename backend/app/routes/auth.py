@@ -3,27 +3,36 @@
 from datetime import timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.config import settings
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.models import User
 from app.schemas import LoginRequest, Token, UserCreate, UserResponse
 from app.services.audit_service import AuditService
+from app.services.password_pool import PasswordPoolBusy
 from app.utils.auth import (
     authenticate_user,
     create_access_token,
     get_current_admin_user,
-    get_password_hash,
+    get_password_hash_async,
 )
 
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 
 
 @router.post("/login", response_model=Token)
-async def login(request: LoginRequest, db: Session = Depends(get_db)):
+async def login(request: LoginRequest, db: AsyncSession = Depends(get_async_db)):
     """Authenticate user and return JWT token"""
-    user = authenticate_user(db, request.email, request.password)
+    try:
+        user = await authenticate_user(db, request.email, request.password)
+    except PasswordPoolBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many logins in progress, please retry",
+            headers={"Retry-After": "1"},
+        )
 
     if not user:
         raise HTTPException(
@@ -38,7 +47,7 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
     )
 
     # Log the action
-    AuditService.log_action(
+    await AuditService.log_action_async(
         db=db, action="user_login", user_id=user.id, details={"email": user.email}
     )
 
@@ -59,12 +68,21 @@ async def register(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered"
         )
 
+    try:
+        hashed_password = await get_password_hash_async(user_data.password)
+    except PasswordPoolBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many password operations in progress, please retry",
+            headers={"Retry-After": "1"},
+        )
+
     # Create new user
     new_user = User(
         email=user_data.email,
         full_name=user_data.full_name,
         role=user_data.role,
-        hashed_password=get_password_hash(user_data.password),
+        hashed_password=hashed_password,
     )
 
     db.add(new_user)
@@ -1,116 +1,79 @@
 """Candidate management routes"""
 
-import os
+import json
 import shutil
-from typing import List
-
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+import tempfile
+import zipfile
+from typing import List, Optional
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.config import settings
-from app.database import get_db
-from app.models import Candidate, User
-from app.schemas import CandidateResponse, CandidateUpdate, UploadResponse
+from app.database import get_async_db, get_async_read_db, get_db
+from app.models import Candidate, CandidateTag, FacetCount, User
+from app.models.facets import EXPERIENCE_BANDS, FACET_FIELDS
+from app.schemas import (
+    CandidateFacets,
+    CandidateResponse,
+    CandidateSearchResult,
+    CandidateUpdate,
+    UploadResponse,
+)
 from app.services.audit_service import AuditService
+from app.services.ingest_service import (
+    ingest_archive,
+    ingest_file,
+    list_archive_members,
+)
+from app.services.parse_cache_service import ParseCacheService
+from app.services.parser_pool import get_parser
+from app.services.search_service import SEARCH_WINDOWED_HEADER, SearchService
+from app.services.storage_service import CHUNK_SIZE, StorageService
 from app.utils.auth import get_current_user
-from app.utils.cv_parser import CVParser
+from app.utils.pagination import NEXT_CURSOR_HEADER, paginate, set_next_cursor
 
 router = APIRouter(prefix="/api/candidates", tags=["Candidates"])
 
+# Sort key for candidate listings
+CANDIDATE_ORDER = (Candidate.id,)
+
 
 @router.post("/upload", response_model=List[UploadResponse])
-async def upload_cvs(
+def upload_cvs(
     files: List[UploadFile] = File(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Upload and parse CV files"""
-    parser = CVParser()
+    parse_cache = ParseCacheService(db, get_parser())
+    storage = StorageService()
     results = []
 
     for file in files:
         try:
-            # Validate file type
-            file_ext = file.filename.split(".")[-1].lower()
-            if file_ext not in ["pdf", "docx", "txt"]:
-                results.append(
-                    {
-                        "filename": file.filename,
-                        "status": "error",
-                        "error": "Unsupported file type",
-                    }
-                )
-                continue
-
-            # Save file
-            file_path = os.path.join(settings.storage_path, "cvs", file.filename)
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-
-            # Parse CV
-            parse_result = parser.parse_file(file_path, file_ext)
-
-            if parse_result["success"]:
-                # Create candidate record
-                candidate_data = parse_result["data"]
-                candidate = Candidate(
-                    name=candidate_data["name"],
-                    email=candidate_data["email"],
-                    phone=candidate_data["phone"],
-                    education=candidate_data["education"],
-                    years_of_experience=candidate_data["years_of_experience"],
-                    skills=candidate_data["skills"],
-                    languages=candidate_data["languages"],
-                    raw_text=candidate_data["raw_text"],
-                    file_path=file_path,
-                    file_name=file.filename,
-                    file_type=file_ext,
-                    parse_status="success",
-                )
-
-                db.add(candidate)
-                db.commit()
-                db.refresh(candidate)
-
-                # Log action
-                AuditService.log_action(
-                    db=db,
-                    action="cv_uploaded",
-                    user_id=current_user.id,
-                    entity_type="candidate",
-                    entity_id=candidate.id,
-                    details={"filename": file.filename},
-                )
-
-                results.append(
-                    {
-                        "filename": file.filename,
-                        "status": "success",
-                        "candidate_id": candidate.id,
-                    }
-                )
-            else:
-                # Create candidate with failed status
-                candidate = Candidate(
-                    name="Parse Failed",
-                    file_path=file_path,
-                    file_name=file.filename,
-                    file_type=file_ext,
-                    parse_status="failed",
-                    parse_error=parse_result["error"],
-                )
-
-                db.add(candidate)
-                db.commit()
-
-                results.append(
-                    {
-                        "filename": file.filename,
-                        "status": "failed",
-                        "error": parse_result["error"],
-                    }
+            results.append(
+                ingest_file(
+                    db,
+                    file.file,
+                    file.filename,
+                    current_user.id,
+                    storage,
+                    parse_cache,
                 )
-
+            )
         except Exception as e:
             results.append(
                 {"filename": file.filename, "status": "error", "error": str(e)}
@@ -119,26 +82,185 @@ async def upload_cvs(
     return results
 
 
+@router.post("/upload-archive")
+async def upload_archive(
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Upload a ZIP archive of CV files
+
+    Members are extracted one by one into storage and parsed. Results are
+    streamed back as NDJSON, one UploadResponse object per line, as each
+    member completes.
+    """
+    # The upload is closed when this handler returns, before the response
+    # streams, so spool it into a temp file the stream owns
+    archive_file = tempfile.TemporaryFile()
+    await run_in_threadpool(shutil.copyfileobj, file.file, archive_file, CHUNK_SIZE)
+
+    try:
+        archive = zipfile.ZipFile(archive_file)
+        members = list_archive_members(archive)
+    except (zipfile.BadZipFile, ValueError) as e:
+        archive_file.close()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid archive: {e}",
+        )
+
+    # The request session is closed before streaming too
+    session = Session(bind=db.get_bind())
+    archive_name, user_id = file.filename, current_user.id
+
+    def stream_results():
+        try:
+            for result in ingest_archive(
+                session, archive, members, archive_name, user_id
+            ):
+                yield json.dumps(UploadResponse(**result).model_dump()) + "\n"
+        finally:
+            session.close()
+            archive.close()
+            archive_file.close()
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+
 @router.get("", response_model=List[CandidateResponse])
 async def get_candidates(
+    response: Response,
+    cursor: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get all candidates"""
-    candidates = db.query(Candidate).offset(skip).limit(limit).all()
+    """Get all candidates, paged with the X-Next-Cursor response header"""
+    result = await db.execute(
+        paginate(select(Candidate), CANDIDATE_ORDER, cursor, skip, limit)
+    )
+    candidates = result.scalars().all()
+    set_next_cursor(response, candidates, CANDIDATE_ORDER, limit)
     return candidates
 
 
+@router.get("/search", response_model=List[CandidateSearchResult])
+async def search_candidates(
+    q: str,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = 20,
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Search candidates by name, skills and CV text, most relevant first
+
+    Each result carries a relevance score and an HTML-escaped snippet of the
+    CV with the matched words wrapped in <mark> tags. Paged with the X-Next-Cursor header;
+    X-Search-Windowed is set when older matches were left unranked.
+    """
+
+    def search(session):
+        service = SearchService(session)
+        return service.search(q, cursor, limit), service.windowed
+
+    (results, next_cursor), windowed = await db.run_sync(search)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    if windowed:
+        # Only the newest SEARCH_RANK_WINDOW matches were ranked
+        response.headers[SEARCH_WINDOWED_HEADER] = "true"
+    return results
+
+
+def _tagged(facet: str, values: List[str]):
+    """Candidates tagged with any of ``values`` for ``facet``"""
+    return Candidate.id.in_(
+        select(CandidateTag.candidate_id).where(
+            CandidateTag.facet == facet, CandidateTag.value.in_(values)
+        )
+    )
+
+
+@router.get("/filter", response_model=List[CandidateResponse])
+async def filter_candidates(
+    response: Response,
+    skills: List[str] = Query([]),
+    skills_mode: str = Query("all", pattern="^(all|any)$"),
+    languages: List[str] = Query([]),
+    min_experience: Optional[float] = None,
+    max_experience: Optional[float] = None,
+    parse_status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Filter candidates by skills, languages, experience and parse status
+
+    With skills_mode "all" a candidate needs every listed skill, with "any" at
+    least one. Candidates must speak every listed language. Paged with the
+    X-Next-Cursor response header.
+    """
+    conditions = []
+    if skills and skills_mode == "any":
+        conditions.append(_tagged("skill", skills))
+    else:
+        conditions.extend(_tagged("skill", [skill]) for skill in skills)
+    conditions.extend(_tagged("language", [language]) for language in languages)
+    if min_experience is not None:
+        conditions.append(Candidate.years_of_experience >= min_experience)
+    if max_experience is not None:
+        conditions.append(Candidate.years_of_experience <= max_experience)
+    if parse_status:
+        conditions.append(Candidate.parse_status == parse_status)
+
+    query = select(Candidate).where(*conditions) if conditions else select(Candidate)
+    result = await db.execute(paginate(query, CANDIDATE_ORDER, cursor, 0, limit))
+    candidates = result.scalars().all()
+    set_next_cursor(response, candidates, CANDIDATE_ORDER, limit)
+    return candidates
+
+
+@router.get("/facets", response_model=CandidateFacets)
+async def get_candidate_facets(
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Number of candidates per skill, language, experience band and status"""
+    result = await db.execute(
+        select(FacetCount)
+        .where(FacetCount.count > 0)
+        .order_by(FacetCount.count.desc(), FacetCount.value)
+    )
+    facets = {field: [] for field in FACET_FIELDS}
+    fields = {facet: field for field, facet in FACET_FIELDS.items()}
+    for row in result.scalars():
+        facets[fields[row.facet]].append({"value": row.value, "count": row.count})
+
+    band_order = [label for _, label in EXPERIENCE_BANDS]
+    facets["years_of_experience"].sort(key=lambda item: band_order.index(item["value"]))
+
+    return CandidateFacets(
+        skills=facets["skills"],
+        languages=facets["languages"],
+        experience=facets["years_of_experience"],
+        parse_status=facets["parse_status"],
+    )
+
+
 @router.get("/{candidate_id}", response_model=CandidateResponse)
 async def get_candidate(
     candidate_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get a specific candidate"""
-    candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+    candidate = await db.get(Candidate, candidate_id)
 
     if not candidate:
         raise HTTPException(
@@ -152,11 +274,11 @@ async def get_candidate(
 async def update_candidate(
     candidate_id: int,
     candidate_data: CandidateUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """Update candidate information"""
-    candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+    candidate = await db.get(Candidate, candidate_id)
 
     if not candidate:
         raise HTTPException(
@@ -168,11 +290,11 @@ async def update_candidate(
     for field, value in update_data.items():
         setattr(candidate, field, value)
 
-    db.commit()
-    db.refresh(candidate)
+    await db.commit()
+    await db.refresh(candidate)
 
     # Log action
-    AuditService.log_action(
+    await AuditService.log_action_async(
         db=db,
         action="candidate_updated",
         user_id=current_user.id,
@@ -186,26 +308,29 @@ async def update_candidate(
 @router.delete("/{candidate_id}")
 async def delete_candidate(
     candidate_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """Delete a candidate"""
-    candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+    candidate = await db.get(Candidate, candidate_id)
 
     if not candidate:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Candidate not found"
         )
 
-    # Delete file if exists
-    if candidate.file_path and os.path.exists(candidate.file_path):
-        os.remove(candidate.file_path)
+    file_hash, file_path = candidate.file_hash, candidate.file_path
+
+    await db.delete(candidate)
+    await db.commit()
 
-    db.delete(candidate)
-    db.commit()
+    # Delete file once no other candidate references it
+    await db.run_sync(
+        lambda session: StorageService().release(session, file_hash, file_path)
+    )
 
     # Log action
-    AuditService.log_action(
+    await AuditService.log_action_async(
         db=db,
         action="candidate_deleted",
         user_id=current_user.id,
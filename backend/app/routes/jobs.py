@@ -1,23 +1,28 @@
 """Job position management routes"""
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_async_db, get_async_read_db
 from app.models import Job, User
 from app.schemas import JobCreate, JobResponse, JobUpdate
 from app.services.audit_service import AuditService
 from app.utils.auth import get_current_user
+from app.utils.pagination import paginate, set_next_cursor
 
 router = APIRouter(prefix="/api/jobs", tags=["Jobs"])
 
+# Sort key for job listings
+JOB_ORDER = (Job.id,)
+
 
 @router.post("", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
 async def create_job(
     job_data: JobCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """Create a new job position"""
@@ -33,11 +38,11 @@ async def create_job(
     )
 
     db.add(job)
-    db.commit()
-    db.refresh(job)
+    await db.commit()
+    await db.refresh(job)
 
     # Log action
-    AuditService.log_action(
+    await AuditService.log_action_async(
         db=db,
         action="job_created",
         user_id=current_user.id,
@@ -51,24 +56,28 @@ async def create_job(
 
 @router.get("", response_model=List[JobResponse])
 async def get_jobs(
+    response: Response,
+    cursor: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get all job positions"""
-    jobs = db.query(Job).offset(skip).limit(limit).all()
+    """Get all job positions, paged with the X-Next-Cursor response header"""
+    result = await db.execute(paginate(select(Job), JOB_ORDER, cursor, skip, limit))
+    jobs = result.scalars().all()
+    set_next_cursor(response, jobs, JOB_ORDER, limit)
     return jobs
 
 
 @router.get("/{job_id}", response_model=JobResponse)
 async def get_job(
     job_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get a specific job position"""
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = await db.get(Job, job_id)
 
     if not job:
         raise HTTPException(
@@ -82,11 +91,11 @@ async def get_job(
 async def update_job(
     job_id: int,
     job_data: JobUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """Update a job position"""
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = await db.get(Job, job_id)
 
     if not job:
         raise HTTPException(
@@ -98,11 +107,11 @@ async def update_job(
     for field, value in update_data.items():
         setattr(job, field, value)
 
-    db.commit()
-    db.refresh(job)
+    await db.commit()
+    await db.refresh(job)
 
     # Log action
-    AuditService.log_action(
+    await AuditService.log_action_async(
         db=db,
         action="job_updated",
         user_id=current_user.id,
@@ -116,22 +125,22 @@ async def update_job(
 @router.delete("/{job_id}")
 async def delete_job(
     job_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """Delete a job position"""
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = await db.get(Job, job_id)
 
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
         )
 
-    db.delete(job)
-    db.commit()
+    await db.delete(job)
+    await db.commit()
 
     # Log action
-    AuditService.log_action(
+    await AuditService.log_action_async(
         db=db,
         action="job_deleted",
         user_id=current_user.id,
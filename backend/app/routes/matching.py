@@ -3,9 +3,11 @@
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
-from app.database import get_db
+from app.database import get_async_read_db, get_db
 from app.models import CandidateScore, Job, User
 from app.schemas import CandidateScoreResponse, RankingRequest, RankingResponse
 from app.services.audit_service import AuditService
@@ -16,7 +18,7 @@ router = APIRouter(prefix="/api/matching", tags=["Matching & Ranking"])
 
 
 @router.post("/rank", response_model=RankingResponse)
-async def rank_candidates(
+def rank_candidates(
     request: RankingRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -61,23 +63,23 @@ async def rank_candidates(
 @router.get("/results/{job_id}", response_model=List[CandidateScoreResponse])
 async def get_ranking_results(
     job_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get ranking results for a job"""
     # Verify job exists
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = await db.get(Job, job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
         )
 
     # Get scores ordered by rank
-    scores = (
-        db.query(CandidateScore)
+    result = await db.execute(
+        select(CandidateScore)
+        .options(selectinload(CandidateScore.candidate))
         .filter(CandidateScore.job_id == job_id)
         .order_by(CandidateScore.rank)
-        .all()
     )
 
-    return scores
+    return result.scalars().all()
@@ -1,68 +1,119 @@
 """Reports and analytics routes"""
 
-from collections import Counter
-from typing import List
+import json
+from datetime import datetime
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select, union
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
-from app.models import AuditLog, Candidate, CandidateScore, Job, User
+from app.database import get_async_read_db, get_read_db
+from app.models import (
+    AuditLog,
+    Candidate,
+    CandidateTag,
+    FacetCount,
+    Job,
+    JobScoreStats,
+    PipelineSummary,
+    User,
+)
+from app.models.audit import as_utc
+from app.models.pipeline_stats import SUMMARY_ID
 from app.schemas import (
     AuditLogResponse,
+    AuthStats,
+    CacheStats,
     PipelineStats,
     SkillFrequency,
     SkillsFrequencyReport,
 )
+from app.services.audit_archive_service import AuditArchiveService
+from app.services.audit_export_service import AuditExportService
+from app.services.parse_cache_service import ParseCacheService
+from app.services.password_pool import get_password_pool
+from app.services.token_cache_service import TokenCacheService
+from app.services.user_cache_service import UserCacheService
 from app.utils.auth import get_current_admin_user, get_current_user
+from app.utils.pagination import paginate, set_next_cursor
 
 router = APIRouter(prefix="/api/reports", tags=["Reports"])
 
+# Audit logs are listed newest first; id breaks ties between equal timestamps
+AUDIT_LOG_ORDER = (AuditLog.timestamp, AuditLog.id)
+
+
+def top_skills_query(limit: int):
+    """
+    Most common skills among successfully parsed candidates, with counts
+
+    Aggregated in the database, so only ``limit`` rows reach Python: the
+    maintained facet_counts of every skill, minus the skills of candidates
+    not parsed successfully (usually a small minority).
+    """
+    # Candidates without a success status tag; a NULL status has no tag at all
+    unsuccessful = union(
+        select(CandidateTag.candidate_id)
+        .filter(CandidateTag.facet == "status")
+        .filter(CandidateTag.value != "success"),
+        select(Candidate.id).filter(Candidate.parse_status.is_(None)),
+    )
+    excluded = (
+        select(CandidateTag.value, func.count().label("count"))
+        .filter(CandidateTag.candidate_id.in_(unsuccessful))
+        .filter(CandidateTag.facet == "skill")
+        .group_by(CandidateTag.value)
+        .subquery()
+    )
+    count = (FacetCount.count - func.coalesce(excluded.c.count, 0)).label("count")
+    return (
+        select(FacetCount.value, count)
+        .outerjoin(excluded, excluded.c.value == FacetCount.value)
+        .filter(FacetCount.facet == "skill")
+        .filter(count > 0)
+        .order_by(count.desc(), FacetCount.value)
+        .limit(limit)
+    )
+
 
 @router.get("/skills-frequency/{job_id}", response_model=SkillsFrequencyReport)
 async def get_skills_frequency(
     job_id: int,
-    db: Session = Depends(get_db),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     Report: Top skills frequency across all candidates for a specific job
-    Shows which skills are most common among candidates for this position
+    Shows which skills are most common among candidates for this position,
+    top ``limit`` skills with their share of successfully parsed candidates
     """
     # Verify job exists
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = await db.get(Job, job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
         )
 
-    # Get all candidates
-    candidates = db.query(Candidate).filter(Candidate.parse_status == "success").all()
-
-    # Count skill frequencies
-    all_skills = []
-    for candidate in candidates:
-        if candidate.skills:
-            all_skills.extend(candidate.skills)
-
-    skill_counter = Counter(all_skills)
-    total_candidates = len(candidates)
-
-    # Create skill frequency list
-    skills_list = []
-    for skill, count in skill_counter.most_common(20):  # Top 20 skills
-        skills_list.append(
-            {
-                "skill": skill,
-                "count": count,
-                "percentage": (
-                    round((count / total_candidates) * 100, 2)
-                    if total_candidates > 0
-                    else 0
-                ),
-            }
-        )
+    total_candidates = await db.scalar(
+        select(func.count(Candidate.id)).filter(Candidate.parse_status == "success")
+    )
+
+    result = await db.execute(top_skills_query(limit))
+
+    skills_list = [
+        {
+            "skill": skill,
+            "count": count,
+            "percentage": (
+                round((count / total_candidates) * 100, 2) if total_candidates else 0
+            ),
+        }
+        for skill, count in result.all()
+    ]
 
     return {
         "job_id": job_id,
@@ -74,84 +125,166 @@ async def get_skills_frequency(
 
 @router.get("/pipeline-stats", response_model=PipelineStats)
 async def get_pipeline_stats(
-    db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user),
 ):
     """
     Report: Candidate pipeline statistics
     Shows upload count, parse success rate, average scores by job
     """
-    # Total candidates
-    total_candidates = db.query(func.count(Candidate.id)).scalar()
-
-    # Parse statistics
-    parsed_successfully = (
-        db.query(func.count(Candidate.id))
-        .filter(Candidate.parse_status == "success")
-        .scalar()
+    # Counts are maintained as candidates and jobs change, see pipeline_stats
+    summary = await db.get(PipelineSummary, SUMMARY_ID) or PipelineSummary(
+        candidates=0, candidates_parsed=0, candidates_failed=0, jobs=0, jobs_active=0
     )
-
-    parse_failed = (
-        db.query(func.count(Candidate.id))
-        .filter(Candidate.parse_status == "failed")
-        .scalar()
-    )
-
     success_rate = (
-        (parsed_successfully / total_candidates * 100) if total_candidates > 0 else 0
+        (summary.candidates_parsed / summary.candidates * 100)
+        if summary.candidates > 0
+        else 0
     )
 
-    # Job statistics
-    total_jobs = db.query(func.count(Job.id)).scalar()
-    active_jobs = db.query(func.count(Job.id)).filter(Job.status == "active").scalar()
-
     # Average score by job
-    avg_scores = (
-        db.query(
-            Job.id,
+    job_scores = await db.execute(
+        select(
+            JobScoreStats.job_id,
             Job.title,
-            func.avg(CandidateScore.total_score).label("avg_score"),
-            func.count(CandidateScore.id).label("candidate_count"),
+            JobScoreStats.ranked,
+            JobScoreStats.scored,
+            JobScoreStats.score_total,
         )
-        .join(CandidateScore, Job.id == CandidateScore.job_id)
-        .group_by(Job.id, Job.title)
-        .all()
+        .join(Job, Job.id == JobScoreStats.job_id)
+        .filter(JobScoreStats.ranked > 0)
+        .order_by(JobScoreStats.job_id)
     )
 
     average_score_by_job = [
         {
-            "job_id": row.id,
+            "job_id": row.job_id,
             "job_title": row.title,
-            "average_score": round(row.avg_score, 2) if row.avg_score else 0,
-            "candidate_count": row.candidate_count,
+            # Null scores count as candidates but not towards the average
+            "average_score": (
+                round(row.score_total / row.scored, 2) if row.scored else 0
+            ),
+            "candidate_count": row.ranked,
         }
-        for row in avg_scores
+        for row in job_scores
     ]
 
     return {
-        "total_candidates": total_candidates,
-        "parsed_successfully": parsed_successfully,
-        "parse_failed": parse_failed,
+        "total_candidates": summary.candidates,
+        "parsed_successfully": summary.candidates_parsed,
+        "parse_failed": summary.candidates_failed,
         "success_rate": round(success_rate, 2),
-        "total_jobs": total_jobs,
-        "active_jobs": active_jobs,
+        "total_jobs": summary.jobs,
+        "active_jobs": summary.jobs_active,
         "average_score_by_job": average_score_by_job,
     }
 
 
+@router.get("/cache-stats", response_model=CacheStats)
+async def get_cache_stats(
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    Report: Cache effectiveness (admin only)
+    Shows parse, user and token cache hits, misses and hit rates since process start
+    """
+    return {
+        "parse_cache": await db.run_sync(ParseCacheService.get_stats),
+        "user_cache": UserCacheService.get_stats(),
+        "token_cache": TokenCacheService.get_stats(),
+    }
+
+
+@router.get("/auth-stats", response_model=AuthStats)
+async def get_auth_stats(current_user: User = Depends(get_current_admin_user)):
+    """
+    Report: Password hashing pool load (admin only)
+    Shows running and waiting bcrypt operations, rejections and wait times
+    """
+    return {"password_hashing": get_password_pool().get_stats()}
+
+
 @router.get("/audit-logs", response_model=List[AuditLogResponse])
 async def get_audit_logs(
+    response: Response,
+    cursor: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(get_current_admin_user),
 ):
-    """Get system audit logs (admin only)"""
-    logs = (
-        db.query(AuditLog)
-        .order_by(AuditLog.timestamp.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
+    """Get system audit logs, newest first (admin only)"""
+    result = await db.execute(
+        paginate(
+            select(AuditLog), AUDIT_LOG_ORDER, cursor, skip, limit, descending=True
+        )
     )
-
+    logs = result.scalars().all()
+    set_next_cursor(response, logs, AUDIT_LOG_ORDER, limit)
     return logs
+
+
+@router.get("/audit-logs/export")
+def export_audit_logs(
+    format: str = Query("ndjson", pattern="^(csv|ndjson)$"),
+    user_id: Optional[int] = None,
+    action: Optional[str] = None,
+    entity_type: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    include_archived: bool = False,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    Export audit logs as CSV or NDJSON, oldest first (admin only)
+    Rows are streamed from a server-side cursor; start/end bound the timestamp
+    and include_archived adds entries from the compressed archives
+    """
+    # The request session is closed before streaming, so stream on our own
+    session = Session(bind=db.get_bind())
+    service = AuditExportService(session)
+    entries = service.entries(
+        user_id, action, entity_type, start, end, include_archived
+    )
+    body = service.to_csv(entries) if format == "csv" else service.to_ndjson(entries)
+
+    def stream():
+        try:
+            yield from body
+        finally:
+            session.close()
+
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        stream(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="audit_logs.{format}"'},
+    )
+
+
+@router.get("/audit-logs/archive")
+async def get_archived_audit_logs(
+    start: datetime,
+    end: datetime,
+    action: Optional[str] = None,
+    user_id: Optional[int] = None,
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    Stream archived audit logs with start <= timestamp < end as NDJSON (admin only)
+    Entries past the retention window are read from their compressed archives
+    """
+    start, end = as_utc(start), as_utc(end)
+    if start >= end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start must be before end",
+        )
+
+    entries = AuditArchiveService().iter_archived(start, end, action, user_id)
+    return StreamingResponse(
+        (json.dumps(entry) + "\n" for entry in entries),
+        media_type="application/x-ndjson",
+    )
@@ -1,28 +1,37 @@
 """User management routes (admin only)"""
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models import User
 from app.schemas import UserCreate, UserResponse, UserUpdate
 from app.services.audit_service import AuditService
-from app.utils.auth import get_current_admin_user, get_password_hash
+from app.services.password_pool import PasswordPoolBusy
+from app.services.user_cache_service import UserCacheService
+from app.utils.auth import get_current_admin_user, get_password_hash_async
+from app.utils.pagination import paginate, set_next_cursor
 
 router = APIRouter(prefix="/api/users", tags=["Users"])
 
+# Sort key for user listings
+USER_ORDER = (User.id,)
+
 
 @router.get("", response_model=List[UserResponse])
 async def get_users(
+    response: Response,
+    cursor: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user),
 ):
-    """Get all users (admin only)"""
-    users = db.query(User).offset(skip).limit(limit).all()
+    """Get all users (admin only), paged with the X-Next-Cursor response header"""
+    users = paginate(db.query(User), USER_ORDER, cursor, skip, limit).all()
+    set_next_cursor(response, users, USER_ORDER, limit)
     return users
 
 
@@ -40,12 +49,21 @@ async def create_user(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered"
         )
 
+    try:
+        hashed_password = await get_password_hash_async(user_data.password)
+    except PasswordPoolBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many password operations in progress, please retry",
+            headers={"Retry-After": "1"},
+        )
+
     # Create new user
     new_user = User(
         email=user_data.email,
         full_name=user_data.full_name,
         role=user_data.role,
-        hashed_password=get_password_hash(user_data.password),
+        hashed_password=hashed_password,
     )
 
     db.add(new_user)
@@ -81,6 +99,7 @@ async def update_user(
         )
 
     # Update fields
+    previous_email = user.email
     update_data = user_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(user, field, value)
@@ -88,6 +107,10 @@ async def update_user(
     db.commit()
     db.refresh(user)
 
+    # Role or active status may have changed; stop serving the cached copy
+    UserCacheService.invalidate(previous_email)
+    UserCacheService.invalidate(user.email)
+
     # Log action
     AuditService.log_action(
         db=db,
@@ -120,8 +143,10 @@ async def delete_user(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
+    email = user.email
     db.delete(user)
     db.commit()
+    UserCacheService.invalidate(email)
 
     # Log action
     AuditService.log_action(
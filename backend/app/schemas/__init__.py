@@ -97,6 +97,7 @@ class CandidateUpdate(BaseModel):
 class CandidateResponse(CandidateBase):
     id: int
     file_path: Optional[str] = None
+    file_hash: Optional[str] = None
     file_name: Optional[str] = None
     file_type: Optional[str] = None
     parse_status: str
@@ -108,6 +109,24 @@ class CandidateResponse(CandidateBase):
         from_attributes = True
 
 
+class CandidateSearchResult(BaseModel):
+    candidate: CandidateResponse
+    score: float
+    snippet: Optional[str] = None
+
+
+class FacetValue(BaseModel):
+    value: str
+    count: int
+
+
+class CandidateFacets(BaseModel):
+    skills: List[FacetValue] = []
+    languages: List[FacetValue] = []
+    experience: List[FacetValue] = []
+    parse_status: List[FacetValue] = []
+
+
 # Job Schemas
 class JobBase(BaseModel):
     title: str
@@ -199,6 +218,47 @@ class PipelineStats(BaseModel):
     average_score_by_job: List[Dict[str, Any]]
 
 
+class ParseCacheStats(BaseModel):
+    hits: int
+    partial_hits: int
+    misses: int
+    lookups: int
+    hit_rate: float
+    entries: int
+    total_hits: int
+
+
+class InProcessCacheStats(BaseModel):
+    hits: int
+    misses: int
+    lookups: int
+    hit_rate: float
+    entries: int
+
+
+class CacheStats(BaseModel):
+    parse_cache: ParseCacheStats
+    user_cache: InProcessCacheStats
+    token_cache: InProcessCacheStats
+
+
+class PasswordHashingStats(BaseModel):
+    workers: int
+    max_waiting: int
+    running: int
+    waiting: int
+    completed: int
+    rejected: int
+    peak_waiting: int
+    avg_wait_ms: float
+    max_wait_ms: float
+    avg_run_ms: float
+
+
+class AuthStats(BaseModel):
+    password_hashing: PasswordHashingStats
+
+
 # Audit Log Schemas
 class AuditLogResponse(BaseModel):
     id: int
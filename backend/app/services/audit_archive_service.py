@@ -0,0 +1,161 @@
+"""Audit log retention and compressed archival"""
+
+import glob
+import gzip
+import json
+import os
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models import AuditLog
+from app.models.audit import (
+    as_utc,
+    ensure_audit_partitions,
+    month_start,
+    months_between,
+    next_month,
+    partition_name,
+)
+
+# audit_logs_2026_08.jsonl.gz, or audit_logs_2026_08.1.jsonl.gz for a re-run
+ARCHIVE_NAME = re.compile(r"^audit_logs_(\d{4})_(\d{2})(\.\d+)?\.jsonl\.gz$")
+
+
+class AuditArchiveService:
+    """
+    Moves audit log months past the retention window into gzipped JSONL files
+    under ``storage/audit_archive`` and reads them back on demand.
+    """
+
+    def __init__(self, db: Optional[Session] = None, archive_dir: Optional[str] = None):
+        self.db = db
+        self.archive_dir = archive_dir or os.path.join(
+            settings.storage_path, "audit_archive"
+        )
+
+    def expired_months(self, now: Optional[datetime] = None) -> List[datetime]:
+        """Starts of the months whose entries are all past the retention window"""
+        if settings.audit_retention_days <= 0:
+            return []
+        oldest = self.db.scalar(select(func.min(AuditLog.timestamp)))
+        if oldest is None:
+            return []
+
+        now = as_utc(now or datetime.now(timezone.utc))
+        cutoff = month_start(now - timedelta(days=settings.audit_retention_days))
+        return [start for start, _ in months_between(oldest, cutoff)]
+
+    def archive_expired(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Archive every expired month; returns rows archived per partition name"""
+        archived = {}
+        for start in self.expired_months(now):
+            archived[partition_name(start)] = self.archive_month(start)
+        ensure_audit_partitions(self.db.connection(), now)
+        self.db.commit()
+        return archived
+
+    def archive_month(self, start: datetime) -> int:
+        """Write one month of entries to its archive file and remove them"""
+        start = month_start(start)
+        end = next_month(start)
+        os.makedirs(self.archive_dir, exist_ok=True)
+
+        rows = self.db.execute(
+            select(AuditLog.__table__)
+            .where(AuditLog.timestamp >= start, AuditLog.timestamp < end)
+            .order_by(AuditLog.timestamp, AuditLog.id),
+            execution_options={"stream_results": True},
+        )
+        partial_path = os.path.join(
+            self.archive_dir, f"{partition_name(start)}.partial"
+        )
+        count = 0
+        with gzip.open(partial_path, "wt", encoding="utf-8") as archive:
+            for row in rows:
+                archive.write(json.dumps(self.to_entry(row._mapping)) + "\n")
+                count += 1
+
+        if count:
+            os.replace(partial_path, self._archive_path(start))
+        else:
+            os.remove(partial_path)
+        self._drop_month(start, end)
+        self.db.commit()
+        return count
+
+    def iter_archived(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        action: Optional[str] = None,
+        user_id: Optional[int] = None,
+        entity_type: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream archived entries with start <= timestamp < end"""
+        start = as_utc(start) if start else None
+        end = as_utc(end) if end else None
+        for path in self.archive_files(start, end):
+            with gzip.open(path, "rt", encoding="utf-8") as archive:
+                for line in archive:
+                    entry = json.loads(line)
+                    timestamp = datetime.fromisoformat(entry["timestamp"])
+                    if start and timestamp < start or end and timestamp >= end:
+                        continue
+                    if action is not None and entry["action"] != action:
+                        continue
+                    if user_id is not None and entry["user_id"] != user_id:
+                        continue
+                    if entity_type is not None and entry["entity_type"] != entity_type:
+                        continue
+                    yield entry
+
+    def archive_files(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> List[str]:
+        """Archive files of the months overlapping [start, end), oldest first"""
+        files = []
+        for path in glob.glob(os.path.join(self.archive_dir, "audit_logs_*.jsonl.gz")):
+            match = ARCHIVE_NAME.match(os.path.basename(path))
+            if not match:
+                continue
+            year, month = int(match.group(1)), int(match.group(2))
+            month = datetime(year, month, 1, tzinfo=timezone.utc)
+            if start and next_month(month) <= start or end and month >= end:
+                continue
+            files.append((month, os.path.getmtime(path), path))
+        return [path for _, _, path in sorted(files)]
+
+    def _archive_path(self, month: datetime) -> str:
+        # A month archived again (late entries, interrupted run) gets a new file
+        name = partition_name(month)
+        path = os.path.join(self.archive_dir, f"{name}.jsonl.gz")
+        suffix = 1
+        while os.path.exists(path):
+            path = os.path.join(self.archive_dir, f"{name}.{suffix}.jsonl.gz")
+            suffix += 1
+        return path
+
+    def _drop_month(self, start: datetime, end: datetime):
+        if self.db.get_bind().dialect.name == "postgresql":
+            name = partition_name(start)
+            if self.db.scalar(text("SELECT to_regclass(:name)"), {"name": name}):
+                self.db.execute(text(f"ALTER TABLE audit_logs DETACH PARTITION {name}"))
+                self.db.execute(text(f"DROP TABLE {name}"))
+        # Entries outside a monthly partition (SQLite, PostgreSQL's default one)
+        self.db.execute(
+            AuditLog.__table__.delete().where(
+                AuditLog.timestamp >= start, AuditLog.timestamp < end
+            )
+        )
+
+    @staticmethod
+    def to_entry(row) -> Dict[str, Any]:
+        """JSON-ready dict of an audit_logs row, with an ISO 8601 UTC timestamp"""
+        entry = dict(row)
+        entry["timestamp"] = as_utc(entry["timestamp"]).isoformat()
+        return entry
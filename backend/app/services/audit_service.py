@@ -1,15 +1,230 @@
 """Audit logging service"""
 
-from typing import Any, Dict, Optional
+import atexit
+import logging
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.config import settings
+from app.database import SessionLocal, async_engine, engine
 from app.models import AuditLog
 
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class AuditWriter:
+    """
+    Background writer that batches audit entries into bulk inserts.
+
+    Entries are queued in memory and written on the writer's own session every
+    ``flush_interval_ms`` or ``batch_size`` entries, whichever comes first, so
+    request handlers never wait on an audit commit. ``shutdown`` writes
+    everything still queued before returning.
+
+    At most ``max_queued`` entries wait in memory; ``enqueue`` refuses more,
+    and callers write those synchronously instead. A batch that still fails
+    after ``MAX_ATTEMPTS`` tries with backoff is split in halves until the
+    rows that cannot be written are isolated; those are logged and dropped
+    so one bad row does not stall the audit log.
+    """
+
+    MAX_ATTEMPTS = 5
+    MAX_RETRY_DELAY = 5.0
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        flush_interval_ms: int = 200,
+        batch_size: int = 500,
+        max_queued: int = 10000,
+    ):
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval_ms / 1000
+        self.batch_size = batch_size
+        self._queue = queue.Queue(maxsize=max_queued)
+        self._condition = threading.Condition()
+        self._counters = {"enqueued": 0, "written": 0, "dropped": 0, "refused": 0}
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name="audit-writer", daemon=True
+        )
+        self._thread.start()
+
+    def enqueue(self, entry: Dict[str, Any]) -> bool:
+        """Queue an audit_logs row; False leaves it to the caller to write"""
+        with self._condition:
+            if self._stopped:
+                return False
+            try:
+                self._queue.put_nowait(entry)
+            except queue.Full:
+                self._counters["refused"] += 1
+                return False
+            self._counters["enqueued"] += 1
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every entry queued so far has been written or dropped"""
+        with self._condition:
+            target = self._counters["enqueued"]
+            return self._condition.wait_for(
+                lambda: self._processed() >= target, timeout=timeout
+            )
+
+    def shutdown(self, timeout: Optional[float] = None):
+        """Stop accepting entries and write out the ones still queued"""
+        with self._condition:
+            if self._stopped:
+                return
+            self._stopped = True
+        # Outside the lock: a full queue only drains while the writer can
+        # take the lock to count what it wrote
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Report queued, written, dropped and refused entries"""
+        with self._condition:
+            return {**self._counters, "queued": self._queue.qsize()}
+
+    def _processed(self) -> int:
+        return self._counters["written"] + self._counters["dropped"]
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch, stopping = self._next_batch()
+            if batch:
+                self._write(batch)
+
+    def _next_batch(self):
+        """Collect entries until the batch is full or the interval elapses"""
+        batch = []
+        item = self._queue.get()
+        deadline = time.monotonic() + self.flush_interval
+        while item is not _STOP:
+            batch.append(item)
+            remaining = deadline - time.monotonic()
+            if len(batch) >= self.batch_size or remaining <= 0:
+                return batch, False
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                return batch, False
+        return batch, True
+
+    def _insert(self, batch: List[Dict[str, Any]]):
+        with self.session_factory() as db:
+            db.execute(AuditLog.__table__.insert(), batch)
+            db.commit()
+
+    def _write(self, batch: List[Dict[str, Any]]):
+        delay = self.flush_interval or 0.1
+        dropped = 0
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            try:
+                self._insert(batch)
+                break
+            except Exception:
+                logger.exception(
+                    "Writing %d audit entries failed (attempt %d of %d)",
+                    len(batch),
+                    attempt,
+                    self.MAX_ATTEMPTS,
+                )
+                if attempt < self.MAX_ATTEMPTS:
+                    time.sleep(delay)
+                    delay = min(delay * 2, self.MAX_RETRY_DELAY)
+        else:
+            dropped = self._write_split(batch)
+
+        with self._condition:
+            self._counters["written"] += len(batch) - dropped
+            self._counters["dropped"] += dropped
+            self._condition.notify_all()
+
+    def _write_split(self, batch: List[Dict[str, Any]]) -> int:
+        """Write the halves of a failing batch separately; return rows dropped"""
+        if len(batch) == 1:
+            logger.error("Dropping audit entry that cannot be written: %r", batch[0])
+            return 1
+
+        dropped = 0
+        middle = len(batch) // 2
+        for half in (batch[:middle], batch[middle:]):
+            try:
+                self._insert(half)
+            except Exception:
+                dropped += self._write_split(half)
+        return dropped
+
+
+_writer: Optional[AuditWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_audit_writer() -> AuditWriter:
+    """Return the process-wide audit writer, starting it on first use"""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = AuditWriter(
+                flush_interval_ms=settings.audit_flush_interval_ms,
+                batch_size=settings.audit_batch_size,
+                max_queued=settings.audit_queue_size,
+            )
+            # Scripts exit without a shutdown event; write queued entries first
+            atexit.register(shutdown_audit_writer)
+        return _writer
+
+
+def shutdown_audit_writer():
+    """Write out queued audit entries and stop the writer"""
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.shutdown()
+
 
 class AuditService:
     """Service for logging system actions"""
 
+    @staticmethod
+    def _entry(
+        action: str,
+        user_id: Optional[int],
+        entity_type: Optional[str],
+        entity_id: Optional[int],
+        details: Optional[Dict[str, Any]],
+        ip_address: Optional[str],
+    ) -> Dict[str, Any]:
+        return {
+            "user_id": user_id,
+            "action": action,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "details": details or {},
+            "ip_address": ip_address,
+            # Stamped when the action happens, not when the batch is written
+            "timestamp": datetime.now(timezone.utc),
+        }
+
+    @staticmethod
+    def _queue(bind, entry: Dict[str, Any]) -> bool:
+        """Hand an entry to the background writer if it serves this database"""
+        if not settings.audit_async_writes or bind not in (engine, async_engine):
+            return False
+        return get_audit_writer().enqueue(entry)
+
     @staticmethod
     def log_action(
         db: Session,
@@ -20,18 +235,46 @@ class AuditService:
         details: Optional[Dict[str, Any]] = None,
         ip_address: Optional[str] = None,
     ) -> AuditLog:
-        """Log an action to the audit log"""
-        log_entry = AuditLog(
-            user_id=user_id,
-            action=action,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            details=details or {},
-            ip_address=ip_address,
+        """
+        Log an action to the audit log
+
+        Entries for the application database are written in the background, in
+        which case the returned AuditLog is not yet persisted. Sessions bound
+        to other databases (tests, scripts) write and commit immediately.
+        """
+        entry = AuditService._entry(
+            action, user_id, entity_type, entity_id, details, ip_address
         )
+        if AuditService._queue(db.get_bind(), entry):
+            return AuditLog(**entry)
 
+        log_entry = AuditLog(**entry)
         db.add(log_entry)
         db.commit()
         db.refresh(log_entry)
 
         return log_entry
+
+    @staticmethod
+    async def log_action_async(
+        db: AsyncSession,
+        action: str,
+        user_id: Optional[int] = None,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[int] = None,
+        details: Optional[Dict[str, Any]] = None,
+        ip_address: Optional[str] = None,
+    ) -> AuditLog:
+        """Log an action to the audit log from an async session"""
+        entry = AuditService._entry(
+            action, user_id, entity_type, entity_id, details, ip_address
+        )
+        if AuditService._queue(db.bind, entry):
+            return AuditLog(**entry)
+
+        log_entry = AuditLog(**entry)
+        db.add(log_entry)
+        await db.commit()
+        await db.refresh(log_entry)
+
+        return log_entry
@@ -0,0 +1,413 @@
+"""CV ingestion - turning stored files and parse results into candidates"""
+
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models import Candidate
+from app.services.audit_service import AuditService
+from app.services.parse_cache_service import ParseCacheService
+from app.services.parser_pool import get_parser
+from app.services.storage_service import StorageService
+from app.utils.concurrency import bounded_imap_unordered
+from app.utils.cv_parser import CVParser
+
+SUPPORTED_FILE_TYPES = ("pdf", "docx", "txt")
+
+
+def get_file_type(file_name: str) -> Optional[str]:
+    """Return the lowercase extension if it is a supported CV type"""
+    file_ext = file_name.rsplit(".", 1)[-1].lower() if "." in file_name else ""
+    return file_ext if file_ext in SUPPORTED_FILE_TYPES else None
+
+
+def iter_archive_members(archive: zipfile.ZipFile) -> Iterator[zipfile.ZipInfo]:
+    """Yield file members of a ZIP archive, skipping folders and macOS metadata"""
+    for member in archive.infolist():
+        name = os.path.basename(member.filename)
+        if member.is_dir() or member.filename.startswith("__MACOSX/"):
+            continue
+        if name.startswith("."):
+            continue
+        yield member
+
+
+def list_archive_members(archive: zipfile.ZipFile) -> List[zipfile.ZipInfo]:
+    """List the members of an uploaded archive, enforcing archive limits"""
+    members = list(iter_archive_members(archive))
+
+    if len(members) > settings.archive_max_members:
+        raise ValueError(
+            f"Archive has {len(members)} files (limit {settings.archive_max_members})"
+        )
+
+    total_size = sum(member.file_size for member in members)
+    if total_size > settings.archive_max_total_size:
+        raise ValueError(
+            f"Archive expands to {total_size} bytes "
+            f"(limit {settings.archive_max_total_size})"
+        )
+
+    return members
+
+
+def build_candidate(
+    parse_result: Dict,
+    file_name: str,
+    file_type: str,
+    file_hash: str,
+    file_path: str,
+) -> Candidate:
+    """Create a (not yet persisted) candidate from a parse result"""
+    if not parse_result["success"]:
+        return Candidate(
+            name="Parse Failed",
+            file_path=file_path,
+            file_hash=file_hash,
+            file_name=file_name,
+            file_type=file_type,
+            parse_status="failed",
+            parse_error=parse_result["error"],
+        )
+
+    data = parse_result["data"]
+    return Candidate(
+        name=data["name"],
+        email=data["email"],
+        phone=data["phone"],
+        education=data["education"],
+        years_of_experience=data["years_of_experience"],
+        skills=data["skills"],
+        languages=data["languages"],
+        raw_text=data["raw_text"],
+        file_path=file_path,
+        file_hash=file_hash,
+        file_name=file_name,
+        file_type=file_type,
+        parse_status="success",
+    )
+
+
+def ingest_file(
+    db: Session,
+    source: BinaryIO,
+    file_name: str,
+    user_id: Optional[int],
+    storage: StorageService,
+    parse_cache: ParseCacheService,
+    details: Optional[Dict] = None,
+) -> Dict:
+    """Store, parse and save one uploaded CV, returning its upload result"""
+    # Validate file type
+    file_ext = get_file_type(file_name)
+    if not file_ext:
+        return {
+            "filename": file_name,
+            "status": "error",
+            "error": "Unsupported file type",
+        }
+
+    # Save file (identical content is stored once)
+    file_hash, file_path, pin = storage.store(source, file_ext)
+
+    committed = False
+    try:
+        # Parse CV (re-uploads of known files are served from cache)
+        parse_result = parse_cache.parse_file(file_path, file_ext, file_hash)
+
+        # Create candidate record (with failed status if parsing failed)
+        candidate = build_candidate(
+            parse_result, file_name, file_ext, file_hash, file_path
+        )
+
+        db.add(candidate)
+        db.commit()
+        committed = True
+    finally:
+        storage.unpin(file_hash, file_path, pin, restore=committed)
+
+    if not parse_result["success"]:
+        return {
+            "filename": file_name,
+            "status": "failed",
+            "error": parse_result["error"],
+        }
+
+    db.refresh(candidate)
+
+    # Log action
+    AuditService.log_action(
+        db=db,
+        action="cv_uploaded",
+        user_id=user_id,
+        entity_type="candidate",
+        entity_id=candidate.id,
+        details={"filename": file_name, **(details or {})},
+    )
+
+    return {"filename": file_name, "status": "success", "candidate_id": candidate.id}
+
+
+def ingest_archive(
+    db: Session,
+    archive: zipfile.ZipFile,
+    members: List[zipfile.ZipInfo],
+    archive_name: str,
+    user_id: Optional[int],
+) -> Iterator[Dict]:
+    """
+    Ingest archive members one at a time, yielding each upload result.
+
+    Members are decompressed straight into storage in chunks, so neither the
+    archive nor a whole member is ever held in memory.
+    """
+    parse_cache = ParseCacheService(db, get_parser())
+    storage = StorageService()
+
+    for member in members:
+        try:
+            if member.file_size > settings.max_file_size:
+                result = {"status": "error", "error": "File too large"}
+            else:
+                with archive.open(member) as source:
+                    result = ingest_file(
+                        db,
+                        source,
+                        os.path.basename(member.filename),
+                        user_id,
+                        storage,
+                        parse_cache,
+                        details={"archive": archive_name},
+                    )
+        except Exception as e:
+            db.rollback()
+            result = {"status": "error", "error": str(e)}
+
+        result["filename"] = member.filename
+        yield result
+
+
+# Per-process worker state, set up once by _init_worker
+_worker: Dict = {}
+
+
+def _init_worker(storage_root: Optional[str]):
+    """Create the parser and storage once per worker process"""
+    _worker["parser"] = CVParser()
+    _worker["storage"] = StorageService(root=storage_root)
+    _worker["archives"] = {}
+
+
+def _ingest_file(task: Tuple[Optional[str], str, str]) -> Dict:
+    """Store and parse one file inside a worker process"""
+    archive_path, source_path, file_type = task
+    storage: StorageService = _worker["storage"]
+    parser: CVParser = _worker["parser"]
+    file_name = os.path.basename(source_path)
+    pin = None
+
+    try:
+        if archive_path:
+            archives = _worker["archives"]
+            if archive_path not in archives:
+                archives[archive_path] = zipfile.ZipFile(archive_path)
+            with archives[archive_path].open(source_path) as source:
+                file_hash, file_path, pin = storage.store(source, file_type)
+        else:
+            file_hash, file_path, pin = storage.store_file(source_path, file_type)
+
+        parse_result = parser.parse_file(file_path, file_type)
+    except Exception as e:
+        if pin:
+            storage.unpin(file_hash, file_path, pin, restore=False)
+        return {"key": source_path, "file_name": file_name, "error": str(e)}
+
+    return {
+        "key": source_path,
+        "file_name": file_name,
+        "file_type": file_type,
+        "file_hash": file_hash,
+        "file_path": file_path,
+        "pin": pin,
+        "parse_result": parse_result,
+    }
+
+
+class BulkIngestService:
+    """
+    Ingest a directory tree or ZIP archive of CVs.
+
+    Files are stored and parsed in a process pool, candidates are inserted in
+    batched transactions, and the key of every committed file is appended to
+    a checkpoint file so an interrupted run resumes where it stopped.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        workers: Optional[int] = None,
+        batch_size: int = 500,
+        checkpoint_path: Optional[str] = None,
+        storage_root: Optional[str] = None,
+        progress: Optional[Callable[[Dict], None]] = None,
+        progress_interval: float = 5.0,
+    ):
+        self.db = db
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.checkpoint_path = checkpoint_path
+        self.storage_root = storage_root
+        self.progress = progress
+        self.progress_interval = progress_interval
+
+    @staticmethod
+    def iter_sources(source: str) -> Iterator[Tuple[Optional[str], str, str]]:
+        """Yield (archive_path, path, file_type) for every supported CV file"""
+        if zipfile.is_zipfile(source):
+            with zipfile.ZipFile(source) as archive:
+                for member in iter_archive_members(archive):
+                    file_type = get_file_type(member.filename)
+                    if file_type:
+                        yield source, member.filename, file_type
+            return
+
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for file_name in sorted(files):
+                file_type = get_file_type(file_name)
+                if file_type and not file_name.startswith("."):
+                    yield None, os.path.join(root, file_name), file_type
+
+    def load_checkpoint(self) -> Set[str]:
+        """Read keys of files committed by previous runs"""
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return set()
+
+        with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+            return {line.rstrip("\n") for line in f if line.strip()}
+
+    def _save_checkpoint(self, keys: List[str]):
+        """Append committed keys to the checkpoint file"""
+        if not self.checkpoint_path or not keys:
+            return
+
+        with open(self.checkpoint_path, "a", encoding="utf-8") as f:
+            f.writelines(f"{key}\n" for key in keys)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def run(self, source: str) -> Dict:
+        """Ingest every CV under ``source`` and return run statistics"""
+        done = self.load_checkpoint()
+        stats = {
+            "skipped": 0,
+            "ingested": 0,
+            "parse_failed": 0,
+            "errors": 0,
+            "error_details": [],
+        }
+        started = last_report = time.perf_counter()
+        batch: List[Dict] = []
+
+        def pending_tasks():
+            for task in self.iter_sources(source):
+                if task[1] in done:
+                    stats["skipped"] += 1
+                else:
+                    yield task
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.storage_root,),
+        ) as executor:
+            results = bounded_imap_unordered(
+                executor, _ingest_file, pending_tasks(), self.workers * 4
+            )
+
+            for result in results:
+                batch.append(result)
+
+                if len(batch) >= self.batch_size:
+                    self._commit_batch(batch, stats)
+                    batch = []
+
+                now = time.perf_counter()
+                if self.progress and now - last_report >= self.progress_interval:
+                    self.progress(self._progress(stats, now - started))
+                    last_report = now
+
+        self._commit_batch(batch, stats)
+        summary = self._progress(stats, time.perf_counter() - started)
+
+        AuditService.log_action(
+            db=self.db,
+            action="cvs_bulk_ingested",
+            details={
+                key: summary[key] for key in ("ingested", "parse_failed", "errors")
+            },
+        )
+
+        return summary
+
+    def _commit_batch(self, results: List[Dict], stats: Dict):
+        """Insert one batch of candidates in a single transaction"""
+        if not results:
+            return
+
+        candidates = []
+        for result in results:
+            if "error" in result:
+                stats["errors"] += 1
+                stats["error_details"].append(
+                    {"file": result["key"], "error": result["error"]}
+                )
+                continue
+
+            candidate = build_candidate(
+                result["parse_result"],
+                result["file_name"],
+                result["file_type"],
+                result["file_hash"],
+                result["file_path"],
+            )
+            if candidate.parse_status == "failed":
+                stats["parse_failed"] += 1
+            candidates.append(candidate)
+
+        committed = False
+        try:
+            self.db.add_all(candidates)
+            self.db.commit()
+            committed = True
+        finally:
+            # Blobs are pinned by the workers until their candidates are saved
+            storage = StorageService(root=self.storage_root)
+            for result in results:
+                if "pin" in result:
+                    storage.unpin(
+                        result["file_hash"],
+                        result["file_path"],
+                        result["pin"],
+                        restore=committed,
+                    )
+        self.db.expunge_all()
+        stats["ingested"] += len(candidates)
+
+        # Files that errored are recorded too, so a resume does not retry them
+        self._save_checkpoint([result["key"] for result in results])
+
+    @staticmethod
+    def _progress(stats: Dict, elapsed: float) -> Dict:
+        processed = stats["ingested"] + stats["errors"]
+        return {
+            **stats,
+            "processed": processed,
+            "elapsed_seconds": round(elapsed, 2),
+            "files_per_second": round(processed / elapsed, 2) if elapsed else 0.0,
+        }
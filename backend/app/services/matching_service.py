@@ -2,9 +2,10 @@
 
 from typing import Dict, List
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 
 from app.models import Candidate, CandidateScore, Job
+from app.models.pipeline_stats import reset_job_scores
 
 
 class MatchingService:
@@ -21,12 +22,15 @@ class MatchingService:
             raise ValueError(f"Job {job_id} not found")
 
         # Get all successfully parsed candidates
-        candidates = (
-            self.db.query(Candidate).filter(Candidate.parse_status == "success").all()
-        )
+        query = self.db.query(Candidate).filter(Candidate.parse_status == "success")
+        if job.keywords:
+            # Keyword matching reads the full CV text, so load it up front
+            query = query.options(undefer(Candidate.raw_text))
+        candidates = query.all()
 
         # Delete existing scores for this job
         self.db.query(CandidateScore).filter(CandidateScore.job_id == job_id).delete()
+        reset_job_scores(self.db.connection(), job_id)
         self.db.commit()
 
         # Calculate scores for each candidate
@@ -0,0 +1,111 @@
+"""Database-backed cache of CV parse results"""
+
+import threading
+from typing import Dict
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models import ParseCache
+from app.utils.cv_parser import CVParser
+
+
+class ParseCacheService:
+    """
+    Cache parse results keyed by (file hash, parser version, taxonomy version).
+
+    A full hit skips ``CVParser.parse_file`` entirely. When only the taxonomy
+    changed, the cached raw text is reused and just the taxonomy-dependent
+    fields (skills, languages) are re-extracted.
+    """
+
+    _lock = threading.Lock()
+    _counters = {"hits": 0, "partial_hits": 0, "misses": 0}
+
+    def __init__(self, db: Session, parser: CVParser):
+        self.db = db
+        self.parser = parser
+
+    def parse_file(self, file_path: str, file_type: str, file_hash: str) -> Dict:
+        """Parse a CV file, serving the result from cache when possible"""
+        entry = (
+            self.db.query(ParseCache)
+            .filter(ParseCache.file_hash == file_hash)
+            .filter(ParseCache.parser_version == self.parser.PARSER_VERSION)
+            .first()
+        )
+
+        if entry is None:
+            self._count("misses")
+            result = self.parser.parse_file(file_path, file_type)
+            if result["success"]:
+                self._store(file_hash, result["data"])
+            return result
+
+        data = dict(entry.data or {})
+        taxonomy_version = self.parser.taxonomy_version
+
+        if entry.taxonomy_version == taxonomy_version:
+            self._count("hits")
+        else:
+            self._count("partial_hits")
+            data.update(self.parser.extract_taxonomy_fields(entry.raw_text or ""))
+            entry.data = data
+            entry.taxonomy_version = taxonomy_version
+
+        entry.hit_count = (entry.hit_count or 0) + 1
+        self.db.commit()
+
+        data["raw_text"] = entry.raw_text
+        return {"success": True, "data": data}
+
+    def _store(self, file_hash: str, data: Dict):
+        """Save a successful parse result"""
+        entry = ParseCache(
+            file_hash=file_hash,
+            parser_version=self.parser.PARSER_VERSION,
+            taxonomy_version=self.parser.taxonomy_version,
+            data={key: value for key, value in data.items() if key != "raw_text"},
+            raw_text=data["raw_text"],
+            hit_count=0,
+        )
+
+        self.db.add(entry)
+        try:
+            self.db.commit()
+        except IntegrityError:
+            # A concurrent upload of the same file cached it first
+            self.db.rollback()
+
+    @classmethod
+    def _count(cls, counter: str):
+        with cls._lock:
+            cls._counters[counter] += 1
+
+    @classmethod
+    def reset_stats(cls):
+        """Reset in-process hit/miss counters"""
+        with cls._lock:
+            for counter in cls._counters:
+                cls._counters[counter] = 0
+
+    @classmethod
+    def get_stats(cls, db: Session) -> Dict:
+        """Report cache hit rates for this process and entries stored overall"""
+        with cls._lock:
+            counters = dict(cls._counters)
+
+        lookups = sum(counters.values())
+        hits = counters["hits"] + counters["partial_hits"]
+        entries, total_hits = db.query(
+            func.count(ParseCache.id), func.coalesce(func.sum(ParseCache.hit_count), 0)
+        ).one()
+
+        return {
+            **counters,
+            "lookups": lookups,
+            "hit_rate": round(hits / lookups * 100, 2) if lookups else 0.0,
+            "entries": entries,
+            "total_hits": total_hits,
+        }
@@ -0,0 +1,244 @@
+"""Run CV parsing in sandboxed worker processes"""
+
+import logging
+import math
+import multiprocessing
+import queue
+import signal
+import threading
+from typing import Dict, Optional, Type
+
+from app.config import settings
+from app.utils.cv_parser import CVParser
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Workers are forked from a separate single-threaded server process, never
+# from the API process: its other threads (request threadpool, audit writer,
+# password hashing) may hold locks at the moment of a fork
+if "forkserver" in multiprocessing.get_all_start_methods():
+    _context = multiprocessing.get_context("forkserver")
+    _context.set_forkserver_preload([__name__])
+else:  # pragma: no cover - Windows
+    _context = multiprocessing.get_context("spawn")
+
+
+def _set_limit(limit: int, value: int):
+    """Lower a soft resource limit, keeping the hard limit"""
+    _, hard = resource.getrlimit(limit)
+    if hard != resource.RLIM_INFINITY:
+        value = min(value, hard)
+    resource.setrlimit(limit, (value, hard))
+
+
+def _cpu_seconds() -> float:
+    """CPU time used by this process so far"""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _worker_main(
+    conn,
+    memory_limit_mb: int,
+    cpu_limit: float,
+    max_tasks: int,
+    parser_class: Type[CVParser] = CVParser,
+):
+    """Parse files sent over ``conn`` until ``max_tasks`` is reached"""
+    if resource is not None and memory_limit_mb:
+        _set_limit(resource.RLIMIT_AS, memory_limit_mb * 1024 * 1024)
+
+    parser = parser_class()
+    for _ in range(max_tasks):
+        try:
+            file_path, file_type, skills_taxonomy = conn.recv()
+        except EOFError:
+            return
+
+        if resource is not None and cpu_limit:
+            # RLIMIT_CPU is cumulative, so allow cpu_limit more from now on
+            _set_limit(resource.RLIMIT_CPU, math.ceil(_cpu_seconds() + cpu_limit))
+
+        parser.skills_taxonomy = skills_taxonomy
+        conn.send(parser.parse_file(file_path, file_type))
+
+
+class _Worker:
+    """One parser process and the parent's end of its pipe"""
+
+    def __init__(
+        self,
+        memory_limit_mb: int,
+        cpu_limit: float,
+        max_tasks: int,
+        parser_class: Type[CVParser] = CVParser,
+    ):
+        self.conn, child_conn = _context.Pipe()
+        # Arguments are pickled to the worker, so parser_class must be importable
+        self.process = _context.Process(
+            target=_worker_main,
+            args=(child_conn, memory_limit_mb, cpu_limit, max_tasks, parser_class),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.remaining = max_tasks
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def retire(self):
+        """Wait for a worker that has exited after its last task"""
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+
+class ParserWorkerPool:
+    """
+    Fixed-size pool of parser processes with hard per-file limits.
+
+    Each file gets a wall-clock timeout, an address-space cap (RLIMIT_AS) and
+    a CPU-time cap (RLIMIT_CPU). A worker that hangs or dies is killed and
+    replaced, and the file is reported as a failed parse. Workers are
+    recycled after ``max_tasks_per_worker`` files to bound memory growth.
+    Workers parse with a fresh ``parser_class`` instance, which must be
+    importable by name since workers do not share the parent's memory.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        memory_limit_mb: Optional[int] = None,
+        max_tasks_per_worker: Optional[int] = None,
+        parser_class: Type[CVParser] = CVParser,
+    ):
+        self.workers = workers or settings.parser_workers
+        self.timeout = timeout or settings.parser_timeout_seconds
+        self.memory_limit_mb = (
+            memory_limit_mb
+            if memory_limit_mb is not None
+            else settings.parser_memory_limit_mb
+        )
+        self.max_tasks_per_worker = (
+            max_tasks_per_worker or settings.parser_max_tasks_per_worker
+        )
+        self.parser_class = parser_class
+
+        # Idle slots; None means the worker has not been started yet
+        self._idle: "queue.Queue[Optional[_Worker]]" = queue.Queue()
+        for _ in range(self.workers):
+            self._idle.put(None)
+
+    def _start_worker(self) -> _Worker:
+        return _Worker(
+            self.memory_limit_mb,
+            self.timeout,
+            self.max_tasks_per_worker,
+            self.parser_class,
+        )
+
+    def parse_file(self, file_path: str, file_type: str, skills_taxonomy: Dict) -> Dict:
+        """Parse a file in a worker, returning a CVParser.parse_file result"""
+        worker = self._idle.get()
+        try:
+            if worker is None or not worker.process.is_alive():
+                worker = self._start_worker()
+
+            worker.conn.send((file_path, file_type, skills_taxonomy))
+            worker.remaining -= 1
+
+            if not worker.conn.poll(self.timeout):
+                worker.kill()
+                worker = None
+                logger.warning("Parser timed out on %s", file_path)
+                return {
+                    "success": False,
+                    "error": f"Parsing timed out after {self.timeout:g}s",
+                }
+
+            try:
+                result = worker.conn.recv()
+            except EOFError:
+                worker.process.join()
+                error = self._describe_exit(worker.process.exitcode)
+                worker.conn.close()
+                worker = None
+                logger.warning("Parser worker died on %s: %s", file_path, error)
+                return {"success": False, "error": error}
+
+            if worker.remaining <= 0:
+                worker.retire()
+                worker = None
+            return result
+        finally:
+            self._idle.put(worker)
+
+    def _describe_exit(self, exitcode: Optional[int]) -> str:
+        """Explain why a worker process stopped mid-parse"""
+        if exitcode is not None and exitcode < 0:
+            signum = -exitcode
+            if signum == getattr(signal, "SIGXCPU", None):
+                return f"Parsing exceeded the CPU limit of {self.timeout:g}s"
+            return f"Parser worker was killed by {signal.Signals(signum).name}"
+        return f"Parser worker exited unexpectedly (exit code {exitcode})"
+
+    def shutdown(self):
+        """Stop all idle workers"""
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            if worker is not None:
+                worker.kill()
+
+
+class IsolatedCVParser(CVParser):
+    """CVParser whose file parsing runs in the shared sandboxed worker pool"""
+
+    def __init__(self, pool: Optional[ParserWorkerPool] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.pool = pool or get_worker_pool()
+
+    def parse_file(self, file_path: str, file_type: str) -> Dict:
+        """Parse a CV file in a worker process"""
+        return self.pool.parse_file(file_path, file_type, self.skills_taxonomy)
+
+
+_pool: Optional[ParserWorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_worker_pool() -> ParserWorkerPool:
+    """Get the process-wide parser worker pool, creating it on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ParserWorkerPool()
+        return _pool
+
+
+def shutdown_worker_pool():
+    """Stop the process-wide parser worker pool"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
+
+
+def get_parser() -> CVParser:
+    """Parser for API uploads, isolated in worker processes when enabled"""
+    if settings.parser_isolation:
+        return IsolatedCVParser()
+    return CVParser()
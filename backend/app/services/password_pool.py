@@ -0,0 +1,137 @@
+"""Run bcrypt hashing and verification off the event loop"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from app.config import settings
+
+
+class PasswordPoolBusy(Exception):
+    """Raised when too many password operations are already waiting"""
+
+
+class PasswordHashPool:
+    """
+    Bounded thread pool for password hashing.
+
+    bcrypt releases the GIL while it works, so a few threads keep the event
+    loop responsive during a burst of logins. At most ``workers`` hashes run
+    at once and at most ``max_waiting`` more wait for a thread; beyond that
+    ``PasswordPoolBusy`` is raised instead of queueing without bound.
+    """
+
+    def __init__(self, workers: int = None, max_waiting: int = None):
+        self.workers = workers or settings.password_hash_workers
+        self.max_waiting = (
+            settings.password_hash_max_waiting if max_waiting is None else max_waiting
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="password-hash"
+        )
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._running = 0
+        self._counters = {
+            "completed": 0,
+            "rejected": 0,
+            "peak_waiting": 0,
+            "total_wait_ms": 0.0,
+            "max_wait_ms": 0.0,
+            "total_run_ms": 0.0,
+        }
+
+    async def run(self, func: Callable, *args):
+        """Run ``func(*args)`` on a pool thread and await its result"""
+        with self._lock:
+            if self._waiting + self._running >= self.workers + self.max_waiting:
+                self._counters["rejected"] += 1
+                raise PasswordPoolBusy()
+            self._waiting += 1
+            self._counters["peak_waiting"] = max(
+                self._counters["peak_waiting"], self._waiting
+            )
+        submitted = time.perf_counter()
+
+        def task():
+            started = time.perf_counter()
+            with self._lock:
+                self._waiting -= 1
+                self._running += 1
+                wait_ms = (started - submitted) * 1000
+                self._counters["total_wait_ms"] += wait_ms
+                self._counters["max_wait_ms"] = max(
+                    self._counters["max_wait_ms"], wait_ms
+                )
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._counters["completed"] += 1
+                    self._counters["total_run_ms"] += (
+                        time.perf_counter() - started
+                    ) * 1000
+
+        def release_if_cancelled(future):
+            # A queued task cancelled by its awaiter (e.g. a client disconnect)
+            # never runs, so it gives back its waiting slot here
+            if future.cancelled():
+                with self._lock:
+                    self._waiting -= 1
+
+        future = self._executor.submit(task)
+        future.add_done_callback(release_if_cancelled)
+        return await asyncio.wrap_future(future)
+
+    def get_stats(self) -> Dict:
+        """Report concurrency, queueing and timing since the pool started"""
+        with self._lock:
+            counters = dict(self._counters)
+            waiting, running = self._waiting, self._running
+
+        completed = counters["completed"]
+        return {
+            "workers": self.workers,
+            "max_waiting": self.max_waiting,
+            "running": running,
+            "waiting": waiting,
+            "completed": completed,
+            "rejected": counters["rejected"],
+            "peak_waiting": counters["peak_waiting"],
+            "avg_wait_ms": (
+                round(counters["total_wait_ms"] / completed, 2) if completed else 0.0
+            ),
+            "max_wait_ms": round(counters["max_wait_ms"], 2),
+            "avg_run_ms": (
+                round(counters["total_run_ms"] / completed, 2) if completed else 0.0
+            ),
+        }
+
+    def shutdown(self):
+        """Finish running hashes and stop the threads"""
+        self._executor.shutdown(wait=True)
+
+
+_pool: Optional[PasswordHashPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_password_pool() -> PasswordHashPool:
+    """Get the process-wide password hashing pool, creating it on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = PasswordHashPool()
+        return _pool
+
+
+def shutdown_password_pool():
+    """Stop the process-wide password hashing pool"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
@@ -0,0 +1,164 @@
+"""Re-extract taxonomy-dependent candidate fields after a taxonomy change"""
+
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy.orm import Session, load_only
+
+from app.models import Candidate
+from app.services.audit_service import AuditService
+from app.utils.concurrency import bounded_imap_unordered
+from app.utils.cv_parser import CVParser
+
+# Per-process worker state, set up once by _init_worker
+_worker: Dict = {}
+
+
+def _init_worker(skills_taxonomy: Dict):
+    """Create a parser with the current taxonomy once per worker process"""
+    parser = CVParser()
+    parser.skills_taxonomy = skills_taxonomy
+    _worker["parser"] = parser
+
+
+def _reextract_batch(rows: List[Tuple[int, str]]) -> List[Tuple[int, Dict]]:
+    """Run only the taxonomy extractors over stored raw text"""
+    parser: CVParser = _worker["parser"]
+    return [(row_id, parser.extract_taxonomy_fields(text)) for row_id, text in rows]
+
+
+class ReextractionService:
+    """
+    Refresh candidates' skills and languages from their stored ``raw_text``.
+
+    No files are read and no PDFs are parsed: only the taxonomy extractors run,
+    in parallel batches. Candidates whose fields would not change are left
+    untouched, and a per-skill gained/lost report is returned.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        parser: Optional[CVParser] = None,
+        workers: Optional[int] = None,
+        batch_size: int = 1000,
+    ):
+        self.db = db
+        self.parser = parser or CVParser()
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.batch_size = batch_size
+
+    def _iter_batches(self) -> Iterator[List[Tuple[int, str]]]:
+        """Read (id, raw_text) of parsed candidates in keyset-paginated batches"""
+        last_id = 0
+        while True:
+            rows = (
+                self.db.query(Candidate.id, Candidate.raw_text)
+                .filter(Candidate.parse_status == "success")
+                .filter(Candidate.raw_text.isnot(None))
+                .filter(Candidate.id > last_id)
+                .order_by(Candidate.id)
+                .limit(self.batch_size)
+                .all()
+            )
+            if not rows:
+                return
+
+            last_id = rows[-1].id
+            yield [(row.id, row.raw_text) for row in rows]
+
+    def _iter_results(self) -> Iterator[List[Tuple[int, Dict]]]:
+        """Re-extract batches in a process pool, or in-process for workers <= 1"""
+        taxonomy = self.parser.skills_taxonomy
+
+        if self.workers <= 1:
+            _init_worker(taxonomy)
+            yield from map(_reextract_batch, self._iter_batches())
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(taxonomy,),
+        ) as executor:
+            yield from bounded_imap_unordered(
+                executor, _reextract_batch, self._iter_batches(), self.workers * 2
+            )
+
+    def run(self, dry_run: bool = False) -> Dict:
+        """Re-extract all parsed candidates and return a diff report"""
+        started = time.perf_counter()
+        report = {
+            "scanned": 0,
+            "changed": 0,
+            "unchanged": 0,
+            "skills_gained": Counter(),
+            "skills_lost": Counter(),
+            "languages_gained": Counter(),
+            "languages_lost": Counter(),
+        }
+
+        for results in self._iter_results():
+            report["scanned"] += len(results)
+            extracted = dict(results)
+
+            candidates = (
+                self.db.query(Candidate)
+                .options(load_only(Candidate.id, Candidate.skills, Candidate.languages))
+                .filter(Candidate.id.in_(list(extracted)))
+                .all()
+            )
+
+            for candidate in candidates:
+                if self._apply(candidate, extracted[candidate.id], report, dry_run):
+                    report["changed"] += 1
+                else:
+                    report["unchanged"] += 1
+
+            if dry_run:
+                self.db.rollback()
+            else:
+                self.db.commit()
+            self.db.expunge_all()
+
+        report = {
+            key: dict(value.most_common()) if isinstance(value, Counter) else value
+            for key, value in report.items()
+        }
+        report["taxonomy_version"] = self.parser.taxonomy_version
+        report["dry_run"] = dry_run
+        report["elapsed_seconds"] = round(time.perf_counter() - started, 2)
+
+        if not dry_run:
+            AuditService.log_action(
+                db=self.db,
+                action="taxonomy_reextracted",
+                details={
+                    key: report[key]
+                    for key in ("scanned", "changed", "taxonomy_version")
+                },
+            )
+
+        return report
+
+    @staticmethod
+    def _apply(candidate: Candidate, fields: Dict, report: Dict, dry_run: bool):
+        """Update a candidate if its taxonomy fields changed, recording the diff"""
+        changed = False
+
+        for field in CVParser.TAXONOMY_FIELDS:
+            old = set(getattr(candidate, field) or [])
+            new = set(fields[field])
+            if old == new:
+                continue
+
+            changed = True
+            report[f"{field}_gained"].update(new - old)
+            report[f"{field}_lost"].update(old - new)
+            if not dry_run:
+                setattr(candidate, field, fields[field])
+
+        return changed
@@ -0,0 +1,239 @@
+"""Ranked full-text search over candidates"""
+
+import html
+import re
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import Float, bindparam, column, text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models import Candidate
+from app.utils.pagination import decode_cursor, encode_cursor
+
+# Cursor sort key: ascending score (lower is more relevant), then candidate id
+SEARCH_ORDER = (column("score", Float), Candidate.id)
+
+# Response header set when search_rank_window left matches unranked
+SEARCH_WINDOWED_HEADER = "X-Search-Windowed"
+
+SNIPPET_START = "<mark>"
+SNIPPET_END = "</mark>"
+SNIPPET_WORDS = 16
+# Highlight delimiters asked of the database: control characters rather
+# than markup, so the CV text can be HTML-escaped before the marks go in
+SNIPPET_START_RAW = "\x02"
+SNIPPET_END_RAW = "\x03"
+
+# bm25() scores are negative, lower meaning more relevant
+SQLITE_RANK = "bm25(candidates_fts, 10.0, 5.0, 1.0)"
+SQLITE_PAGE = f"""
+    SELECT rowid AS id, {SQLITE_RANK} AS score FROM candidates_fts
+    WHERE candidates_fts MATCH :query {{window}} {{after}}
+    ORDER BY score, id LIMIT :limit
+"""
+SQLITE_WINDOW = """
+    AND rowid >= (SELECT min(rowid) FROM (
+        SELECT rowid FROM candidates_fts WHERE candidates_fts MATCH :query
+        ORDER BY rowid DESC LIMIT :window
+    ))
+"""
+SQLITE_WINDOWED = """
+    SELECT count(*) FROM (
+        SELECT rowid FROM candidates_fts WHERE candidates_fts MATCH :query
+        LIMIT :window + 1
+    )
+"""
+SQLITE_AFTER = f"AND ({SQLITE_RANK}, rowid) > (:score, :id)"
+SQLITE_SNIPPETS = text(f"""
+    SELECT rowid AS id,
+        snippet(candidates_fts, 2, :start, :end, '…', {SNIPPET_WORDS}) AS snippet
+    FROM candidates_fts
+    WHERE candidates_fts MATCH :query AND rowid IN :ids
+    """).bindparams(bindparam("ids", expanding=True))
+
+# Negated so that, as with bm25(), lower scores are more relevant
+POSTGRESQL_PAGE = """
+    SELECT id, score FROM (
+        SELECT id, -ts_rank_cd(search_vector, query) AS score
+        FROM candidates, plainto_tsquery('english', :query) AS query
+        WHERE search_vector @@ query {window}
+    ) AS matches
+    WHERE TRUE {after}
+    ORDER BY score, id LIMIT :limit
+"""
+POSTGRESQL_WINDOW = """
+    AND id >= (SELECT min(id) FROM (
+        SELECT id FROM candidates
+        WHERE search_vector @@ plainto_tsquery('english', :query)
+        ORDER BY id DESC LIMIT :window
+    ) AS recent)
+"""
+POSTGRESQL_WINDOWED = """
+    SELECT count(*) FROM (
+        SELECT id FROM candidates
+        WHERE search_vector @@ plainto_tsquery('english', :query)
+        LIMIT :window + 1
+    ) AS matches
+"""
+POSTGRESQL_AFTER = "AND (score, id) > (:score, :id)"
+POSTGRESQL_SNIPPETS = f"""
+    SELECT ts_headline('english', document, plainto_tsquery('english', :query),
+        :options)
+    FROM unnest(CAST(:documents AS text[])) WITH ORDINALITY AS d(document, n)
+    ORDER BY n
+"""
+
+
+POSTGRESQL_SNIPPET_OPTIONS = (
+    f"StartSel={SNIPPET_START_RAW}, StopSel={SNIPPET_END_RAW}, "
+    f"MaxWords={SNIPPET_WORDS}, MinWords={SNIPPET_WORDS // 2}"
+)
+
+
+def highlight(snippet: Optional[str]) -> Optional[str]:
+    """
+    HTML-escape a snippet of CV text and mark its matches.
+
+    CV text is user content, so only the ``<mark>`` tags added here are
+    markup; anything else in the snippet is returned as escaped text.
+    """
+    if snippet is None:
+        return None
+    return (
+        html.escape(snippet)
+        .replace(SNIPPET_START_RAW, SNIPPET_START)
+        .replace(SNIPPET_END_RAW, SNIPPET_END)
+    )
+
+
+class SearchService:
+    """
+    Search candidates by name, skills and CV text.
+
+    Results are ordered by relevance (name matches weigh most, then skills,
+    then CV text) and paged with an opaque cursor over (score, id). Ranking
+    costs time per matching candidate, so queries matching more than
+    ``settings.search_rank_window`` candidates are ranked within their newest
+    matches only, and ``windowed`` tells whether the last search left older
+    matches out. A window of 0 ranks every match.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.dialect = db.get_bind().dialect.name
+        self.windowed = False
+
+    @staticmethod
+    def terms(query: str) -> List[str]:
+        """Split a free-text query into the words to match"""
+        return re.findall(r"\w+", query.lower())
+
+    def search(
+        self, query: str, cursor: Optional[str] = None, limit: int = 20
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Find candidates matching every word of ``query``.
+
+        Returns the page of results (candidate, score, snippet) and the cursor
+        for the next page, or None when there are no more results.
+        """
+        terms = self.terms(query)
+        if not terms:
+            return [], None
+
+        after = decode_cursor(cursor, SEARCH_ORDER) if cursor else None
+        if self.dialect == "postgresql":
+            search_query = " ".join(terms)
+            page, window, windowed, after_clause = (
+                POSTGRESQL_PAGE,
+                POSTGRESQL_WINDOW,
+                POSTGRESQL_WINDOWED,
+                POSTGRESQL_AFTER,
+            )
+        else:
+            # Quote each word so user input cannot inject FTS5 query syntax
+            search_query = " ".join(f'"{term}"' for term in terms)
+            page, window, windowed, after_clause = (
+                SQLITE_PAGE,
+                SQLITE_WINDOW,
+                SQLITE_WINDOWED,
+                SQLITE_AFTER,
+            )
+
+        params = {"query": search_query, "limit": limit}
+        self.windowed = False
+        if settings.search_rank_window:
+            params["window"] = settings.search_rank_window
+            self.windowed = (
+                self.db.execute(text(windowed), params).scalar()
+                > settings.search_rank_window
+            )
+        else:
+            window = ""
+        if after is not None:
+            params.update(score=after[0], id=after[1])
+        else:
+            after_clause = ""
+        rows = self.db.execute(
+            text(page.format(window=window, after=after_clause)), params
+        )
+        matches = [(row.id, row.score) for row in rows]
+        if not matches:
+            return [], None
+
+        ids = [candidate_id for candidate_id, _ in matches]
+        candidates = {
+            candidate.id: candidate
+            for candidate in self.db.query(Candidate).filter(Candidate.id.in_(ids))
+        }
+        if self.dialect == "postgresql":
+            snippets = self._postgresql_snippets(search_query, ids)
+        else:
+            snippets = {
+                row.id: row.snippet
+                for row in self.db.execute(
+                    SQLITE_SNIPPETS,
+                    {
+                        "query": search_query,
+                        "ids": ids,
+                        "start": SNIPPET_START_RAW,
+                        "end": SNIPPET_END_RAW,
+                    },
+                )
+            }
+
+        results = [
+            {
+                "candidate": candidates[candidate_id],
+                "score": -score,
+                "snippet": highlight(snippets.get(candidate_id)),
+            }
+            for candidate_id, score in matches
+            if candidate_id in candidates
+        ]
+        next_cursor = None
+        if len(matches) >= limit:
+            last_id, last_score = matches[-1]
+            next_cursor = encode_cursor([last_score, last_id])
+        return results, next_cursor
+
+    def _postgresql_snippets(self, query: str, ids: List[int]) -> Dict[int, str]:
+        # raw_text is stored compressed, so ts_headline gets the decompressed text
+        documents = (
+            self.db.query(Candidate.id, Candidate.raw_text)
+            .filter(Candidate.id.in_(ids))
+            .all()
+        )
+        rows = self.db.execute(
+            text(POSTGRESQL_SNIPPETS),
+            {
+                "query": query,
+                "options": POSTGRESQL_SNIPPET_OPTIONS,
+                "documents": [raw_text or "" for _, raw_text in documents],
+            },
+        )
+        return {
+            candidate_id: snippet
+            for (candidate_id, _), (snippet,) in zip(documents, rows)
+        }
@@ -0,0 +1,210 @@
+"""Content-addressed storage for uploaded CV files"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager, nullcontext
+from typing import BinaryIO, Dict, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models import Candidate
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+CHUNK_SIZE = 1024 * 1024  # 1MB
+
+
+class StorageService:
+    """
+    Store CV files by SHA-256 of their content.
+
+    Blobs are sharded by hash prefix (``cvs/ab/cd/<sha256>.<ext>``) so identical
+    uploads share one file. Candidates reference blobs through ``file_hash`` and
+    ``file_path``; a blob is only unlinked once no candidate points at it.
+
+    A blob stored for a candidate that is not committed yet has no reference
+    to count, so ``store`` also returns a pin: a hard link keeping the blob's
+    content until ``unpin`` is called after the commit. Storing, releasing
+    and unpinning a blob hold a lock on its hash, shared across processes.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or os.path.join(settings.storage_path, "cvs")
+        self.tmp_dir = os.path.join(self.root, ".tmp")
+        self.lock_dir = os.path.join(self.root, ".locks")
+
+    def blob_path(self, file_hash: str, file_ext: str) -> str:
+        """Return the sharded path for a blob"""
+        return os.path.join(
+            self.root, file_hash[:2], file_hash[2:4], f"{file_hash}.{file_ext}"
+        )
+
+    @contextmanager
+    def _blob_lock(self, file_hash: str):
+        """Hold the lock for a blob, one lock file per two-character prefix"""
+        if fcntl is None:  # pragma: no cover - single-process fallback
+            yield
+            return
+
+        os.makedirs(self.lock_dir, exist_ok=True)
+        with open(os.path.join(self.lock_dir, f"{file_hash[:2]}.lock"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def store(self, source: BinaryIO, file_ext: str) -> Tuple[str, str, str]:
+        """
+        Stream a file into the store and return (file_hash, file_path, pin).
+
+        Pass the pin to ``unpin`` once the candidate referencing the blob has
+        been committed, or its insert has failed.
+        """
+        os.makedirs(self.tmp_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.tmp_dir)
+        pin = f"{tmp_path}.pin"
+        hasher = hashlib.sha256()
+
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+                    tmp_file.write(chunk)
+
+            file_hash = hasher.hexdigest()
+            file_path = self.blob_path(file_hash, file_ext)
+            with self._blob_lock(file_hash):
+                # Identical content reuses the existing blob
+                if not os.path.exists(file_path):
+                    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                    os.link(tmp_path, file_path)
+                os.link(file_path, pin)
+            return file_hash, file_path, pin
+        finally:
+            os.remove(tmp_path)
+
+    def store_file(self, source_path: str, file_ext: str) -> Tuple[str, str, str]:
+        """Copy an existing file into the store"""
+        with open(source_path, "rb") as source:
+            return self.store(source, file_ext)
+
+    def unpin(
+        self, file_hash: str, file_path: str, pin: str, restore: bool = True
+    ) -> None:
+        """
+        Drop a pin taken by ``store``.
+
+        With ``restore``, a blob released while pinned is put back first, as
+        the candidate now committed references it.
+        """
+        with self._blob_lock(file_hash):
+            if restore and not os.path.exists(file_path):
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                os.link(pin, file_path)
+            os.remove(pin)
+
+    @staticmethod
+    def hash_file(file_path: str) -> str:
+        """Compute the SHA-256 of a file without loading it into memory"""
+        hasher = hashlib.sha256()
+        with open(file_path, "rb") as source:
+            for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    @staticmethod
+    def reference_count(
+        db: Session, file_path: str, file_hash: Optional[str] = None
+    ) -> int:
+        """Count candidates referencing a stored file"""
+        query = db.query(func.count(Candidate.id)).filter(
+            Candidate.file_path == file_path
+        )
+        if file_hash:
+            query = query.filter(Candidate.file_hash == file_hash)
+        return query.scalar()
+
+    def release(
+        self, db: Session, file_hash: Optional[str], file_path: Optional[str]
+    ) -> bool:
+        """
+        Unlink a stored file once nothing references it anymore.
+
+        Must be called after the referencing candidate has been deleted and
+        committed. Returns True if the file was removed.
+        """
+        if not file_path or not os.path.exists(file_path):
+            return False
+
+        # Pre-migration candidates may point at files outside the store
+        if not file_hash and not self._is_legacy_upload(file_path):
+            return False
+
+        with self._blob_lock(file_hash) if file_hash else nullcontext():
+            if self.reference_count(db, file_path, file_hash) > 0:
+                return False
+
+            os.remove(file_path)
+            return True
+
+    def _is_legacy_upload(self, file_path: str) -> bool:
+        """Check if a path is a flat, pre-content-addressing upload"""
+        return os.path.dirname(os.path.abspath(file_path)) == os.path.abspath(self.root)
+
+    def migrate_legacy_files(self, db: Session, dry_run: bool = False) -> Dict:
+        """
+        Move files referenced by pre-migration candidates into the store.
+
+        Flat uploads under ``cvs/`` are moved; files elsewhere (e.g. sample
+        data) are copied so the originals stay untouched.
+        """
+        stats = {"candidates": 0, "files": 0, "missing": 0, "deduplicated": 0}
+        legacy = (
+            db.query(Candidate)
+            .filter(Candidate.file_hash.is_(None))
+            .filter(Candidate.file_path.isnot(None))
+            .order_by(Candidate.id)
+            .all()
+        )
+
+        by_path: Dict[str, list] = {}
+        for candidate in legacy:
+            by_path.setdefault(candidate.file_path, []).append(candidate)
+
+        for old_path, candidates in by_path.items():
+            if not os.path.exists(old_path):
+                stats["missing"] += len(candidates)
+                continue
+
+            file_ext = (candidates[0].file_type or old_path.rsplit(".", 1)[-1]).lower()
+            file_hash = self.hash_file(old_path)
+            new_path = self.blob_path(file_hash, file_ext)
+
+            if os.path.exists(new_path):
+                stats["deduplicated"] += 1
+
+            stats["files"] += 1
+            stats["candidates"] += len(candidates)
+
+            if dry_run:
+                continue
+
+            if not os.path.exists(new_path):
+                os.makedirs(os.path.dirname(new_path), exist_ok=True)
+                shutil.copy2(old_path, new_path)
+
+            for candidate in candidates:
+                candidate.file_hash = file_hash
+                candidate.file_path = new_path
+
+            db.commit()
+
+            if self._is_legacy_upload(old_path):
+                os.remove(old_path)
+
+        return stats
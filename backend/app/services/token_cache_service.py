@@ -0,0 +1,68 @@
+"""In-process cache of verified access tokens"""
+
+import hashlib
+import threading
+import time
+from typing import Dict, Optional
+
+from app.config import settings
+from app.utils.cache import ExpiringLRUCache
+
+
+class TokenCacheService:
+    """
+    LRU cache of JWTs whose signature has already been verified.
+
+    Keyed by a SHA-256 of the token, holding its subject and ``exp``; an entry
+    is never served past its expiry. Entries belong to the signing key and
+    algorithm they were verified with, and the whole cache is purged when
+    either changes.
+    """
+
+    _cache = ExpiringLRUCache()
+    _key_lock = threading.Lock()
+    _key_fingerprint: Optional[str] = None
+
+    @staticmethod
+    def _hash(value: str) -> str:
+        return hashlib.sha256(value.encode()).hexdigest()
+
+    @classmethod
+    def _check_key(cls):
+        """Purge everything verified with a previous secret"""
+        fingerprint = cls._hash(f"{settings.algorithm}:{settings.secret_key}")
+        with cls._key_lock:
+            if fingerprint != cls._key_fingerprint:
+                cls._cache.clear()
+                cls._key_fingerprint = fingerprint
+
+    @classmethod
+    def get(cls, token: str) -> Optional[str]:
+        """Return the subject of a verified, unexpired token"""
+        cls._check_key()
+        return cls._cache.get(cls._hash(token), time.time())
+
+    @classmethod
+    def put(cls, token: str, subject: str, expires_at: Optional[float]):
+        """Remember a token that passed verification"""
+        # Tokens without an expiry are verified every time
+        if settings.token_cache_size <= 0 or expires_at is None:
+            return
+
+        cls._check_key()
+        cls._cache.put(cls._hash(token), subject, expires_at, settings.token_cache_size)
+
+    @classmethod
+    def clear(cls):
+        """Drop every cached token"""
+        cls._cache.clear()
+
+    @classmethod
+    def reset_stats(cls):
+        """Reset in-process hit/miss counters"""
+        cls._cache.reset_stats()
+
+    @classmethod
+    def get_stats(cls) -> Dict:
+        """Report the cache hit rate for this process"""
+        return cls._cache.get_stats()
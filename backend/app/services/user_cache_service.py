@@ -0,0 +1,66 @@
+"""In-process cache of authenticated users"""
+
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import inspect
+
+from app.config import settings
+from app.models import User
+from app.utils.cache import ExpiringLRUCache
+
+
+class UserCacheService:
+    """
+    TTL + LRU cache of active users keyed by token subject (email).
+
+    Saves the ``users`` lookup on every authenticated request. Entries are
+    detached copies, so they are safe to share between sessions and threads.
+    User updates and deletes through the API invalidate the entry in this
+    process; changes made elsewhere (another worker, raw SQL) are picked up
+    once the entry expires, after at most ``user_cache_ttl_seconds``.
+    """
+
+    _cache = ExpiringLRUCache()
+
+    @classmethod
+    def get(cls, email: str) -> Optional[User]:
+        """Return the cached user for a token subject, if fresh"""
+        return cls._cache.get(email, time.monotonic())
+
+    @classmethod
+    def put(cls, user: User) -> User:
+        """Cache a detached copy of an active user and return it"""
+        copy = User(
+            **{attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+        )
+        if settings.user_cache_ttl_seconds <= 0 or not user.is_active:
+            return copy
+
+        cls._cache.put(
+            user.email,
+            copy,
+            time.monotonic() + settings.user_cache_ttl_seconds,
+            settings.user_cache_size,
+        )
+        return copy
+
+    @classmethod
+    def invalidate(cls, email: str):
+        """Drop a user whose record changed"""
+        cls._cache.pop(email)
+
+    @classmethod
+    def clear(cls):
+        """Drop every cached user"""
+        cls._cache.clear()
+
+    @classmethod
+    def reset_stats(cls):
+        """Reset in-process hit/miss counters"""
+        cls._cache.reset_stats()
+
+    @classmethod
+    def get_stats(cls) -> Dict:
+        """Report the cache hit rate for this process"""
+        return cls._cache.get_stats()
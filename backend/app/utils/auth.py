@@ -7,15 +7,22 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.database import get_db
 from app.models import User
 from app.schemas import TokenData
+from app.services.password_pool import get_password_pool
+from app.services.token_cache_service import TokenCacheService
+from app.services.user_cache_service import UserCacheService
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context; hashes with other bcrypt rounds are rehashed on login
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.bcrypt_rounds
+)
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
@@ -31,6 +38,11 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on the password hashing pool"""
+    return await get_password_pool().run(get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token"""
     to_encode = data.copy()
@@ -51,7 +63,11 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 
 def decode_access_token(token: str) -> TokenData:
-    """Decode and validate a JWT token"""
+    """Decode and validate a JWT token (verified tokens are cached)"""
+    email = TokenCacheService.get(token)
+    if email is not None:
+        return TokenData(email=email)
+
     try:
         payload = jwt.decode(
             token, settings.secret_key, algorithms=[settings.algorithm]
@@ -64,6 +80,7 @@ def decode_access_token(token: str) -> TokenData:
                 detail="Could not validate credentials",
             )
 
+        TokenCacheService.put(token, email, payload.get("exp"))
         return TokenData(email=email)
 
     except JWTError:
@@ -73,20 +90,24 @@ def decode_access_token(token: str) -> TokenData:
         )
 
 
-async def get_current_user(
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
 ) -> User:
-    """Get the current authenticated user"""
+    """Get the current authenticated user (cached; see UserCacheService)"""
     token = credentials.credentials
     token_data = decode_access_token(token)
 
-    user = db.query(User).filter(User.email == token_data.email).first()
-
+    user = UserCacheService.get(token_data.email)
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
-        )
+        user = db.query(User).filter(User.email == token_data.email).first()
+
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
+            )
+
+        user = UserCacheService.put(user)
 
     if not user.is_active:
         raise HTTPException(
@@ -108,14 +129,29 @@ async def get_current_admin_user(
     return current_user
 
 
-def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
-    """Authenticate a user with email and password"""
-    user = db.query(User).filter(User.email == email).first()
+async def authenticate_user(
+    db: AsyncSession, email: str, password: str
+) -> Optional[User]:
+    """
+    Authenticate a user with email and password
+
+    bcrypt runs on the password hashing pool (which raises PasswordPoolBusy
+    when full) and the queries on the async session, so neither blocks the
+    event loop. A hash made with outdated cost parameters is replaced.
+    """
+    user = await db.scalar(select(User).where(User.email == email))
 
     if not user:
         return None
 
-    if not verify_password(password, user.hashed_password):
+    valid, new_hash = await get_password_pool().run(
+        pwd_context.verify_and_update, password, user.hashed_password
+    )
+    if not valid:
         return None
 
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.commit()
+
     return user
@@ -0,0 +1,72 @@
+"""In-process cache with per-entry expiry and LRU eviction"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class ExpiringLRUCache:
+    """
+    Thread-safe map whose entries expire at a given time and are evicted
+    least recently used first once ``max_size`` is exceeded.
+
+    Times are passed in by the caller, so each cache picks its own clock
+    (monotonic for TTLs, wall time for token expiries). Hits and misses are
+    counted for ``get_stats``.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._counters = {"hits": 0, "misses": 0}
+
+    def get(self, key: Hashable, now: float) -> Optional[Any]:
+        """Return the value for ``key`` if it has not expired by ``now``"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._counters["hits"] += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self._counters["misses"] += 1
+            return None
+
+    def put(self, key: Hashable, value: Any, expires_at: float, max_size: int):
+        """Store ``value`` until ``expires_at``, evicting beyond ``max_size``"""
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable):
+        """Drop one entry, if present"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def reset_stats(self):
+        """Reset hit/miss counters"""
+        with self._lock:
+            for counter in self._counters:
+                self._counters[counter] = 0
+
+    def get_stats(self) -> Dict:
+        """Report hits, misses and the hit rate since the last reset"""
+        with self._lock:
+            counters = dict(self._counters)
+            entries = len(self._entries)
+
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            **counters,
+            "lookups": lookups,
+            "hit_rate": round(counters["hits"] / lookups * 100, 2) if lookups else 0.0,
+            "entries": entries,
+        }
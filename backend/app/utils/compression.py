@@ -0,0 +1,162 @@
+"""Text compression helpers for large stored columns"""
+
+import zlib
+from contextlib import nullcontext
+from typing import Dict, Optional, Union
+
+from sqlalchemy import LargeBinary, bindparam, text
+from sqlalchemy.engine import Connection, Engine
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard is optional
+    zstandard = None
+
+# One-byte codec prefix so values stay readable if the preferred codec changes
+CODEC_STORED = b"\x00"
+CODEC_ZLIB = b"\x01"
+CODEC_ZSTD = b"\x02"
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def default_codec() -> bytes:
+    """Use zstd when installed, otherwise zlib"""
+    return CODEC_ZSTD if zstandard is not None else CODEC_ZLIB
+
+
+def compress_text(text: str, codec: Optional[bytes] = None) -> bytes:
+    """Compress text, storing it as-is when compression would not save space"""
+    data = text.encode("utf-8")
+    codec = codec or default_codec()
+
+    if codec == CODEC_ZSTD:
+        compressed = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    elif codec == CODEC_ZLIB:
+        compressed = zlib.compress(data, ZLIB_LEVEL)
+    else:
+        return CODEC_STORED + data
+
+    if len(compressed) >= len(data):
+        return CODEC_STORED + data
+    return codec + compressed
+
+
+def decompress_text(value: Union[bytes, memoryview]) -> str:
+    """Decompress a value produced by compress_text"""
+    value = bytes(value)
+    codec, data = value[:1], value[1:]
+
+    if codec == CODEC_STORED:
+        return data.decode("utf-8")
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(data).decode("utf-8")
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd-compressed text")
+        return zstandard.ZstdDecompressor().decompress(data).decode("utf-8")
+    raise ValueError(f"Unknown compression codec: {codec!r}")
+
+
+def is_compressed(value) -> bool:
+    """Whether a raw column value is already in compressed form"""
+    return isinstance(value, (bytes, memoryview)) and bytes(value[:1]) in (
+        CODEC_ZLIB,
+        CODEC_ZSTD,
+    )
+
+
+def _transaction(bind: Union[Engine, Connection]):
+    """A transaction per batch on an engine; a connection's own otherwise"""
+    return bind.begin() if isinstance(bind, Engine) else nullcontext(bind)
+
+
+def _column_statements(table: str, column: str):
+    select = text(
+        f"SELECT id, {column} FROM {table} "
+        f"WHERE id > :last_id AND {column} IS NOT NULL ORDER BY id LIMIT :limit"
+    )
+    update = text(f"UPDATE {table} SET {column} = :value WHERE id = :id").bindparams(
+        bindparam("value", type_=LargeBinary)
+    )
+    return select, update
+
+
+def compress_column(
+    bind: Union[Engine, Connection],
+    table: str,
+    column: str,
+    batch_size: int = 500,
+    dry_run: bool = False,
+) -> Dict:
+    """
+    Rewrite plain-text values of an existing column in compressed form
+
+    With an engine every batch commits on its own; with a connection (as in
+    a migration) the caller's transaction covers them all.
+    """
+    stats = {"rows": 0, "compressed": 0, "bytes_before": 0, "bytes_after": 0}
+    select, update = _column_statements(table, column)
+
+    last_id = 0
+    while True:
+        with _transaction(bind) as connection:
+            rows = connection.execute(
+                select, {"last_id": last_id, "limit": batch_size}
+            ).fetchall()
+            if not rows:
+                return stats
+
+            last_id = rows[-1][0]
+            updates = []
+            for row_id, value in rows:
+                stats["rows"] += 1
+                if is_compressed(value):
+                    continue
+
+                plain = value if isinstance(value, str) else decompress_text(value)
+                compressed = compress_text(plain)
+                if compressed == value:
+                    continue
+
+                stats["compressed"] += 1
+                stats["bytes_before"] += len(plain.encode("utf-8"))
+                stats["bytes_after"] += len(compressed)
+                updates.append({"id": row_id, "value": compressed})
+
+            if updates and not dry_run:
+                connection.execute(update, updates)
+
+
+def decompress_column(
+    bind: Union[Engine, Connection], table: str, column: str, batch_size: int = 500
+) -> int:
+    """
+    Rewrite compressed values of a column in uncompressed (stored) form
+
+    The reverse of ``compress_column``, leaving a one-byte codec prefix that
+    a TEXT conversion strips. Returns the number of rows rewritten.
+    """
+    select, update = _column_statements(table, column)
+    rewritten, last_id = 0, 0
+    while True:
+        with _transaction(bind) as connection:
+            rows = connection.execute(
+                select, {"last_id": last_id, "limit": batch_size}
+            ).fetchall()
+            if not rows:
+                return rewritten
+
+            last_id = rows[-1][0]
+            updates = [
+                {
+                    "id": row_id,
+                    "value": compress_text(decompress_text(value), CODEC_STORED),
+                }
+                for row_id, value in rows
+                if is_compressed(value)
+            ]
+            if updates:
+                connection.execute(update, updates)
+                rewritten += len(updates)
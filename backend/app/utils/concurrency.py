@@ -0,0 +1,41 @@
+"""Concurrency helpers shared by batch jobs"""
+
+from concurrent.futures import FIRST_COMPLETED, Executor, wait
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_EXHAUSTED = object()
+
+
+def bounded_imap_unordered(
+    executor: Executor,
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_in_flight: int,
+) -> Iterator[R]:
+    """
+    Map ``func`` over ``items`` in an executor, yielding results as they finish.
+
+    Unlike ``Executor.map`` the input is consumed lazily, so at most
+    ``max_in_flight`` items (and their results) are held in memory at once.
+    """
+    items = iter(items)
+    in_flight = set()
+    exhausted = False
+
+    while True:
+        while not exhausted and len(in_flight) < max_in_flight:
+            item = next(items, _EXHAUSTED)
+            if item is _EXHAUSTED:
+                exhausted = True
+            else:
+                in_flight.add(executor.submit(func, item))
+
+        if not in_flight:
+            return
+
+        finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in finished:
+            yield future.result()
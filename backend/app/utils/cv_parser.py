@@ -1,20 +1,134 @@
 """CV parsing utilities - Extract information from PDF, DOCX, and TXT files"""
 
+import hashlib
 import json
+import logging
 import os
 import re
-from typing import Dict, List, Optional, Tuple
+import time
+import zipfile
+from contextlib import contextmanager
+from functools import cached_property
+from typing import Dict, Iterator, List, Optional, Union
+from xml.etree import ElementTree
 
 import docx
+import pdfplumber
 import PyPDF2
 
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Patterns are compiled once at import instead of on every extractor call
+EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+PHONE_PATTERNS = (
+    re.compile(r"\+?1?\d{9,15}"),  # International format
+    re.compile(r"\(\d{3}\)\s*\d{3}-\d{4}"),  # (123) 456-7890
+    re.compile(r"\d{3}-\d{3}-\d{4}"),  # 123-456-7890
+)
+NAME_CLEAN_PATTERN = re.compile(r"[^a-zA-Z\s]")
+
+# Applied to lowercased text
+EXPERIENCE_PATTERNS = (
+    re.compile(r"(\d+)\+?\s*years?\s+(?:of\s+)?experience"),
+    re.compile(r"experience[:\s]+(\d+)\+?\s*years?"),
+)
+YEAR_RANGE_PATTERN = re.compile(r"(20\d{2})\s*(?:[-–]|to)\s*(20\d{2}|present|current)")
+
+EDUCATION_KEYWORDS = (
+    "bachelor",
+    "master",
+    "phd",
+    "doctorate",
+    "mba",
+    "b.sc",
+    "m.sc",
+    "university",
+    "college",
+    "degree",
+    "diploma",
+)
+EDUCATION_PATTERN = re.compile("|".join(map(re.escape, EDUCATION_KEYWORDS)))
+
+# WordprocessingML elements read by the streaming DOCX extractor
+DOCX_DOCUMENT = "word/document.xml"
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_BODY = W_NS + "body"
+W_PARAGRAPH = W_NS + "p"
+W_TEXT = W_NS + "t"
+W_BREAKS = {W_NS + "tab": "\t", W_NS + "br": "\n", W_NS + "cr": "\n"}
+# Subtrees without document text: paragraph properties (tab stops are w:tab
+# too) and alternate renderings of content already read (e.g. text boxes)
+DOCX_SKIPPED = {
+    W_NS + "pPr",
+    "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback",
+}
+
+DEFAULT_LANGUAGES = [
+    "English",
+    "Spanish",
+    "French",
+    "German",
+    "Chinese",
+    "Japanese",
+    "Arabic",
+    "Russian",
+    "Portuguese",
+    "Italian",
+    "Hebrew",
+]
+
+
+class CVDocument:
+    """CV text normalized once and shared by all extractors"""
+
+    def __init__(self, text: str):
+        self.text = text
+
+    @cached_property
+    def lower(self) -> str:
+        """Lowercased full text"""
+        return self.text.lower()
+
+    @cached_property
+    def lines(self) -> List[str]:
+        """Lines of the stripped text"""
+        return self.text.strip().split("\n")
+
+    @cached_property
+    def lower_lines(self) -> List[str]:
+        """Lines of the stripped, lowercased text"""
+        return self.lower.strip().split("\n")
+
+
+def as_document(text: Union[str, CVDocument]) -> CVDocument:
+    """Wrap raw text so extractors can be called with either form"""
+    return text if isinstance(text, CVDocument) else CVDocument(text)
+
 
 class CVParser:
     """Parse CV files and extract structured information"""
 
-    def __init__(self, skills_taxonomy_path: str = "./data/skills_taxonomy.json"):
-        """Initialize parser with skills taxonomy"""
+    # Bump when extraction logic changes so cached parse results are discarded
+    PARSER_VERSION = "1.2"
+
+    # Fields that depend on the skills taxonomy rather than only on the text
+    TAXONOMY_FIELDS = ("skills", "languages")
+
+    def __init__(
+        self,
+        skills_taxonomy_path: str = "./data/skills_taxonomy.json",
+        pdf_max_pages: Optional[int] = None,
+        pdf_max_chars: Optional[int] = None,
+        pdf_time_budget: Optional[float] = None,
+    ):
+        """Initialize parser with skills taxonomy and PDF extraction budget"""
         self.skills_taxonomy = self._load_skills_taxonomy(skills_taxonomy_path)
+        self.pdf_max_pages = pdf_max_pages or settings.pdf_max_pages
+        self.pdf_max_chars = pdf_max_chars or settings.pdf_max_chars
+        self.pdf_time_budget = pdf_time_budget or settings.pdf_time_budget_seconds
+        self.last_extraction_stats: Optional[Dict] = None
 
     def _load_skills_taxonomy(self, path: str) -> Dict:
         """Load skills taxonomy from JSON file"""
@@ -23,6 +137,12 @@ class CVParser:
                 return json.load(f)
         return {"technical": [], "soft": [], "languages": []}
 
+    @property
+    def taxonomy_version(self) -> str:
+        """Fingerprint of the loaded skills taxonomy"""
+        payload = json.dumps(self.skills_taxonomy, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()[:16]
+
     def parse_file(self, file_path: str, file_type: str) -> Dict:
         """Parse a CV file and extract structured information"""
         try:
@@ -33,22 +153,38 @@ class CVParser:
                 return {"success": False, "error": "Could not extract text from file"}
 
             # Extract structured information
-            data = {
-                "name": self._extract_name(text),
-                "email": self._extract_email(text),
-                "phone": self._extract_phone(text),
-                "education": self._extract_education(text),
-                "years_of_experience": self._estimate_experience(text),
-                "skills": self._extract_skills(text),
-                "languages": self._extract_languages(text),
-                "raw_text": text,
-            }
+            data = self.extract_fields(text)
 
             return {"success": True, "data": data}
 
+        except MemoryError:
+            return {"success": False, "error": "Ran out of memory while parsing file"}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def extract_fields(self, text: str) -> Dict:
+        """Run every extractor over a single shared normalization of the text"""
+        document = CVDocument(text)
+
+        return {
+            "name": self._extract_name(document),
+            "email": self._extract_email(document),
+            "phone": self._extract_phone(document),
+            "education": self._extract_education(document),
+            "years_of_experience": self._estimate_experience(document),
+            **self.extract_taxonomy_fields(document),
+            "raw_text": text,
+        }
+
+    def extract_taxonomy_fields(self, text: Union[str, CVDocument]) -> Dict:
+        """Extract only the fields that depend on the skills taxonomy"""
+        document = as_document(text)
+
+        return {
+            "skills": self._extract_skills(document),
+            "languages": self._extract_languages(document),
+        }
+
     def _extract_text(self, file_path: str, file_type: str) -> str:
         """Extract text from file based on type"""
         if file_type == "pdf":
@@ -61,102 +197,202 @@ class CVParser:
             raise ValueError(f"Unsupported file type: {file_type}")
 
     def _extract_from_pdf(self, file_path: str) -> str:
-        """Extract text from PDF file"""
-        text = ""
-        with open(file_path, "rb") as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                text += page.extract_text()
+        """Extract text from PDF file, falling back to pdfplumber if empty"""
+        text = "\n".join(self.iter_pdf_pages(file_path))
+
+        if not text.strip():
+            text = "\n".join(self.iter_pdf_pages(file_path, engine="pdfplumber"))
+
         return text
 
+    def iter_pdf_pages(self, file_path: str, engine: str = "pypdf2") -> Iterator[str]:
+        """
+        Yield PDF text page by page within the configured extraction budget.
+
+        Stops after ``pdf_max_pages`` pages, ``pdf_max_chars`` characters or
+        ``pdf_time_budget`` seconds. Per-page timings are recorded in
+        ``last_extraction_stats``.
+        """
+        stats = {
+            "engine": engine,
+            "pages": 0,
+            "chars": 0,
+            "truncated": None,  # pages, chars or time
+            "page_timings_ms": [],
+        }
+        self.last_extraction_stats = stats
+        started = time.perf_counter()
+
+        with self._open_pdf_pages(file_path, engine) as pages:
+            for index, page in enumerate(pages):
+                if index >= self.pdf_max_pages:
+                    stats["truncated"] = "pages"
+                    break
+                if time.perf_counter() - started >= self.pdf_time_budget:
+                    stats["truncated"] = "time"
+                    break
+
+                page_started = time.perf_counter()
+                page_text = page.extract_text() or ""
+                if engine == "pdfplumber":
+                    page.flush_cache()
+                stats["page_timings_ms"].append(
+                    round((time.perf_counter() - page_started) * 1000, 2)
+                )
+
+                remaining = self.pdf_max_chars - stats["chars"]
+                if len(page_text) >= remaining:
+                    page_text = page_text[:remaining]
+                    stats["truncated"] = "chars"
+
+                stats["pages"] += 1
+                stats["chars"] += len(page_text)
+                yield page_text
+
+                if stats["truncated"]:
+                    break
+
+        logger.info(
+            "Extracted %d pages (%d chars) from %s with %s in %.1f ms%s",
+            stats["pages"],
+            stats["chars"],
+            os.path.basename(file_path),
+            engine,
+            (time.perf_counter() - started) * 1000,
+            f", truncated by {stats['truncated']} budget" if stats["truncated"] else "",
+        )
+        logger.debug("Per-page extraction timings (ms): %s", stats["page_timings_ms"])
+
+    @contextmanager
+    def _open_pdf_pages(self, file_path: str, engine: str):
+        """Open a PDF and expose its lazily loaded pages"""
+        if engine == "pdfplumber":
+            with pdfplumber.open(file_path) as pdf:
+                yield pdf.pages
+        elif engine == "pypdf2":
+            with open(file_path, "rb") as file:
+                yield PyPDF2.PdfReader(file).pages
+        else:
+            raise ValueError(f"Unsupported PDF engine: {engine}")
+
     def _extract_from_docx(self, file_path: str) -> str:
-        """Extract text from DOCX file"""
+        """Extract text from DOCX file, falling back to python-docx"""
+        try:
+            return "\n".join(self.iter_docx_paragraphs(file_path))
+        except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as e:
+            logger.info("Streaming DOCX extraction failed for %s: %s", file_path, e)
+
         doc = docx.Document(file_path)
         text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
         return text
 
+    def iter_docx_paragraphs(self, file_path: str) -> Iterator[str]:
+        """
+        Yield DOCX paragraph text in document order, including table cells.
+
+        ``word/document.xml`` is parsed incrementally and each top-level
+        body element (paragraph or table) is dropped from the tree once read,
+        instead of building the python-docx object model.
+        """
+        with zipfile.ZipFile(file_path) as archive:
+            with archive.open(DOCX_DOCUMENT) as document:
+                # One text buffer per open paragraph (text boxes nest them)
+                paragraphs: List[List[str]] = []
+                skipped_depth = 0
+                depth = 0
+                body, body_depth = None, None
+
+                for event, element in ElementTree.iterparse(
+                    document, events=("start", "end")
+                ):
+                    tag = element.tag
+                    if event == "start":
+                        depth += 1
+                        if tag == W_BODY:
+                            body, body_depth = element, depth
+                    else:
+                        depth -= 1
+
+                    if tag in DOCX_SKIPPED:
+                        skipped_depth += 1 if event == "start" else -1
+                    elif skipped_depth:
+                        pass
+                    elif event == "start":
+                        if tag == W_PARAGRAPH:
+                            paragraphs.append([])
+                    elif tag == W_TEXT:
+                        if paragraphs and element.text:
+                            paragraphs[-1].append(element.text)
+                    elif tag in W_BREAKS:
+                        if paragraphs:
+                            paragraphs[-1].append(W_BREAKS[tag])
+                    elif tag == W_PARAGRAPH:
+                        yield "".join(paragraphs.pop())
+                        element.clear()
+
+                    # Drop finished paragraphs and tables from the body too, not
+                    # just their contents, so the tree does not grow with the file
+                    if event == "end" and depth == body_depth:
+                        element.clear()
+                        body.remove(element)
+
     def _extract_from_txt(self, file_path: str) -> str:
         """Extract text from TXT file"""
         with open(file_path, "r", encoding="utf-8", errors="ignore") as file:
             return file.read()
 
-    def _extract_name(self, text: str) -> str:
+    def _extract_name(self, text: Union[str, CVDocument]) -> str:
         """Extract candidate name (first few words)"""
-        lines = text.strip().split("\n")
-
         # Try first non-empty line
-        for line in lines[:5]:
+        for line in as_document(text).lines[:5]:
             line = line.strip()
             if line and len(line) < 100:
                 # Clean and return first line that looks like a name
-                name = re.sub(r"[^a-zA-Z\s]", "", line).strip()
+                name = NAME_CLEAN_PATTERN.sub("", line).strip()
                 if name and 2 <= len(name.split()) <= 4:
                     return name
 
         return "Unknown"
 
-    def _extract_email(self, text: str) -> Optional[str]:
+    def _extract_email(self, text: Union[str, CVDocument]) -> Optional[str]:
         """Extract email address"""
-        email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        match = re.search(email_pattern, text)
+        match = EMAIL_PATTERN.search(as_document(text).text)
         return match.group(0) if match else None
 
-    def _extract_phone(self, text: str) -> Optional[str]:
+    def _extract_phone(self, text: Union[str, CVDocument]) -> Optional[str]:
         """Extract phone number"""
-        phone_patterns = [
-            r"\+?1?\d{9,15}",  # International format
-            r"\(\d{3}\)\s*\d{3}-\d{4}",  # (123) 456-7890
-            r"\d{3}-\d{3}-\d{4}",  # 123-456-7890
-        ]
+        document = as_document(text)
 
-        for pattern in phone_patterns:
-            match = re.search(pattern, text)
+        for pattern in PHONE_PATTERNS:
+            match = pattern.search(document.text)
             if match:
                 return match.group(0)
 
         return None
 
-    def _extract_education(self, text: str) -> str:
+    def _extract_education(self, text: Union[str, CVDocument]) -> str:
         """Extract education information"""
-        education_keywords = [
-            "bachelor",
-            "master",
-            "phd",
-            "doctorate",
-            "mba",
-            "b.sc",
-            "m.sc",
-            "university",
-            "college",
-            "degree",
-            "diploma",
+        education_lines = [
+            line.strip()
+            for line in as_document(text).lower_lines
+            if EDUCATION_PATTERN.search(line)
         ]
 
-        lines = text.lower().split("\n")
-        education_lines = []
-
-        for line in lines:
-            if any(keyword in line for keyword in education_keywords):
-                education_lines.append(line.strip())
-
         return "; ".join(education_lines[:3]) if education_lines else "Not specified"
 
-    def _estimate_experience(self, text: str) -> float:
+    def _estimate_experience(self, text: Union[str, CVDocument]) -> float:
         """Estimate years of experience"""
-        # Look for explicit experience mentions
-        exp_patterns = [
-            r"(\d+)\+?\s*years?\s+(?:of\s+)?experience",
-            r"experience[:\s]+(\d+)\+?\s*years?",
-        ]
+        text_lower = as_document(text).lower
 
-        for pattern in exp_patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                return float(match.group(1))
+        # Look for explicit experience mentions (both need "year" and "experience")
+        if "year" in text_lower and "experience" in text_lower:
+            for pattern in EXPERIENCE_PATTERNS:
+                match = pattern.search(text_lower)
+                if match:
+                    return float(match.group(1))
 
         # Count year ranges (e.g., 2018-2022, 2018 to 2022)
-        year_pattern = r"(20\d{2})\s*(?:[-–]|to)\s*(20\d{2}|present|current)"
-        matches = re.findall(year_pattern, text.lower())
+        matches = YEAR_RANGE_PATTERN.findall(text_lower)
 
         if matches:
             total_years = 0
@@ -170,47 +406,27 @@ class CVParser:
 
         return 0.0
 
-    def _extract_skills(self, text: str) -> List[str]:
+    def _extract_skills(self, text: Union[str, CVDocument]) -> List[str]:
         """Extract technical and soft skills"""
-        text_lower = text.lower()
-        found_skills = []
+        text_lower = as_document(text).lower
 
         # Check against skills taxonomy
         all_skills = self.skills_taxonomy.get(
             "technical", []
         ) + self.skills_taxonomy.get("soft", [])
 
-        for skill in all_skills:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
+        found_skills = [skill for skill in all_skills if skill.lower() in text_lower]
 
         # Remove duplicates and return
         return list(set(found_skills))
 
-    def _extract_languages(self, text: str) -> List[str]:
+    def _extract_languages(self, text: Union[str, CVDocument]) -> List[str]:
         """Extract spoken languages"""
-        text_lower = text.lower()
-        found_languages = []
-
-        language_list = self.skills_taxonomy.get(
-            "languages",
-            [
-                "English",
-                "Spanish",
-                "French",
-                "German",
-                "Chinese",
-                "Japanese",
-                "Arabic",
-                "Russian",
-                "Portuguese",
-                "Italian",
-                "Hebrew",
-            ],
-        )
+        text_lower = as_document(text).lower
+        language_list = self.skills_taxonomy.get("languages", DEFAULT_LANGUAGES)
 
-        for language in language_list:
-            if language.lower() in text_lower:
-                found_languages.append(language)
+        found_languages = [
+            language for language in language_list if language.lower() in text_lower
+        ]
 
         return list(set(found_languages))
@@ -0,0 +1,24 @@
+"""Shared fixtures for the backend tests"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.database import Base
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Create a SQLite database file with the application schema"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    """Open a session on the test database"""
+    session = Session(bind=engine)
+    yield session
+    session.close()
@@ -1,19 +1,40 @@
 """Integration tests for API endpoints"""
 
+import io
+import json
+import zipfile
+from datetime import datetime
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-from app.database import Base, get_db
+from app.config import settings
+from app.database import (
+    Base,
+    get_async_db,
+    get_async_read_db,
+    get_db,
+    get_read_db,
+)
 from app.main import app
-from app.models import User
+from app.models import AuditLog, Candidate, CandidateScore, Job, User
+from app.routes import auth, users
+from app.services.audit_archive_service import AuditArchiveService
+from app.services.password_pool import PasswordPoolBusy
+from app.services.user_cache_service import UserCacheService
 from app.utils.auth import get_password_hash
 
 # Test database setup
 TEST_DATABASE_URL = "sqlite:///./test.db"
 engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db")
+TestingAsyncSessionLocal = sessionmaker(
+    bind=async_engine, class_=AsyncSession, expire_on_commit=False
+)
 
 
 def override_get_db():
@@ -25,7 +46,16 @@ def override_get_db():
         db.close()
 
 
+async def override_get_async_db():
+    """Override async database dependency for testing"""
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_read_db] = override_get_db
+app.dependency_overrides[get_async_db] = override_get_async_db
+app.dependency_overrides[get_async_read_db] = override_get_async_db
 
 client = TestClient(app)
 
@@ -34,6 +64,8 @@ client = TestClient(app)
 def setup_database():
     """Create test database before each test and drop after"""
     Base.metadata.create_all(bind=engine)
+    # Users are recreated with new ids for every test
+    UserCacheService.clear()
 
     # Create test user
     db = TestingSessionLocal()
@@ -136,6 +168,138 @@ def test_create_job():
     assert response.json()["title"] == "Python Developer"
 
 
+def test_get_jobs_cursor_pagination():
+    """Test job listings page with the X-Next-Cursor header"""
+    login_response = client.post(
+        "/api/auth/login",
+        json={"email": "test@example.com", "password": "testpassword"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    for i in range(5):
+        client.post("/api/jobs", json={"title": f"Job {i}"}, headers=headers)
+
+    titles, params = [], {"limit": 2}
+    while True:
+        response = client.get("/api/jobs", params=params, headers=headers)
+        assert response.status_code == 200
+        titles.extend(job["title"] for job in response.json())
+        if "X-Next-Cursor" not in response.headers:
+            break
+        params = {"limit": 2, "cursor": response.headers["X-Next-Cursor"]}
+
+    assert titles == [f"Job {i}" for i in range(5)]
+
+    response = client.get("/api/jobs", params={"cursor": "garbage"}, headers=headers)
+    assert response.status_code == 400
+    # ["abc"]: valid encoding, but not an id
+    response = client.get("/api/jobs", params={"cursor": "WyJhYmMiXQ"}, headers=headers)
+    assert response.status_code == 400
+
+
+def test_search_candidates():
+    """Test candidate search returns ranked results with snippets"""
+    db = TestingSessionLocal()
+    db.add(
+        Candidate(
+            name="Jane Doe",
+            skills=["Python"],
+            languages=["English"],
+            raw_text="Senior Python developer with FastAPI experience.",
+        )
+    )
+    db.commit()
+    db.close()
+
+    login_response = client.post(
+        "/api/auth/login",
+        json={"email": "test@example.com", "password": "testpassword"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    response = client.get(
+        "/api/candidates/search", params={"q": "fastapi"}, headers=headers
+    )
+    assert response.status_code == 200
+    results = response.json()
+    assert [r["candidate"]["name"] for r in results] == ["Jane Doe"]
+    assert "<mark>FastAPI</mark>" in results[0]["snippet"]
+
+
+def test_search_snippet_escapes_cv_markup(tmp_path, monkeypatch):
+    """Test markup in an uploaded CV comes back escaped around the highlights"""
+    monkeypatch.setattr(settings, "storage_path", str(tmp_path))
+
+    login_response = client.post(
+        "/api/auth/login",
+        json={"email": "test@example.com", "password": "testpassword"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    upload = client.post(
+        "/api/candidates/upload",
+        files={
+            "files": (
+                "jane.txt",
+                b"Jane Smith\n<img src=x onerror=alert(1)> Python & SQL",
+            )
+        },
+        headers=headers,
+    )
+    assert upload.json()[0]["status"] == "success"
+
+    response = client.get(
+        "/api/candidates/search", params={"q": "python"}, headers=headers
+    )
+
+    snippet = response.json()[0]["snippet"]
+    assert "<img" not in snippet
+    assert "&lt;img src=x onerror=alert(1)&gt; <mark>Python</mark> &amp; SQL" in snippet
+
+
+def test_filter_candidates_and_facets():
+    """Test filtering by skills, languages and experience, and facet counts"""
+    db = TestingSessionLocal()
+    for name, skills, languages, years in [
+        ("Alice", ["Python", "SQL"], ["English"], 6),
+        ("Bob", ["Python", "Docker"], ["English", "Hebrew"], 1),
+        ("Carol", ["Java"], ["Hebrew"], 12),
+    ]:
+        db.add(
+            Candidate(
+                name=name,
+                skills=skills,
+                languages=languages,
+                years_of_experience=years,
+                parse_status="success",
+            )
+        )
+    db.commit()
+    db.close()
+
+    login_response = client.post(
+        "/api/auth/login",
+        json={"email": "test@example.com", "password": "testpassword"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    def names(**params):
+        response = client.get("/api/candidates/filter", params=params, headers=headers)
+        assert response.status_code == 200
+        return [candidate["name"] for candidate in response.json()]
+
+    assert names(skills=["Python", "SQL"]) == ["Alice"]
+    assert names(skills=["SQL", "Java"], skills_mode="any") == ["Alice", "Carol"]
+    assert names(languages=["Hebrew"], min_experience=2) == ["Carol"]
+    assert names(skills=["Python"], max_experience=5) == ["Bob"]
+
+    response = client.get("/api/candidates/facets", headers=headers)
+    assert response.status_code == 200
+    facets = response.json()
+    assert facets["skills"][0] == {"value": "Python", "count": 2}
+    assert [item["value"] for item in facets["experience"]] == ["0-2", "5-10", "10+"]
+    assert facets["parse_status"] == [{"value": "success", "count": 3}]
+
+
 def test_get_pipeline_stats():
     """Test getting pipeline statistics"""
     # Login first
@@ -155,3 +319,417 @@ def test_get_pipeline_stats():
     assert "total_candidates" in data
     assert "total_jobs" in data
     assert "success_rate" in data
+
+
+def test_upload_archive_streams_member_results(tmp_path, monkeypatch):
+    """Test uploading a ZIP archive returns one NDJSON result per member"""
+    monkeypatch.setattr(settings, "storage_path", str(tmp_path))
+
+    login_response = client.post(
+        "/api/auth/login",
+        json={"email": "test@example.com", "password": "testpassword"},
+    )
+    token = login_response.json()["access_token"]
+
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("batch/jane.txt", "Jane Smith\njane@example.com\nPython")
+        zf.writestr("batch/empty.txt", "")
+        zf.writestr("batch/photo.png", b"\x89PNG")
+        zf.writestr("__MACOSX/batch/._jane.txt", "metadata")
+
+    response = client.post(
+        "/api/candidates/upload-archive",
+        files={"file": ("batch.zip", archive.getvalue(), "application/zip")},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["filename"] for r in results] == [
+        "batch/jane.txt",
+        "batch/empty.txt",
+        "batch/photo.png",
+    ]
+    assert [r["status"] for r in results] == ["success", "failed", "error"]
+    assert results[0]["candidate_id"] is not None
+
+
+def test_upload_archive_rejects_non_zip():
+    """Test a file that is not a ZIP archive is rejected"""
+    login_response = client.post(
+        "/api/auth/login",
+        json={"email": "test@example.com", "password": "testpassword"},
+    )
+    token = login_response.json()["access_token"]
+
+    response = client.post(
+        "/api/candidates/upload-archive",
+        files={"file": ("batch.zip", b"not a zip", "application/zip")},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 400
+
+
+def test_rank_results_and_cleanup(tmp_path, monkeypatch):
+    """Test the upload, rank, results, update and delete flow end to end"""
+    monkeypatch.setattr(settings, "storage_path", str(tmp_path))
+
+    login_response = client.post(
+        "/api/auth/login",
+        json={"email": "test@example.com", "password": "testpassword"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    job = client.post(
+        "/api/jobs",
+        json={"title": "Python Developer", "required_skills": ["Python"]},
+        headers=headers,
+    ).json()
+    upload = client.post(
+        "/api/candidates/upload",
+        files={"files": ("jane.txt", b"Jane Smith\njane@example.com\nPython")},
+        headers=headers,
+    ).json()
+    candidate_id = upload[0]["candidate_id"]
+
+    response = client.post(
+        "/api/matching/rank", json={"job_id": job["id"]}, headers=headers
+    )
+    assert response.json()["total_candidates"] == 1
+
+    results = client.get(f"/api/matching/results/{job['id']}", headers=headers)
+    assert results.status_code == 200
+    assert results.json()[0]["candidate"]["name"] == "Jane Smith"
+
+    response = client.put(
+        f"/api/jobs/{job['id']}", json={"status": "closed"}, headers=headers
+    )
+    assert response.json()["status"] == "closed"
+
+    response = client.delete(f"/api/candidates/{candidate_id}", headers=headers)
+    assert response.status_code == 200
+    assert (
+        client.get(f"/api/candidates/{candidate_id}", headers=headers).status_code
+        == 404
+    )
+
+    response = client.delete(f"/api/jobs/{job['id']}", headers=headers)
+    assert response.status_code == 200
+    assert client.get("/api/jobs", headers=headers).json() == []
+
+
+def test_get_archived_audit_logs(tmp_path, monkeypatch):
+    """Test admins can stream archived audit logs for a time range"""
+    monkeypatch.setattr(settings, "storage_path", str(tmp_path))
+    monkeypatch.setattr(settings, "audit_retention_days", 30)
+
+    db = TestingSessionLocal()
+    db.add(
+        User(
+            email="admin@example.com",
+            full_name="Admin User",
+            role="HR_ADMIN",
+            hashed_password=get_password_hash("adminpassword"),
+        )
+    )
+    db.add_all(
+        [
+            AuditLog(action="login", timestamp=datetime(2025, 3, 2, 8, 0)),
+            AuditLog(action="job_created", timestamp=datetime(2025, 3, 9, 8, 0)),
+        ]
+    )
+    db.commit()
+    AuditArchiveService(db).archive_expired()
+    db.close()
+
+    login_response = client.post(
+        "/api/auth/login",
+        json={"email": "admin@example.com", "password": "adminpassword"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    response = client.get(
+        "/api/reports/audit-logs/archive",
+        params={"start": "2025-03-01T00:00:00", "end": "2025-04-01T00:00:00"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    entries = [json.loads(line) for line in response.text.splitlines()]
+    assert [entry["action"] for entry in entries] == ["login", "job_created"]
+
+    response = client.get(
+        "/api/reports/audit-logs/archive",
+        params={"start": "2025-04-01T00:00:00", "end": "2025-03-01T00:00:00"},
+        headers=headers,
+    )
+    assert response.status_code == 400
+
+
+def test_export_audit_logs_csv():
+    """Test admins can export filtered audit logs as CSV"""
+    db = TestingSessionLocal()
+    db.add(
+        User(
+            email="admin@example.com",
+            full_name="Admin User",
+            role="HR_ADMIN",
+            hashed_password=get_password_hash("adminpassword"),
+        )
+    )
+    db.add_all(
+        [
+            AuditLog(action="login", timestamp=datetime(2026, 9, 1, 8, 0)),
+            AuditLog(action="job_created", timestamp=datetime(2026, 9, 2, 8, 0)),
+        ]
+    )
+    db.commit()
+    db.close()
+
+    login_response = client.post(
+        "/api/auth/login",
+        json={"email": "admin@example.com", "password": "adminpassword"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    response = client.get(
+        "/api/reports/audit-logs/export",
+        params={"format": "csv", "action": "job_created"},
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    lines = response.text.splitlines()
+    assert lines[0].startswith("id,user_id,action")
+    assert [line.split(",")[2] for line in lines[1:]] == ["job_created"]
+
+
+def test_create_user_when_password_pool_busy(monkeypatch):
+    """Test user creation sheds load with a 503 like login does"""
+    db = TestingSessionLocal()
+    db.add(
+        User(
+            email="admin@example.com",
+            full_name="Admin User",
+            role="HR_ADMIN",
+            hashed_password=get_password_hash("adminpassword"),
+        )
+    )
+    db.commit()
+    db.close()
+    login_response = client.post(
+        "/api/auth/login",
+        json={"email": "admin@example.com", "password": "adminpassword"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    async def busy(password):
+        raise PasswordPoolBusy()
+
+    new_user = {
+        "email": "new@example.com",
+        "full_name": "New User",
+        "role": "HR_RECRUITER",
+        "password": "newpassword",
+    }
+    for path, module in [("/api/auth/register", auth), ("/api/users", users)]:
+        monkeypatch.setattr(module, "get_password_hash_async", busy)
+        response = client.post(path, json=new_user, headers=headers)
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+
+
+def test_deactivated_user_is_rejected_immediately():
+    """Test deactivating a user invalidates their cached record"""
+    db = TestingSessionLocal()
+    db.add(
+        User(
+            email="admin@example.com",
+            full_name="Admin User",
+            role="HR_ADMIN",
+            hashed_password=get_password_hash("adminpassword"),
+        )
+    )
+    db.commit()
+    recruiter_id = db.query(User).filter_by(email="test@example.com").one().id
+    db.close()
+
+    def login(email, password):
+        response = client.post(
+            "/api/auth/login", json={"email": email, "password": password}
+        )
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    recruiter = login("test@example.com", "testpassword")
+    admin = login("admin@example.com", "adminpassword")
+    assert client.get("/api/jobs", headers=recruiter).status_code == 200
+    assert client.get("/api/jobs", headers=recruiter).status_code == 200
+
+    response = client.put(
+        f"/api/users/{recruiter_id}", json={"is_active": False}, headers=admin
+    )
+    assert response.status_code == 200
+
+    assert client.get("/api/jobs", headers=recruiter).status_code == 403
+    stats = client.get("/api/reports/cache-stats", headers=admin).json()
+    assert stats["user_cache"]["hits"] >= 1
+
+
+def test_skills_frequency_report():
+    """Test the report counts skills of successfully parsed candidates only"""
+    login_response = client.post(
+        "/api/auth/login",
+        json={"email": "test@example.com", "password": "testpassword"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    job = client.post(
+        "/api/jobs",
+        json={"title": "Python Developer", "required_skills": ["Python"]},
+        headers=headers,
+    ).json()
+
+    db = TestingSessionLocal()
+    for skills, status in [
+        (["Python", "SQL"], "success"),
+        (["Python", "Docker"], "success"),
+        (["Python", "SQL", "Go"], "success"),
+        (["Java"], "success"),
+        (["Rust", "Rust"], "failed"),
+    ]:
+        db.add(Candidate(name="C", skills=skills, languages=[], parse_status=status))
+    db.commit()
+    db.close()
+
+    response = client.get(
+        f"/api/reports/skills-frequency/{job['id']}",
+        params={"limit": 3},
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["total_candidates"] == 4
+    assert report["skills"] == [
+        {"skill": "Python", "count": 3, "percentage": 75.0},
+        {"skill": "SQL", "count": 2, "percentage": 50.0},
+        {"skill": "Docker", "count": 1, "percentage": 25.0},
+    ]
+
+
+def test_pipeline_stats_report():
+    """Test the report reflects uploads, job changes and completed rankings"""
+    login_response = client.post(
+        "/api/auth/login",
+        json={"email": "test@example.com", "password": "testpassword"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    db = TestingSessionLocal()
+    for skills, status in [(["Python"], "success"), ([], "failed")]:
+        db.add(Candidate(name="C", skills=skills, languages=[], parse_status=status))
+    db.commit()
+    db.close()
+
+    job = client.post(
+        "/api/jobs",
+        json={"title": "Python Developer", "required_skills": ["Python"]},
+        headers=headers,
+    ).json()
+    client.post(
+        "/api/jobs",
+        json={"title": "Draft Role", "required_skills": ["Go"], "status": "draft"},
+        headers=headers,
+    )
+    ranking = client.post(
+        "/api/matching/rank", json={"job_id": job["id"]}, headers=headers
+    ).json()
+
+    response = client.get("/api/reports/pipeline-stats", headers=headers)
+
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["total_candidates"] == 2
+    assert stats["parsed_successfully"] == 1
+    assert stats["parse_failed"] == 1
+    assert stats["success_rate"] == 50.0
+    assert stats["total_jobs"] == 2
+    assert stats["active_jobs"] == 1
+    assert stats["average_score_by_job"] == [
+        {
+            "job_id": job["id"],
+            "job_title": "Python Developer",
+            "average_score": ranking["ranked_candidates"][0]["total_score"],
+            "candidate_count": 1,
+        }
+    ]
+
+
+def test_pipeline_stats_match_score_aggregates():
+    """Test job averages match AVG and COUNT over the scores, null scores included"""
+    login_response = client.post(
+        "/api/auth/login",
+        json={"email": "test@example.com", "password": "testpassword"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    db = TestingSessionLocal()
+    candidates = [Candidate(name=f"C{i}") for i in range(3)]
+    scored, partial, unscored = jobs = [
+        Job(title=title, required_skills=[])
+        for title in ["Scored", "Partly Scored", "Unscored"]
+    ]
+    db.add_all(candidates + jobs)
+    db.flush()
+    totals_by_job = {
+        scored.id: [80.0, 65.5, 42.25],
+        partial.id: [70.0, None, 55.0],
+        unscored.id: [None, None],
+    }
+    for job in jobs:
+        for candidate in candidates[: len(totals_by_job[job.id])]:
+            db.add(CandidateScore(candidate_id=candidate.id, job_id=job.id))
+    db.commit()
+    # Inserting None stores the column default, so null scores come from updates
+    for score in db.query(CandidateScore).order_by(CandidateScore.id):
+        score.total_score = totals_by_job[score.job_id].pop(0)
+    db.commit()
+
+    rescored = db.query(CandidateScore).filter_by(job_id=partial.id).all()
+    rescored[0].total_score = None
+    rescored[1].total_score = 90.0
+    db.delete(db.query(CandidateScore).filter_by(job_id=scored.id).first())
+    db.commit()
+    assert db.query(CandidateScore).filter_by(total_score=None).count() == 3
+
+    expected = [
+        {
+            "job_id": row.id,
+            "job_title": row.title,
+            "average_score": round(row.avg_score, 2) if row.avg_score else 0,
+            "candidate_count": row.candidate_count,
+        }
+        for row in db.execute(
+            select(
+                Job.id,
+                Job.title,
+                func.avg(CandidateScore.total_score).label("avg_score"),
+                func.count(CandidateScore.id).label("candidate_count"),
+            )
+            .join(CandidateScore, Job.id == CandidateScore.job_id)
+            .group_by(Job.id, Job.title)
+            .order_by(Job.id)
+        )
+    ]
+    db.close()
+
+    response = client.get("/api/reports/pipeline-stats", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["average_score_by_job"] == expected
+    assert [job["candidate_count"] for job in expected] == [2, 3, 2]
+    assert expected[2]["average_score"] == 0
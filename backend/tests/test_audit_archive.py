@@ -0,0 +1,102 @@
+"""Tests for audit log retention and archival"""
+
+import gzip
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from app.config import settings
+from app.models import AuditLog
+from app.models.audit import months_between, partition_name
+from app.services.audit_archive_service import AuditArchiveService
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def db(db):
+    """Add audit entries spread over a few months"""
+    for month, day, action in [
+        (7, 31, "login"),
+        (8, 1, "login"),
+        (8, 15, "job_created"),
+        (9, 30, "login"),
+        (10, 1, "login"),
+    ]:
+        db.add(
+            AuditLog(
+                action=action,
+                user_id=1,
+                details={"day": day},
+                timestamp=datetime(2026, month, day, 9, 30),
+            )
+        )
+    db.commit()
+    return db
+
+
+def test_months_between_crosses_year_end():
+    """Test month ranges cover partial months and roll over the year"""
+    months = list(
+        months_between(
+            datetime(2025, 11, 20, tzinfo=timezone.utc),
+            datetime(2026, 2, 1, tzinfo=timezone.utc),
+        )
+    )
+
+    assert [partition_name(start) for start, _ in months] == [
+        "audit_logs_2025_11",
+        "audit_logs_2025_12",
+        "audit_logs_2026_01",
+    ]
+    assert months[1][1] == datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def test_archive_expired_months(db, tmp_path, monkeypatch):
+    """Test whole expired months move to archives and recent ones stay"""
+    monkeypatch.setattr(settings, "audit_retention_days", 40)
+    service = AuditArchiveService(db, str(tmp_path / "archive"))
+
+    assert service.archive_expired(NOW) == {
+        "audit_logs_2026_07": 1,
+        "audit_logs_2026_08": 2,
+    }
+
+    remaining = db.query(AuditLog).order_by(AuditLog.timestamp).all()
+    assert [log.timestamp.month for log in remaining] == [9, 10]
+    with gzip.open(tmp_path / "archive" / "audit_logs_2026_08.jsonl.gz", "rt") as f:
+        entries = [json.loads(line) for line in f]
+    assert [entry["action"] for entry in entries] == ["login", "job_created"]
+    assert entries[0]["timestamp"] == "2026-08-01T09:30:00+00:00"
+    assert entries[0]["details"] == {"day": 1}
+
+    assert service.archive_expired(NOW) == {}
+
+
+def test_iter_archived_filters_ranges(db, tmp_path, monkeypatch):
+    """Test reading archives back by time range, action and user"""
+    monkeypatch.setattr(settings, "audit_retention_days", 40)
+    service = AuditArchiveService(db, str(tmp_path / "archive"))
+    service.archive_expired(NOW)
+
+    def days(start, end, **filters):
+        return [
+            entry["details"]["day"]
+            for entry in service.iter_archived(start, end, **filters)
+        ]
+
+    assert days(datetime(2026, 7, 1), datetime(2026, 9, 1)) == [31, 1, 15]
+    assert days(datetime(2026, 7, 31, 10), datetime(2026, 8, 15, 9, 30)) == [1]
+    assert days(datetime(2026, 1, 1), datetime(2027, 1, 1), action="job_created") == [
+        15
+    ]
+    assert days(datetime(2026, 1, 1), datetime(2027, 1, 1), user_id=2) == []
+
+
+def test_retention_disabled_keeps_everything(db, tmp_path, monkeypatch):
+    """Test a retention of 0 days never archives"""
+    monkeypatch.setattr(settings, "audit_retention_days", 0)
+
+    assert AuditArchiveService(db, str(tmp_path)).archive_expired(NOW) == {}
+    assert db.query(AuditLog).count() == 5
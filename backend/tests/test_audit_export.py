@@ -0,0 +1,91 @@
+"""Tests for streaming audit log export"""
+
+import csv
+import io
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from app.config import settings
+from app.models import AuditLog
+from app.services.audit_archive_service import AuditArchiveService
+from app.services.audit_export_service import AuditExportService
+
+
+@pytest.fixture
+def db(db):
+    """Add audit entries from two users"""
+    for day, user_id, action, entity_type in [
+        (3, 1, "login", None),
+        (1, 2, "job_created", "job"),
+        (2, 1, "job_created", "job"),
+        (4, 1, "cv_uploaded", "candidate"),
+    ]:
+        db.add(
+            AuditLog(
+                action=action,
+                user_id=user_id,
+                entity_type=entity_type,
+                details={"day": day},
+                timestamp=datetime(2026, 9, day, 12, 0),
+            )
+        )
+    db.commit()
+    return db
+
+
+def days(entries):
+    return [entry["details"]["day"] for entry in entries]
+
+
+def test_export_filters_oldest_first(db, tmp_path):
+    """Test the export applies every filter and orders by timestamp"""
+    service = AuditExportService(db, AuditArchiveService(archive_dir=str(tmp_path)))
+
+    assert days(service.entries()) == [1, 2, 3, 4]
+    assert days(service.entries(user_id=1)) == [2, 3, 4]
+    assert days(service.entries(action="job_created", user_id=1)) == [2]
+    assert days(service.entries(entity_type="candidate")) == [4]
+    assert days(
+        service.entries(start=datetime(2026, 9, 2), end=datetime(2026, 9, 4))
+    ) == [2, 3]
+
+
+def test_export_formats(db, tmp_path):
+    """Test CSV has a header and JSON-encoded details; NDJSON is one per line"""
+    service = AuditExportService(db, AuditArchiveService(archive_dir=str(tmp_path)))
+
+    rows = list(csv.DictReader(io.StringIO("".join(service.to_csv(service.entries())))))
+    assert [row["action"] for row in rows] == [
+        "job_created",
+        "job_created",
+        "login",
+        "cv_uploaded",
+    ]
+    assert json.loads(rows[0]["details"]) == {"day": 1}
+    assert rows[2]["entity_type"] == ""
+    assert rows[0]["timestamp"] == "2026-09-01T12:00:00+00:00"
+
+    lines = "".join(service.to_ndjson(service.entries(user_id=2))).splitlines()
+    assert [json.loads(line)["action"] for line in lines] == ["job_created"]
+
+
+def test_export_includes_archived_months(db, tmp_path, monkeypatch):
+    """Test archived entries are exported ahead of the live ones"""
+    monkeypatch.setattr(settings, "audit_retention_days", 30)
+    db.add(
+        AuditLog(
+            action="login",
+            user_id=1,
+            details={"day": 0},
+            timestamp=datetime(2026, 6, 30, 12, 0),
+        )
+    )
+    db.commit()
+    archive = AuditArchiveService(db, str(tmp_path))
+    archive.archive_expired(datetime(2026, 8, 15, tzinfo=timezone.utc))
+    service = AuditExportService(db, archive)
+
+    assert days(service.entries(user_id=1)) == [2, 3, 4]
+    assert days(service.entries(user_id=1, include_archived=True)) == [0, 2, 3, 4]
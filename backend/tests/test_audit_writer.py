@@ -0,0 +1,129 @@
+"""Tests for the batched audit log writer"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models import AuditLog
+from app.services import audit_service
+from app.services.audit_service import AuditService, AuditWriter
+
+
+def entry(action: str):
+    return {
+        "user_id": None,
+        "action": action,
+        "entity_type": None,
+        "entity_id": None,
+        "details": {},
+        "ip_address": None,
+        "timestamp": datetime.now(timezone.utc),
+    }
+
+
+def actions(engine):
+    with Session(bind=engine) as db:
+        return [log.action for log in db.query(AuditLog).order_by(AuditLog.id)]
+
+
+def test_writer_flushes_full_batches(engine):
+    """Test a full batch is written without waiting for the interval"""
+    writer = AuditWriter(
+        sessionmaker(bind=engine), flush_interval_ms=60000, batch_size=3
+    )
+    for i in range(3):
+        writer.enqueue(entry(f"action_{i}"))
+
+    assert writer.flush(timeout=5)
+    assert actions(engine) == ["action_0", "action_1", "action_2"]
+    writer.shutdown()
+
+
+def test_writer_flushes_on_interval(engine):
+    """Test a partial batch is written once the flush interval elapses"""
+    writer = AuditWriter(
+        sessionmaker(bind=engine), flush_interval_ms=50, batch_size=1000
+    )
+    writer.enqueue(entry("login"))
+
+    assert writer.flush(timeout=5)
+    assert actions(engine) == ["login"]
+    writer.shutdown()
+
+
+def test_shutdown_writes_queued_entries(engine):
+    """Test shutdown writes everything queued and then refuses new entries"""
+    writer = AuditWriter(
+        sessionmaker(bind=engine), flush_interval_ms=60000, batch_size=1000
+    )
+    for i in range(250):
+        writer.enqueue(entry(f"action_{i}"))
+
+    writer.shutdown(timeout=5)
+
+    assert len(actions(engine)) == 250
+    assert writer.enqueue(entry("late")) is False
+
+
+def test_log_action_queues_for_app_database(engine, monkeypatch):
+    """Test log_action hands entries to the writer, stamped at call time"""
+    writer = AuditWriter(
+        sessionmaker(bind=engine), flush_interval_ms=60000, batch_size=1000
+    )
+    monkeypatch.setattr(audit_service, "engine", engine)
+    monkeypatch.setattr(audit_service, "_writer", writer)
+
+    with Session(bind=engine) as db:
+        before = datetime.now(timezone.utc)
+        log = AuditService.log_action(db, "job_created", user_id=1, entity_id=7)
+        assert log.id is None
+        assert db.query(AuditLog).count() == 0
+
+    writer.shutdown(timeout=5)
+
+    with Session(bind=engine) as db:
+        stored = db.query(AuditLog).one()
+    assert (stored.action, stored.user_id, stored.entity_id) == ("job_created", 1, 7)
+    stored_at = stored.timestamp.replace(tzinfo=timezone.utc)
+    assert before - timedelta(seconds=1) <= stored_at <= before + timedelta(seconds=1)
+
+
+def test_poison_row_is_dropped_and_rest_written(engine, monkeypatch):
+    """Test a batch that keeps failing is split and only its bad row dropped"""
+    monkeypatch.setattr(AuditWriter, "MAX_ATTEMPTS", 2)
+    writer = AuditWriter(sessionmaker(bind=engine), flush_interval_ms=10, batch_size=5)
+    bad = {**entry("bad"), "action": None}  # violates NOT NULL
+    for item in [entry("a"), entry("b"), bad, entry("c"), entry("d")]:
+        writer.enqueue(item)
+
+    assert writer.flush(timeout=5)
+    assert actions(engine) == ["a", "b", "c", "d"]
+    stats = writer.get_stats()
+    assert (stats["written"], stats["dropped"]) == (4, 1)
+    writer.shutdown()
+
+
+def test_full_queue_refuses_entries(engine):
+    """Test entries beyond the queue bound are refused instead of queued"""
+    release = threading.Event()
+    factory = sessionmaker(bind=engine)
+
+    def blocking_session():
+        release.wait(5)
+        return factory()
+
+    writer = AuditWriter(
+        blocking_session, flush_interval_ms=10, batch_size=1, max_queued=2
+    )
+    writer.enqueue(entry("in_progress"))
+    time.sleep(0.05)  # Taken off the queue and blocked writing
+    queued = [writer.enqueue(entry(f"queued_{i}")) for i in range(3)]
+    release.set()
+
+    assert queued == [True, True, False]
+    assert writer.flush(timeout=5)
+    assert actions(engine) == ["in_progress", "queued_0", "queued_1"]
+    assert writer.get_stats()["refused"] == 1
+    writer.shutdown()
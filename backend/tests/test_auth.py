@@ -1,7 +1,13 @@
 """Unit tests for authentication utilities"""
 
-import pytest
+import asyncio
 
+from passlib.context import CryptContext
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.models import User
+from app.utils import auth
 from app.utils.auth import create_access_token, get_password_hash, verify_password
 
 
@@ -30,3 +36,40 @@ def test_create_access_token():
 
     # Token should have content
     assert len(token) > 0
+
+
+def test_login_rehashes_outdated_cost(engine, monkeypatch):
+    """Test a hash made with other bcrypt rounds is replaced on login"""
+    old_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4)
+    monkeypatch.setattr(
+        auth, "pwd_context", CryptContext(schemes=["bcrypt"], bcrypt__rounds=5)
+    )
+
+    with Session(bind=engine) as db:
+        db.add(
+            User(
+                email="jane@example.com",
+                full_name="Jane",
+                role="HR_RECRUITER",
+                hashed_password=old_context.hash("secret"),
+            )
+        )
+        db.commit()
+
+    async def login(password):
+        async_engine = create_async_engine(
+            engine.url.set(drivername="sqlite+aiosqlite")
+        )
+        async with AsyncSession(async_engine, expire_on_commit=False) as db:
+            user = await auth.authenticate_user(db, "jane@example.com", password)
+        await async_engine.dispose()
+        return user
+
+    assert asyncio.run(login("wrong")) is None
+    user = asyncio.run(login("secret"))
+    assert user.hashed_password.startswith("$2b$05$")
+
+    with Session(bind=engine) as db:
+        stored = db.query(User).filter_by(email="jane@example.com").one()
+        assert verify_password("secret", stored.hashed_password)
+        assert stored.hashed_password == user.hashed_password
@@ -0,0 +1,95 @@
+"""Tests for bulk directory/ZIP ingestion"""
+
+import os
+import zipfile
+
+import pytest
+
+from app.models import AuditLog, Candidate
+from app.services.ingest_service import BulkIngestService
+
+CVS = {
+    "alice.txt": "Alice Smith\nalice@example.com\n5 years of experience",
+    "bob.txt": "Bob Jones\nbob@example.com\nPython developer",
+    "nested/carol.txt": "Carol White\ncarol@example.com\nDocker",
+    "empty.txt": "",
+    "notes.md": "not a CV",
+}
+
+
+@pytest.fixture
+def cv_dir(tmp_path):
+    """Write a directory tree of CVs"""
+    root = tmp_path / "cvs"
+    for name, text in CVS.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return str(root)
+
+
+def make_service(db, tmp_path, **kwargs):
+    return BulkIngestService(
+        db,
+        workers=2,
+        batch_size=2,
+        storage_root=str(tmp_path / "store"),
+        checkpoint_path=str(tmp_path / "run.checkpoint"),
+        **kwargs,
+    )
+
+
+def test_ingest_directory(db, tmp_path, cv_dir):
+    """Test every supported file becomes a candidate"""
+    stats = make_service(db, tmp_path).run(cv_dir)
+
+    assert stats["ingested"] == 4
+    assert stats["parse_failed"] == 1
+    assert stats["errors"] == 0
+    assert stats["files_per_second"] > 0
+
+    names = {c.name for c in db.query(Candidate).all()}
+    assert names == {"Alice Smith", "Bob Jones", "Carol White", "Parse Failed"}
+    assert db.query(AuditLog).filter_by(action="cvs_bulk_ingested").count() == 1
+
+    for candidate in db.query(Candidate).all():
+        assert candidate.file_hash
+        assert os.path.exists(candidate.file_path)
+    # Worker pins are dropped once their batch is committed
+    assert os.listdir(tmp_path / "store" / ".tmp") == []
+
+
+def test_ingest_zip_archive(db, tmp_path):
+    """Test members of a ZIP archive are ingested"""
+    archive_path = tmp_path / "batch.zip"
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        for name, text in CVS.items():
+            archive.writestr(name, text)
+        archive.writestr("__MACOSX/._alice.txt", "resource fork")
+
+    stats = make_service(db, tmp_path).run(str(archive_path))
+
+    assert stats["ingested"] == 4
+    assert db.query(Candidate).filter_by(file_name="carol.txt").count() == 1
+
+
+def test_resume_from_checkpoint(db, tmp_path, cv_dir):
+    """Test files committed by an earlier run are skipped"""
+    checkpoint = tmp_path / "run.checkpoint"
+    checkpoint.write_text(
+        os.path.join(cv_dir, "alice.txt")
+        + "\n"
+        + os.path.join(cv_dir, "bob.txt")
+        + "\n"
+    )
+
+    stats = make_service(db, tmp_path).run(cv_dir)
+
+    assert stats["skipped"] == 2
+    assert stats["ingested"] == 2
+    assert len(checkpoint.read_text().splitlines()) == 4
+
+    stats = make_service(db, tmp_path).run(cv_dir)
+    assert stats["skipped"] == 4
+    assert stats["ingested"] == 0
+    assert db.query(Candidate).count() == 2
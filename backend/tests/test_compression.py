@@ -0,0 +1,89 @@
+"""Tests for compressed raw_text storage"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Candidate
+from app.utils import compression
+from app.utils.compression import (
+    CODEC_STORED,
+    CODEC_ZLIB,
+    CODEC_ZSTD,
+    compress_column,
+    compress_text,
+    decompress_text,
+)
+
+CV_TEXT = "John Doe\nPython developer with Kubernetes experience\n" * 50
+
+
+@pytest.mark.parametrize("codec", [CODEC_ZLIB, CODEC_ZSTD])
+def test_compress_round_trip(codec):
+    """Test each codec round-trips text and is recorded in the prefix"""
+    if codec == CODEC_ZSTD:
+        pytest.importorskip("zstandard")
+
+    value = compress_text(CV_TEXT, codec)
+
+    assert value[:1] == codec
+    assert len(value) < len(CV_TEXT)
+    assert decompress_text(value) == CV_TEXT
+
+
+def test_short_text_is_stored_uncompressed():
+    """Test values that would not shrink are kept as-is"""
+    value = compress_text("Hi")
+
+    assert value == CODEC_STORED + b"Hi"
+    assert decompress_text(value) == "Hi"
+
+
+def test_candidate_raw_text_is_compressed(engine):
+    """Test the ORM reads and writes plain strings over compressed storage"""
+    db = sessionmaker(bind=engine)()
+    db.add(Candidate(name="John Doe", raw_text=CV_TEXT, parse_status="success"))
+    db.commit()
+    db.close()
+
+    with engine.connect() as connection:
+        stored = connection.execute(text("SELECT raw_text FROM candidates")).scalar()
+    assert isinstance(stored, bytes)
+    assert len(stored) < len(CV_TEXT)
+
+    db = sessionmaker(bind=engine)()
+    assert db.query(Candidate).one().raw_text == CV_TEXT
+    db.close()
+
+
+def test_compress_column_migrates_legacy_rows(engine, monkeypatch):
+    """Test plain-text rows are compressed in place and stay readable"""
+    with engine.begin() as connection:
+        for name, raw_text in [("Legacy", CV_TEXT), ("Short", "Hi"), ("Empty", None)]:
+            connection.execute(
+                text(
+                    "INSERT INTO candidates (name, raw_text) VALUES (:name, :raw_text)"
+                ),
+                {"name": name, "raw_text": raw_text},
+            )
+
+    db = sessionmaker(bind=engine)()
+    assert db.query(Candidate).filter_by(name="Legacy").one().raw_text == CV_TEXT
+    db.close()
+
+    dry_run = compress_column(engine, "candidates", "raw_text", dry_run=True)
+    assert dry_run["compressed"] == 2
+
+    # Fall back to zlib as if zstandard were not installed
+    monkeypatch.setattr(compression, "zstandard", None)
+    stats = compress_column(engine, "candidates", "raw_text", batch_size=1)
+
+    assert stats["rows"] == 2
+    assert stats["compressed"] == 2
+    assert stats["bytes_after"] < stats["bytes_before"]
+    assert compress_column(engine, "candidates", "raw_text")["compressed"] == 0
+
+    db = sessionmaker(bind=engine)()
+    texts = {c.name: c.raw_text for c in db.query(Candidate).all()}
+    assert texts == {"Legacy": CV_TEXT, "Short": "Hi", "Empty": None}
+    db.close()
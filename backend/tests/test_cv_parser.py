@@ -1,10 +1,82 @@
 """Unit tests for CV parser"""
 
 import os
+from unittest.mock import patch
+from xml.etree import ElementTree
 
+import docx
 import pytest
 
-from app.utils.cv_parser import CVParser
+from app.utils.cv_parser import W_BODY, CVParser
+
+
+def make_pdf(pages):
+    """Build a minimal PDF with one line of text per page"""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        )
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(kids),
+        len(kids),
+    )
+
+    output = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return output
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    """Write a three page PDF to disk"""
+    path = tmp_path / "cv.pdf"
+    path.write_bytes(make_pdf(["John Doe", "Python developer", "Docker expert"]))
+    return str(path)
+
+
+@pytest.fixture
+def docx_file(tmp_path):
+    """Write a DOCX with a layout table between paragraphs"""
+    document = docx.Document()
+    document.add_paragraph("John Doe")
+    paragraph = document.add_paragraph("Skills:\tPython")
+    paragraph.add_run().add_break()
+    paragraph.add_run("Docker")
+    paragraph.paragraph_format.tab_stops.add_tab_stop(docx.shared.Inches(2))
+
+    table = document.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = "Email"
+    table.cell(0, 1).text = "john@example.com"
+    table.cell(1, 0).text = "Languages"
+    table.cell(1, 1).text = "English, Hebrew"
+    document.add_paragraph("References on request")
+
+    path = tmp_path / "cv.docx"
+    document.save(path)
+    return str(path)
 
 
 @pytest.fixture
@@ -66,3 +138,102 @@ def test_extract_skills(parser):
     assert "Python" in skills
     assert "JavaScript" in skills
     assert "Docker" in skills
+
+
+def test_extract_from_pdf_joins_pages(parser, pdf_file):
+    """Test PDF text is extracted page by page"""
+    text = parser._extract_from_pdf(pdf_file)
+
+    assert text == "John Doe\nPython developer\nDocker expert"
+    stats = parser.last_extraction_stats
+    assert stats["engine"] == "pypdf2"
+    assert stats["pages"] == 3
+    assert stats["truncated"] is None
+    assert len(stats["page_timings_ms"]) == 3
+
+
+def test_extract_from_pdf_respects_budgets(pdf_file):
+    """Test extraction stops at the page and character budgets"""
+    parser = CVParser(pdf_max_pages=2)
+    assert parser._extract_from_pdf(pdf_file) == "John Doe\nPython developer"
+    assert parser.last_extraction_stats["truncated"] == "pages"
+
+    parser = CVParser(pdf_max_chars=12)
+    assert parser._extract_from_pdf(pdf_file) == "John Doe\nPyth"
+    assert parser.last_extraction_stats["truncated"] == "chars"
+
+
+def test_extract_from_pdf_falls_back_to_pdfplumber(parser, pdf_file):
+    """Test pdfplumber is only used when PyPDF2 returns no text"""
+    with patch("PyPDF2.PageObject.extract_text", return_value=""):
+        text = parser._extract_from_pdf(pdf_file)
+
+    assert "Python developer" in text
+    assert parser.last_extraction_stats["engine"] == "pdfplumber"
+
+
+def test_extract_from_docx_includes_tables_in_order(parser, docx_file):
+    """Test DOCX paragraphs and table cells are streamed in document order"""
+    text = parser._extract_from_docx(docx_file)
+
+    assert text == (
+        "John Doe\nSkills:\tPython\nDocker\n"
+        "Email\njohn@example.com\nLanguages\nEnglish, Hebrew\n"
+        "References on request"
+    )
+    assert parser.parse_file(docx_file, "docx")["data"]["email"] == "john@example.com"
+
+
+def test_iter_docx_paragraphs_drops_read_body_elements(parser, docx_file):
+    """Test paragraphs and tables are removed from the parsed tree once read"""
+    bodies, ended = [], []
+    iterparse = ElementTree.iterparse
+
+    def recording_iterparse(*args, **kwargs):
+        for event, element in iterparse(*args, **kwargs):
+            if event == "start" and element.tag == W_BODY:
+                bodies.append(element)
+            elif event == "end":
+                ended.append(element)
+            yield event, element
+
+    # The parser may have built elements ahead of the events; only those
+    # read before the paragraph being yielded must be gone
+    with patch.object(ElementTree, "iterparse", recording_iterparse):
+        stale = [
+            [child for child in bodies[0] if child in ended[:-1]]
+            for _ in parser.iter_docx_paragraphs(docx_file)
+        ]
+
+    assert len(stale) == 7
+    assert not any(stale)
+    assert len(bodies[0]) == 0
+
+
+def test_extract_from_docx_falls_back_to_python_docx(parser, docx_file):
+    """Test python-docx is used when word/document.xml cannot be streamed"""
+    with patch.object(
+        CVParser, "iter_docx_paragraphs", side_effect=KeyError("word/document.xml")
+    ):
+        text = parser._extract_from_docx(docx_file)
+
+    assert text == "John Doe\nSkills:\tPython\nDocker\nReferences on request"
+
+
+def test_extract_fields_matches_individual_extractors(parser):
+    """Test the single-pass pipeline agrees with each extractor run alone"""
+    sample_dir = os.path.join(os.path.dirname(__file__), "..", "storage", "sample_cvs")
+
+    for file_name in sorted(os.listdir(sample_dir)):
+        with open(os.path.join(sample_dir, file_name)) as f:
+            text = f.read()
+
+        fields = parser.extract_fields(text)
+
+        assert fields["name"] == parser._extract_name(text)
+        assert fields["email"] == parser._extract_email(text)
+        assert fields["phone"] == parser._extract_phone(text)
+        assert fields["education"] == parser._extract_education(text)
+        assert fields["years_of_experience"] == parser._estimate_experience(text)
+        assert sorted(fields["skills"]) == sorted(parser._extract_skills(text))
+        assert fields["raw_text"] == text
@@ -0,0 +1,105 @@
+"""Tests for candidate facet tags and counts"""
+
+import pytest
+
+from app.models import Candidate, CandidateTag, FacetCount
+from app.models.facets import experience_band, rebuild_facets
+
+
+@pytest.fixture
+def db(db):
+    """Add a few tagged candidates"""
+    db.add_all(
+        [
+            Candidate(
+                name="Alice",
+                skills=["Python", "SQL"],
+                languages=["English"],
+                years_of_experience=6,
+                parse_status="success",
+            ),
+            Candidate(
+                name="Bob",
+                skills=["Python", "Docker"],
+                languages=["English", "Hebrew"],
+                years_of_experience=1,
+                parse_status="success",
+            ),
+        ]
+    )
+    db.commit()
+    return db
+
+
+def counts(db):
+    return {
+        (row.facet, row.value): row.count
+        for row in db.query(FacetCount).filter(FacetCount.count > 0)
+    }
+
+
+def test_experience_band():
+    """Test years of experience map to their bands"""
+    assert [experience_band(years) for years in (None, 1.5, 2, 9.9, 10, 30)] == [
+        "0-2",
+        "0-2",
+        "2-5",
+        "5-10",
+        "10+",
+        "10+",
+    ]
+
+
+def test_facet_counts_on_insert(db):
+    """Test inserting candidates tags them and counts each facet value"""
+    assert counts(db) == {
+        ("skill", "Python"): 2,
+        ("skill", "SQL"): 1,
+        ("skill", "Docker"): 1,
+        ("language", "English"): 2,
+        ("language", "Hebrew"): 1,
+        ("experience", "5-10"): 1,
+        ("experience", "0-2"): 1,
+        ("status", "success"): 2,
+    }
+    assert db.query(CandidateTag).count() == sum(counts(db).values())
+
+
+def test_facet_counts_on_update_and_delete(db):
+    """Test updates move counts between values and deletes remove them"""
+    alice = db.query(Candidate).filter(Candidate.name == "Alice").one()
+    alice.skills = ["Python", "Rust"]
+    alice.years_of_experience = 12
+    db.commit()
+
+    after_update = counts(db)
+    assert after_update[("skill", "Rust")] == 1
+    assert ("skill", "SQL") not in after_update
+    assert after_update[("experience", "10+")] == 1
+    assert ("experience", "5-10") not in after_update
+    assert after_update[("skill", "Python")] == 2
+
+    db.delete(alice)
+    db.commit()
+
+    assert counts(db) == {
+        ("skill", "Python"): 1,
+        ("skill", "Docker"): 1,
+        ("language", "English"): 1,
+        ("language", "Hebrew"): 1,
+        ("experience", "0-2"): 1,
+        ("status", "success"): 1,
+    }
+    assert (
+        db.query(CandidateTag).filter(CandidateTag.candidate_id == alice.id).all() == []
+    )
+
+
+def test_rebuild_matches_incremental_counts(db):
+    """Test rebuilding from scratch gives the incrementally maintained counts"""
+    incremental = counts(db)
+
+    rebuild_facets(db.connection())
+    db.commit()
+
+    assert counts(db) == incremental
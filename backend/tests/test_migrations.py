@@ -0,0 +1,145 @@
+"""Tests for Alembic migrations and hot query indexes"""
+
+import os
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import Session
+
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from app.database import Base
+from app.models import AuditLog, Candidate, CandidateScore, Job
+from app.models.search import include_object
+
+BACKEND_DIR = os.path.join(os.path.dirname(__file__), "..")
+
+HOT_INDEXES = {
+    "candidate_scores": {
+        "ix_candidate_scores_job_id_rank",
+        "ix_candidate_scores_candidate_id",
+    },
+    "candidates": {"ix_candidates_parse_status"},
+    "audit_logs": {"ix_audit_logs_timestamp"},
+    "jobs": {"ix_jobs_status"},
+}
+
+
+@pytest.fixture
+def alembic_config(tmp_path):
+    """Point Alembic at an empty SQLite file"""
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+    config.set_main_option("sqlalchemy.url", f"sqlite:///{tmp_path / 'migrated.db'}")
+    return config
+
+
+@pytest.fixture
+def engine(alembic_config):
+    """Create a database migrated to the latest revision"""
+    command.upgrade(alembic_config, "head")
+    engine = create_engine(alembic_config.get_main_option("sqlalchemy.url"))
+    yield engine
+    engine.dispose()
+
+
+def index_names(engine, table):
+    return {index["name"] for index in inspect(engine).get_indexes(table)}
+
+
+def test_migrations_match_models(engine):
+    """Test the migrated schema has every table and index the models declare"""
+    with engine.connect() as connection:
+        context = MigrationContext.configure(
+            connection, opts={"include_object": include_object}
+        )
+        diff = compare_metadata(context, Base.metadata)
+
+    assert diff == []
+
+
+def test_index_migration_downgrade(engine, alembic_config):
+    """Test the index migration can be reverted and re-applied"""
+    command.downgrade(alembic_config, "0001")
+    for table, names in HOT_INDEXES.items():
+        assert not names & index_names(engine, table)
+
+    command.upgrade(alembic_config, "head")
+    for table, names in HOT_INDEXES.items():
+        assert names <= index_names(engine, table)
+
+
+@pytest.mark.parametrize(
+    "query, index",
+    [
+        (
+            lambda db: db.query(CandidateScore)
+            .filter(CandidateScore.job_id == 1)
+            .order_by(CandidateScore.rank),
+            "ix_candidate_scores_job_id_rank",
+        ),
+        (
+            lambda db: db.query(CandidateScore).filter(
+                CandidateScore.candidate_id == 1
+            ),
+            "ix_candidate_scores_candidate_id",
+        ),
+        (
+            lambda db: db.query(Candidate).filter(Candidate.parse_status == "success"),
+            "ix_candidates_parse_status",
+        ),
+        (
+            lambda db: db.query(AuditLog)
+            .order_by(AuditLog.timestamp.desc())
+            .limit(100),
+            "ix_audit_logs_timestamp",
+        ),
+        (
+            lambda db: db.query(Job).filter(Job.status == "active"),
+            "ix_jobs_status",
+        ),
+    ],
+)
+def test_hot_queries_use_indexes(engine, query, index):
+    """Test SQLite plans the hot queries through their index, without sorting"""
+    with Session(bind=engine) as db:
+        statement = query(db).statement.compile(
+            dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}
+        )
+        plan = " ".join(
+            row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {statement}"))
+        )
+
+    assert f"USING INDEX {index}" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_baseline_database_upgrades_to_models(alembic_config):
+    """Test a pre-migrations database stamped 0001 upgrades to the models"""
+    command.upgrade(alembic_config, "0001")
+    engine = create_engine(alembic_config.get_main_option("sqlalchemy.url"))
+    with engine.begin() as connection:
+        assert "file_hash" not in {
+            column["name"] for column in inspect(connection).get_columns("candidates")
+        }
+        assert not inspect(connection).has_table("parse_cache")
+        connection.execute(
+            text("INSERT INTO candidates (name, raw_text) VALUES ('Old', :raw_text)"),
+            {"raw_text": "Legacy CV text " * 50},
+        )
+
+    command.upgrade(alembic_config, "head")
+
+    with engine.connect() as connection:
+        context = MigrationContext.configure(
+            connection, opts={"include_object": include_object}
+        )
+        assert compare_metadata(context, Base.metadata) == []
+        stored = connection.execute(text("SELECT raw_text FROM candidates")).scalar()
+    assert isinstance(stored, bytes) and len(stored) < len("Legacy CV text " * 50)
+    with Session(bind=engine) as db:
+        assert db.query(Candidate).one().raw_text == "Legacy CV text " * 50
+    engine.dispose()
@@ -0,0 +1,109 @@
+"""Tests for keyset pagination"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException, Response
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models import AuditLog
+from app.utils.pagination import (
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+    paginate,
+    set_next_cursor,
+)
+
+ORDER = (AuditLog.timestamp, AuditLog.id)
+
+
+@pytest.fixture
+def db(db):
+    """Add audit entries where several share a timestamp"""
+    start = datetime(2026, 1, 1)
+    db.add_all(
+        AuditLog(action="test", timestamp=start + timedelta(seconds=i // 3))
+        for i in range(25)
+    )
+    db.commit()
+    return db
+
+
+def test_cursor_round_trip():
+    """Test cursors decode back to the sort key, including datetimes"""
+    timestamp = datetime(2026, 5, 4, 3, 2, 1, 123456)
+    cursor = encode_cursor([timestamp, 42])
+
+    assert decode_cursor(cursor, ORDER) == [timestamp, 42]
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor([1]), "e30"])
+def test_invalid_cursor(cursor):
+    """Test malformed cursors are rejected with a 400"""
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, ORDER)
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "values", [["abc"], [True], [None], [1.5], [[1]], ["2026-01-01T00:00:00"]]
+)
+def test_cursor_of_wrong_type(values):
+    """Test cursor values not of their sort column's type are rejected"""
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(encode_cursor(values), (AuditLog.id,))
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == "Invalid pagination cursor"
+
+
+def test_cursor_walk_visits_every_row_once(db):
+    """Test following cursors returns each row exactly once, newest first"""
+    seen, cursor = [], None
+    while True:
+        query = paginate(db.query(AuditLog), ORDER, cursor, limit=4, descending=True)
+        page = query.all()
+        seen.extend(page)
+        response = Response()
+        set_next_cursor(response, page, ORDER, 4)
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            break
+
+    expected = sorted(
+        db.query(AuditLog).all(), key=lambda log: (log.timestamp, log.id), reverse=True
+    )
+    assert [log.id for log in seen] == [log.id for log in expected]
+
+
+def test_cursor_walk_over_server_default_timestamps(engine):
+    """Test cursors terminate over same-second entries stamped by the database"""
+    with Session(bind=engine) as db:
+        for _ in range(5):
+            db.execute(text("INSERT INTO audit_logs (action) VALUES ('test')"))
+        db.commit()
+
+        seen, cursor = [], None
+        for _ in range(10):
+            query = paginate(
+                db.query(AuditLog), ORDER, cursor, limit=2, descending=True
+            )
+            page = query.all()
+            seen.extend(log.id for log in page)
+            response = Response()
+            set_next_cursor(response, page, ORDER, 2)
+            cursor = response.headers.get(NEXT_CURSOR_HEADER)
+            if cursor is None:
+                break
+
+    assert seen == [5, 4, 3, 2, 1]
+
+
+def test_skip_still_supported(db):
+    """Test offset paging keeps working for existing clients"""
+    page = paginate(db.query(AuditLog), (AuditLog.id,), skip=20, limit=10).all()
+
+    assert [log.id for log in page] == [21, 22, 23, 24, 25]
@@ -0,0 +1,98 @@
+"""Unit tests for the parse result cache"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.models import ParseCache
+from app.services.parse_cache_service import ParseCacheService
+from app.utils.cv_parser import CVParser
+
+CV_TEXT = "Jane Smith\njane@example.com\nPython and Docker developer, speaks English"
+
+
+@pytest.fixture
+def parser():
+    """Create a parser with a small taxonomy"""
+    parser = CVParser()
+    parser.skills_taxonomy = {
+        "technical": ["Python"],
+        "soft": [],
+        "languages": ["English"],
+    }
+    return parser
+
+
+@pytest.fixture
+def cv_file(tmp_path):
+    """Write a sample CV to disk"""
+    path = tmp_path / "cv.txt"
+    path.write_text(CV_TEXT)
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    """Reset process-wide counters between tests"""
+    ParseCacheService.reset_stats()
+
+
+def test_hit_skips_parsing(db, parser, cv_file):
+    """Test a second parse of the same file is served from cache"""
+    cache = ParseCacheService(db, parser)
+    first = cache.parse_file(cv_file, "txt", "a" * 64)
+
+    with patch.object(parser, "parse_file") as parse_file:
+        second = cache.parse_file(cv_file, "txt", "a" * 64)
+
+    parse_file.assert_not_called()
+    assert second == first
+    assert db.query(ParseCache).one().hit_count == 1
+
+    stats = ParseCacheService.get_stats(db)
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 50.0
+
+
+def test_taxonomy_change_refreshes_only_taxonomy_fields(db, parser, cv_file):
+    """Test a taxonomy change re-extracts skills without re-parsing the file"""
+    cache = ParseCacheService(db, parser)
+    first = cache.parse_file(cv_file, "txt", "b" * 64)
+    assert first["data"]["skills"] == ["Python"]
+
+    parser.skills_taxonomy["technical"].append("Docker")
+    with patch.object(parser, "_extract_text") as extract_text, patch.object(
+        parser, "_extract_email"
+    ) as extract_email:
+        second = cache.parse_file(cv_file, "txt", "b" * 64)
+
+    extract_text.assert_not_called()
+    extract_email.assert_not_called()
+    assert sorted(second["data"]["skills"]) == ["Docker", "Python"]
+    assert second["data"]["email"] == first["data"]["email"]
+    assert db.query(ParseCache).one().taxonomy_version == parser.taxonomy_version
+    assert ParseCacheService.get_stats(db)["partial_hits"] == 1
+
+
+def test_parser_version_change_misses(db, parser, cv_file):
+    """Test bumping the parser version invalidates cached results"""
+    cache = ParseCacheService(db, parser)
+    cache.parse_file(cv_file, "txt", "c" * 64)
+
+    with patch.object(CVParser, "PARSER_VERSION", "99"):
+        cache.parse_file(cv_file, "txt", "c" * 64)
+
+    assert db.query(ParseCache).count() == 2
+    assert ParseCacheService.get_stats(db)["misses"] == 2
+
+
+def test_failed_parse_is_not_cached(db, parser, tmp_path):
+    """Test failures are retried on the next upload"""
+    empty = tmp_path / "empty.txt"
+    empty.write_text("")
+
+    result = ParseCacheService(db, parser).parse_file(str(empty), "txt", "d" * 64)
+
+    assert result["success"] is False
+    assert db.query(ParseCache).count() == 0
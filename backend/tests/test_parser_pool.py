@@ -0,0 +1,87 @@
+"""Tests for sandboxed parser worker processes"""
+
+import os
+import signal
+import time
+
+import pytest
+
+from app.services.parser_pool import IsolatedCVParser, ParserWorkerPool
+from app.utils.cv_parser import CVParser
+
+
+class MisbehavingParser(CVParser):
+    """Parser that misbehaves depending on the file name
+
+    Workers import it by name, so it lives at module level.
+    """
+
+    def _extract_text(self, file_path, file_type):
+        """Otherwise report the worker's pid and parent pid"""
+        name = os.path.basename(file_path)
+        if name == "hang.txt":
+            time.sleep(30)
+        elif name == "huge.txt":
+            bytearray(2 * 1024**3)
+        elif name == "crash.txt":
+            os.kill(os.getpid(), signal.SIGKILL)
+        return f"Worker {os.getpid()} {os.getppid()}"
+
+
+@pytest.fixture
+def pool():
+    """Create a single-worker pool with tight limits"""
+    pool = ParserWorkerPool(
+        workers=1,
+        timeout=2,
+        memory_limit_mb=512,
+        max_tasks_per_worker=2,
+        parser_class=MisbehavingParser,
+    )
+    yield pool
+    pool.shutdown()
+
+
+def worker_pid(result):
+    return int(result["data"]["raw_text"].split()[1])
+
+
+def test_parse_runs_in_worker_process(pool):
+    """Test files are parsed outside the calling process"""
+    result = IsolatedCVParser(pool=pool).parse_file("cv.txt", "txt")
+
+    assert result["success"]
+    assert worker_pid(result) != os.getpid()
+
+
+@pytest.mark.parametrize(
+    "file_name, error",
+    [
+        ("hang.txt", "Parsing timed out after 2s"),
+        ("huge.txt", "Ran out of memory while parsing file"),
+        ("crash.txt", "Parser worker was killed by SIGKILL"),
+    ],
+)
+def test_failed_parse_does_not_affect_next_file(pool, file_name, error):
+    """Test a hung, oversized or crashing parse fails alone"""
+    parser = IsolatedCVParser(pool=pool)
+
+    assert parser.parse_file(file_name, "txt") == {"success": False, "error": error}
+    assert parser.parse_file("cv.txt", "txt")["success"]
+
+
+def test_workers_are_not_forked_from_the_calling_process(pool):
+    """Test workers are started by the fork server, not forked from this process"""
+    result = IsolatedCVParser(pool=pool).parse_file("cv.txt", "txt")
+
+    assert int(result["data"]["raw_text"].split()[2]) != os.getpid()
+
+
+def test_workers_are_recycled(pool):
+    """Test a worker is replaced after max_tasks_per_worker files"""
+    parser = IsolatedCVParser(pool=pool)
+    pids = [worker_pid(parser.parse_file("cv.txt", "txt")) for _ in range(4)]
+
+    assert pids[0] == pids[1]
+    assert pids[2] == pids[3]
+    assert pids[0] != pids[2]
@@ -0,0 +1,71 @@
+"""Tests for the bounded password hashing pool"""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.services.password_pool import PasswordHashPool, PasswordPoolBusy
+
+
+def test_pool_runs_work_and_reports_stats():
+    """Test results come back from the pool and runs are counted"""
+    pool = PasswordHashPool(workers=2, max_waiting=4)
+
+    async def hash_many():
+        return await asyncio.gather(*(pool.run(str.upper, f"pw{i}") for i in range(5)))
+
+    assert asyncio.run(hash_many()) == ["PW0", "PW1", "PW2", "PW3", "PW4"]
+    stats = pool.get_stats()
+    assert (stats["completed"], stats["running"], stats["waiting"]) == (5, 0, 0)
+    assert stats["rejected"] == 0
+    pool.shutdown()
+
+
+def test_pool_rejects_beyond_waiting_limit():
+    """Test requests beyond workers + max_waiting fail fast"""
+    pool = PasswordHashPool(workers=1, max_waiting=1)
+    release = threading.Event()
+
+    async def burst():
+        running = asyncio.ensure_future(pool.run(release.wait))
+        waiting = asyncio.ensure_future(pool.run(lambda: "queued"))
+        await asyncio.sleep(0.05)
+        with pytest.raises(PasswordPoolBusy):
+            await pool.run(lambda: "rejected")
+        assert pool.get_stats()["waiting"] == 1
+        release.set()
+        return await running, await waiting
+
+    assert asyncio.run(burst()) == (True, "queued")
+    stats = pool.get_stats()
+    assert (stats["completed"], stats["rejected"]) == (2, 1)
+    pool.shutdown()
+
+
+def test_cancelled_waiters_release_their_slots():
+    """Test queued calls cancelled by their awaiter do not leak waiting slots"""
+    pool = PasswordHashPool(workers=1, max_waiting=3)
+    release = threading.Event()
+
+    async def cancel_queued():
+        running = asyncio.ensure_future(pool.run(release.wait))
+        try:
+            queued = [
+                asyncio.ensure_future(pool.run(lambda: "queued")) for _ in range(3)
+            ]
+            await asyncio.sleep(0.05)
+            for call in queued:
+                call.cancel()
+            await asyncio.gather(*queued, return_exceptions=True)
+            assert pool.get_stats()["waiting"] == 0
+        finally:
+            release.set()
+            await running
+        # Every slot is free again
+        return await asyncio.gather(*(pool.run(lambda: "ok") for _ in range(4)))
+
+    assert asyncio.run(cancel_queued()) == ["ok"] * 4
+    stats = pool.get_stats()
+    assert (stats["running"], stats["waiting"], stats["rejected"]) == (0, 0, 0)
+    pool.shutdown()
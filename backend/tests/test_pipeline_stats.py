@@ -0,0 +1,154 @@
+"""Tests for the materialized pipeline statistics"""
+
+import pytest
+
+from app.models import (
+    Candidate,
+    CandidateScore,
+    Job,
+    JobScoreStats,
+    PipelineSummary,
+)
+from app.models.pipeline_stats import SUMMARY_ID, rebuild_pipeline_stats
+from app.services.matching_service import MatchingService
+
+
+@pytest.fixture
+def db(db):
+    """Add a few candidates and jobs"""
+    db.add_all(
+        [
+            Candidate(
+                name="Alice",
+                skills=["Python", "SQL"],
+                years_of_experience=6,
+                parse_status="success",
+            ),
+            Candidate(
+                name="Bob",
+                skills=["Python", "Docker"],
+                years_of_experience=1,
+                parse_status="success",
+            ),
+            Candidate(name="Carol", parse_status="failed"),
+            Candidate(name="Dan"),
+            Job(title="Backend Developer", required_skills=["Python", "SQL"]),
+            Job(title="Designer", required_skills=["Figma"], status="draft"),
+        ]
+    )
+    db.commit()
+    return db
+
+
+def summary(db):
+    row = db.get(PipelineSummary, SUMMARY_ID, populate_existing=True)
+    return {
+        "candidates": row.candidates,
+        "parsed": row.candidates_parsed,
+        "failed": row.candidates_failed,
+        "jobs": row.jobs,
+        "active": row.jobs_active,
+    }
+
+
+def job_scores(db):
+    return {
+        row.job_id: (row.ranked, row.scored, round(row.score_total, 2))
+        for row in db.query(JobScoreStats).populate_existing()
+    }
+
+
+def test_counts_follow_candidates_and_jobs(db):
+    """Test inserts, status changes and deletes adjust the summary row"""
+    assert summary(db) == {
+        "candidates": 4,
+        "parsed": 2,
+        "failed": 1,
+        "jobs": 2,
+        "active": 1,
+    }
+
+    dan = db.query(Candidate).filter(Candidate.name == "Dan").one()
+    dan.parse_status = "success"
+    designer = db.query(Job).filter(Job.title == "Designer").one()
+    designer.status = "active"
+    db.commit()
+    assert summary(db)["parsed"] == 3
+    assert summary(db)["active"] == 2
+
+    db.delete(db.query(Candidate).filter(Candidate.name == "Carol").one())
+    db.delete(designer)
+    db.commit()
+    assert summary(db) == {
+        "candidates": 3,
+        "parsed": 3,
+        "failed": 0,
+        "jobs": 1,
+        "active": 1,
+    }
+
+
+def test_score_aggregates_follow_rankings(db):
+    """Test re-ranking replaces a job's aggregates and deletes remove scores"""
+    job = db.query(Job).filter(Job.title == "Backend Developer").one()
+    scores = MatchingService(db).rank_candidates_for_job(job.id)
+    total = round(sum(score.total_score for score in scores), 2)
+    assert job_scores(db) == {job.id: (2, 2, total)}
+
+    # Ranking again replaces the previous scores rather than adding to them
+    MatchingService(db).rank_candidates_for_job(job.id)
+    assert job_scores(db) == {job.id: (2, 2, total)}
+
+    bob = db.query(Candidate).filter(Candidate.name == "Bob").one()
+    bob_score = next(score for score in scores if score.candidate_id == bob.id)
+    remaining = round(total - bob_score.total_score, 2)
+    db.delete(bob)
+    db.commit()
+    assert job_scores(db) == {job.id: (1, 1, remaining)}
+
+    db.delete(job)
+    db.commit()
+    assert job_scores(db) == {}
+
+
+def test_null_scores_are_ranked_but_not_scored(db):
+    """Test null total scores count towards ranked but not the score sum"""
+    job = db.query(Job).filter(Job.title == "Backend Developer").one()
+    alice, bob = db.query(Candidate).filter(Candidate.name.in_(["Alice", "Bob"]))
+    score = CandidateScore(candidate_id=alice.id, job_id=job.id, total_score=60.0)
+    db.add(score)
+    db.commit()
+    assert job_scores(db) == {job.id: (1, 1, 60.0)}
+
+    score.total_score = None
+    db.commit()
+    assert job_scores(db) == {job.id: (1, 0, 0.0)}
+
+    db.add(CandidateScore(candidate_id=bob.id, job_id=job.id, total_score=40.0))
+    score.total_score = 60.0
+    db.commit()
+    assert job_scores(db) == {job.id: (2, 2, 100.0)}
+
+    score.total_score = None
+    db.commit()
+    assert job_scores(db) == {job.id: (2, 1, 40.0)}
+
+    rebuild_pipeline_stats(db.connection())
+    db.commit()
+    assert job_scores(db) == {job.id: (2, 1, 40.0)}
+
+    db.delete(score)
+    db.commit()
+    assert job_scores(db) == {job.id: (1, 1, 40.0)}
+
+
+def test_rebuild_matches_incremental_stats(db):
+    """Test rebuilding from scratch gives the incrementally maintained stats"""
+    job = db.query(Job).filter(Job.title == "Backend Developer").one()
+    MatchingService(db).rank_candidates_for_job(job.id)
+    incremental = (summary(db), job_scores(db))
+
+    rebuild_pipeline_stats(db.connection())
+    db.commit()
+
+    assert (summary(db), job_scores(db)) == incremental
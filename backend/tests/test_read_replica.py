@@ -0,0 +1,138 @@
+"""Tests for read/write routing to a read replica"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.database import (
+    Base,
+    build_async_engine,
+    build_engine,
+    get_async_db,
+    get_async_read_db,
+    get_db,
+)
+from app.main import app
+from app.models import Candidate, User
+from app.utils.auth import create_access_token
+
+
+@pytest.fixture
+def databases(tmp_path):
+    """Use one SQLite file as the primary and another as the replica"""
+    primary_url = f"sqlite:///{tmp_path / 'primary.db'}"
+    primary = build_engine(primary_url)
+    replica_url = f"sqlite:///{tmp_path / 'replica.db'}"
+    replica_writer = build_engine(replica_url)
+    replica = build_engine(replica_url, read_only=True)
+    for engine in (primary, replica_writer):
+        Base.metadata.create_all(bind=engine)
+
+    PrimarySession = sessionmaker(bind=primary)
+    ReplicaSession = sessionmaker(bind=replica)
+    AsyncPrimarySession, AsyncReplicaSession = (
+        sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+        for engine in (
+            build_async_engine(primary_url),
+            build_async_engine(replica_url, read_only=True),
+        )
+    )
+
+    def override(Session):
+        def get_session():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        return get_session
+
+    def override_async(Session):
+        async def get_session():
+            async with Session() as db:
+                yield db
+
+        return get_session
+
+    overrides = dict(app.dependency_overrides)
+    app.dependency_overrides[get_db] = override(PrimarySession)
+    app.dependency_overrides[get_async_db] = override_async(AsyncPrimarySession)
+    app.dependency_overrides[get_async_read_db] = override_async(AsyncReplicaSession)
+
+    yield PrimarySession, sessionmaker(bind=replica_writer), ReplicaSession
+
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(overrides)
+    for engine in (primary, replica_writer, replica):
+        engine.dispose()
+
+
+@pytest.fixture
+def headers(databases):
+    """Authenticate against a user on the primary"""
+    PrimarySession = databases[0]
+    db = PrimarySession()
+    db.add(
+        User(
+            email="reader@example.com",
+            full_name="Reader",
+            role="HR_RECRUITER",
+            hashed_password="unused",
+        )
+    )
+    db.commit()
+    db.close()
+
+    token = create_access_token({"sub": "reader@example.com"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def add_candidate(Session, name):
+    db = Session()
+    candidate = Candidate(name=name, parse_status="success", skills=[], languages=[])
+    db.add(candidate)
+    db.commit()
+    candidate_id = candidate.id
+    db.close()
+    return candidate_id
+
+
+def test_read_only_routes_use_replica(databases, headers):
+    """Test list and report endpoints read from the replica"""
+    PrimarySession, ReplicaWriter, _ = databases
+    add_candidate(PrimarySession, "Primary Candidate")
+    add_candidate(ReplicaWriter, "Replica Candidate")
+    add_candidate(ReplicaWriter, "Second Replica Candidate")
+
+    client = TestClient(app)
+    response = client.get("/api/candidates", headers=headers)
+    assert [c["name"] for c in response.json()] == [
+        "Replica Candidate",
+        "Second Replica Candidate",
+    ]
+
+    response = client.get("/api/reports/pipeline-stats", headers=headers)
+    assert response.json()["total_candidates"] == 2
+
+
+def test_single_candidate_reads_primary(databases, headers):
+    """Test read-your-writes paths stay on the primary"""
+    PrimarySession = databases[0]
+    add_candidate(PrimarySession, "Just Uploaded")
+
+    client = TestClient(app)
+    response = client.get("/api/candidates/1", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "Just Uploaded"
+
+
+def test_replica_engine_rejects_writes(databases):
+    """Test sessions on the read-only engine cannot write"""
+    ReplicaSession = databases[2]
+
+    with pytest.raises(OperationalError):
+        add_candidate(ReplicaSession, "Not Allowed")
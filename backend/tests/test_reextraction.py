@@ -0,0 +1,92 @@
+"""Tests for taxonomy-change re-extraction"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.models import Candidate
+from app.services.reextraction_service import ReextractionService
+from app.utils.cv_parser import CVParser
+
+
+@pytest.fixture
+def db(db):
+    """Add candidates parsed with the current taxonomy"""
+    db.add_all(
+        [
+            Candidate(
+                name="Python Dev",
+                raw_text="Python and Docker, fluent English",
+                skills=["Python"],
+                languages=["English"],
+                parse_status="success",
+            ),
+            Candidate(
+                name="Java Dev",
+                raw_text="Java and Kotlin",
+                skills=["Java"],
+                languages=[],
+                parse_status="success",
+            ),
+            Candidate(
+                name="Sales",
+                raw_text="Negotiation, Spanish",
+                skills=[],
+                languages=["Spanish"],
+                parse_status="success",
+            ),
+            Candidate(name="Parse Failed", parse_status="failed"),
+        ]
+    )
+    db.commit()
+    return db
+
+
+@pytest.fixture
+def parser():
+    """Create a parser with an updated taxonomy"""
+    parser = CVParser()
+    parser.skills_taxonomy = {
+        "technical": ["Python", "Docker", "Kotlin"],
+        "soft": [],
+        "languages": ["English", "Spanish"],
+    }
+    return parser
+
+
+def skills_by_name(db):
+    return {c.name: sorted(c.skills or []) for c in db.query(Candidate).all()}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_reextract_updates_changed_candidates(db, parser, workers):
+    """Test only taxonomy fields of changed candidates are rewritten"""
+    with patch.object(CVParser, "parse_file") as parse_file:
+        report = ReextractionService(
+            db, parser=parser, workers=workers, batch_size=2
+        ).run()
+
+    parse_file.assert_not_called()
+    assert report["scanned"] == 3
+    assert report["changed"] == 2
+    assert report["unchanged"] == 1
+    assert report["skills_gained"] == {"Docker": 1, "Kotlin": 1}
+    assert report["skills_lost"] == {"Java": 1}
+    assert report["languages_gained"] == {}
+
+    db.expire_all()
+    assert skills_by_name(db) == {
+        "Python Dev": ["Docker", "Python"],
+        "Java Dev": ["Kotlin"],
+        "Sales": [],
+        "Parse Failed": [],
+    }
+
+
+def test_dry_run_reports_without_writing(db, parser):
+    """Test a dry run leaves candidates untouched"""
+    report = ReextractionService(db, parser=parser, workers=1).run(dry_run=True)
+
+    assert report["changed"] == 2
+    db.expire_all()
+    assert skills_by_name(db)["Java Dev"] == ["Java"]
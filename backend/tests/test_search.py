@@ -0,0 +1,123 @@
+"""Tests for full-text candidate search"""
+
+import pytest
+
+from app.config import settings
+from app.models import Candidate
+from app.services.search_service import SearchService
+
+
+@pytest.fixture
+def db(db):
+    """Add a few candidates to the search index"""
+    db.add_all(
+        [
+            Candidate(
+                name="Alice Kubernetes",
+                skills=["Go"],
+                raw_text="Platform engineer running clusters.",
+            ),
+            Candidate(
+                name="Bob Smith",
+                skills=["Kubernetes", "Docker"],
+                raw_text="DevOps engineer.",
+            ),
+            Candidate(
+                name="Carol Jones",
+                skills=["Python"],
+                raw_text="Backend developer who once deployed to Kubernetes.",
+            ),
+            Candidate(
+                name="Dan Brown",
+                skills=["Java"],
+                raw_text="Java developer building payment systems.",
+            ),
+        ]
+    )
+    db.commit()
+    return db
+
+
+def test_search_ranks_and_highlights(db):
+    """Test name and skill matches outrank CV text mentions, with snippets"""
+    results, next_cursor = SearchService(db).search("kubernetes")
+
+    assert [r["candidate"].name for r in results] == [
+        "Alice Kubernetes",
+        "Bob Smith",
+        "Carol Jones",
+    ]
+    assert results[0]["score"] > results[1]["score"] > results[2]["score"]
+    assert results[2]["snippet"] == (
+        "Backend developer who once deployed to <mark>Kubernetes</mark>."
+    )
+    assert next_cursor is None
+
+
+def test_search_snippets_escape_cv_markup(db):
+    """Test CV text is HTML-escaped and only the highlights are markup"""
+    db.add(
+        Candidate(
+            name="Eve Stone",
+            raw_text='<script>alert("x")</script> Rust & <b>Zig</b> engineer',
+        )
+    )
+    db.commit()
+
+    results, _ = SearchService(db).search("zig")
+
+    assert results[0]["snippet"] == (
+        "&lt;script&gt;alert(&quot;x&quot;)&lt;/script&gt; Rust &amp; "
+        "&lt;b&gt;<mark>Zig</mark>&lt;/b&gt; engineer"
+    )
+
+
+def test_search_index_follows_updates_and_deletes(db):
+    """Test the triggers keep the index in sync with the candidates table"""
+    search = SearchService(db)
+    dan = db.query(Candidate).filter(Candidate.name == "Dan Brown").one()
+
+    dan.raw_text = "Rust developer building trading systems."
+    db.commit()
+    assert [r["candidate"].id for r in search.search("rust")[0]] == [dan.id]
+    assert search.search("payment")[0] == []
+
+    db.delete(dan)
+    db.commit()
+    assert search.search("rust")[0] == []
+
+
+def test_search_cursor_pagination(db):
+    """Test following the cursor returns every match exactly once"""
+    search = SearchService(db)
+    names, cursor = [], None
+    while True:
+        results, cursor = search.search("developer", cursor, limit=1)
+        names.extend(r["candidate"].name for r in results)
+        if cursor is None:
+            break
+
+    assert names == [r["candidate"].name for r in search.search("developer")[0]]
+    assert sorted(names) == ["Carol Jones", "Dan Brown"]
+
+
+def test_search_escapes_query_syntax(db):
+    """Test FTS5 operators and punctuation in the query are treated as words"""
+    search = SearchService(db)
+
+    assert search.search('"c++" AND (NEAR') == ([], None)
+    assert search.search("   ") == ([], None)
+
+
+def test_search_rank_window(db, monkeypatch):
+    """Test broad queries are ranked within their newest matches only"""
+    monkeypatch.setattr(settings, "search_rank_window", 2)
+
+    search = SearchService(db)
+    results, _ = search.search("kubernetes")
+
+    assert [r["candidate"].name for r in results] == ["Bob Smith", "Carol Jones"]
+    assert search.windowed is True
+    # Two matches fit the window exactly
+    assert len(search.search("developer")[0]) == 2
+    assert search.windowed is False
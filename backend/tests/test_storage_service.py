@@ -0,0 +1,125 @@
+"""Unit tests for content-addressed CV storage"""
+
+import io
+import os
+
+import pytest
+
+from app.models import Candidate
+from app.services.storage_service import StorageService
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Create a storage service rooted in a temp directory"""
+    return StorageService(root=str(tmp_path / "cvs"))
+
+
+def test_store_shards_by_hash(storage):
+    """Test files are stored under their hash prefix"""
+    file_hash, file_path, pin = storage.store(io.BytesIO(b"John Doe CV"), "txt")
+
+    assert len(file_hash) == 64
+    assert file_path == os.path.join(
+        storage.root, file_hash[:2], file_hash[2:4], f"{file_hash}.txt"
+    )
+    with open(file_path, "rb") as f:
+        assert f.read() == b"John Doe CV"
+    assert os.listdir(storage.tmp_dir) == [os.path.basename(pin)]
+
+    storage.unpin(file_hash, file_path, pin)
+    assert os.listdir(storage.tmp_dir) == []
+    assert os.path.exists(file_path)
+
+
+def test_identical_uploads_share_blob(storage):
+    """Test identical content links to the existing blob"""
+    first = storage.store(io.BytesIO(b"same content"), "pdf")[:2]
+    second = storage.store(io.BytesIO(b"same content"), "pdf")[:2]
+    other = storage.store(io.BytesIO(b"other content"), "pdf")[:2]
+
+    assert first == second
+    assert other[1] != first[1]
+
+
+def test_release_only_unlinks_unreferenced_blobs(db, storage):
+    """Test deleting a candidate keeps blobs still used by others"""
+    file_hash, file_path, pin = storage.store(io.BytesIO(b"shared cv"), "txt")
+    first = Candidate(name="A", file_hash=file_hash, file_path=file_path)
+    second = Candidate(name="B", file_hash=file_hash, file_path=file_path)
+    db.add_all([first, second])
+    db.commit()
+    storage.unpin(file_hash, file_path, pin)
+
+    db.delete(first)
+    db.commit()
+    assert storage.release(db, file_hash, file_path) is False
+    assert os.path.exists(file_path)
+
+    db.delete(second)
+    db.commit()
+    assert storage.release(db, file_hash, file_path) is True
+    assert not os.path.exists(file_path)
+
+
+def test_blob_released_before_commit_is_restored(db, storage):
+    """Test a blob released between store and commit comes back on unpin"""
+    file_hash, file_path, pin = storage.store(io.BytesIO(b"racing cv"), "txt")
+
+    # Another candidate's deletion sees no committed reference yet
+    assert storage.release(db, file_hash, file_path) is True
+    assert not os.path.exists(file_path)
+
+    db.add(Candidate(name="A", file_hash=file_hash, file_path=file_path))
+    db.commit()
+    storage.unpin(file_hash, file_path, pin)
+
+    with open(file_path, "rb") as f:
+        assert f.read() == b"racing cv"
+    assert storage.release(db, file_hash, file_path) is False
+    assert os.listdir(storage.tmp_dir) == []
+
+
+def test_unpin_without_restore_after_failed_insert(db, storage):
+    """Test a pin dropped after a failed insert does not bring the blob back"""
+    file_hash, file_path, pin = storage.store(io.BytesIO(b"abandoned cv"), "txt")
+    assert storage.release(db, file_hash, file_path) is True
+
+    storage.unpin(file_hash, file_path, pin, restore=False)
+
+    assert not os.path.exists(file_path)
+    assert os.listdir(storage.tmp_dir) == []
+
+
+def test_migrate_legacy_files(db, storage, tmp_path):
+    """Test flat uploads are moved and external files are copied"""
+    os.makedirs(storage.root)
+    legacy_path = os.path.join(storage.root, "cv.txt")
+    with open(legacy_path, "wb") as f:
+        f.write(b"legacy upload")
+
+    external_path = str(tmp_path / "sample.txt")
+    with open(external_path, "wb") as f:
+        f.write(b"sample cv")
+
+    db.add_all(
+        [
+            Candidate(name="A", file_path=legacy_path, file_type="txt"),
+            Candidate(name="B", file_path=legacy_path, file_type="txt"),
+            Candidate(name="C", file_path=external_path, file_type="txt"),
+            Candidate(name="D", file_path=str(tmp_path / "gone.txt")),
+        ]
+    )
+    db.commit()
+
+    stats = storage.migrate_legacy_files(db)
+
+    assert stats == {"candidates": 3, "files": 2, "missing": 1, "deduplicated": 0}
+    assert not os.path.exists(legacy_path)
+    assert os.path.exists(external_path)
+
+    migrated = db.query(Candidate).filter(Candidate.file_hash.isnot(None)).all()
+    assert len(migrated) == 3
+    for candidate in migrated:
+        assert candidate.file_path == storage.blob_path(candidate.file_hash, "txt")
+        assert os.path.exists(candidate.file_path)
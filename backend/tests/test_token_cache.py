@@ -0,0 +1,70 @@
+"""Tests for the verified-token cache"""
+
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.config import settings
+from app.services import token_cache_service
+from app.services.token_cache_service import TokenCacheService
+from app.utils import auth
+from app.utils.auth import create_access_token, decode_access_token
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start every test with an empty cache and zeroed counters"""
+    TokenCacheService.clear()
+    TokenCacheService.reset_stats()
+    yield
+    TokenCacheService.clear()
+
+
+def test_verified_token_is_served_from_cache(monkeypatch):
+    """Test repeated decodes of a token skip signature verification"""
+    token = create_access_token({"sub": "jane@example.com"})
+    assert decode_access_token(token).email == "jane@example.com"
+
+    def fail(*args, **kwargs):
+        raise AssertionError("token verified again")
+
+    monkeypatch.setattr(auth.jwt, "decode", fail)
+    assert decode_access_token(token).email == "jane@example.com"
+    assert TokenCacheService.get_stats()["hits"] == 1
+
+
+def test_cached_token_expires_with_exp(monkeypatch):
+    """Test a cached token is rejected once its exp has passed"""
+    token = create_access_token(
+        {"sub": "jane@example.com"}, expires_delta=timedelta(minutes=5)
+    )
+    decode_access_token(token)
+    now = token_cache_service.time.time()
+
+    monkeypatch.setattr(token_cache_service.time, "time", lambda: now + 301)
+    assert TokenCacheService.get(token) is None
+
+
+def test_secret_rotation_purges_cache(monkeypatch):
+    """Test tokens signed with an old secret stop working after rotation"""
+    token = create_access_token({"sub": "jane@example.com"})
+    decode_access_token(token)
+
+    monkeypatch.setattr(settings, "secret_key", "rotated-secret")
+    with pytest.raises(HTTPException) as error:
+        decode_access_token(token)
+    assert error.value.status_code == 401
+    assert TokenCacheService.get_stats()["entries"] == 0
+
+
+def test_cache_is_bounded(monkeypatch):
+    """Test the least recently used tokens are evicted"""
+    monkeypatch.setattr(settings, "token_cache_size", 2)
+    tokens = [create_access_token({"sub": f"user{i}@example.com"}) for i in range(3)]
+    for token in tokens:
+        decode_access_token(token)
+
+    assert TokenCacheService.get(tokens[0]) is None
+    assert TokenCacheService.get(tokens[2]) == "user2@example.com"
+    assert TokenCacheService.get_stats()["entries"] == 2
@@ -0,0 +1,77 @@
+"""Tests for the authenticated user cache"""
+
+import pytest
+
+from app.config import settings
+from app.models import User
+from app.services import user_cache_service
+from app.services.user_cache_service import UserCacheService
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start every test with an empty cache and zeroed counters"""
+    UserCacheService.clear()
+    UserCacheService.reset_stats()
+    yield
+    UserCacheService.clear()
+
+
+def make_user(email: str, is_active: bool = True) -> User:
+    return User(
+        id=1, email=email, full_name="Jane", role="HR_RECRUITER", is_active=is_active
+    )
+
+
+def test_cache_hit_returns_detached_copy():
+    """Test a cached user is served without the original object"""
+    original = make_user("jane@example.com")
+    cached = UserCacheService.put(original)
+
+    assert UserCacheService.get("jane@example.com") is cached
+    assert cached is not original
+    assert (cached.id, cached.role) == (1, "HR_RECRUITER")
+    assert UserCacheService.get("bob@example.com") is None
+    assert UserCacheService.get_stats() == {
+        "hits": 1,
+        "misses": 1,
+        "lookups": 2,
+        "hit_rate": 50.0,
+        "entries": 1,
+    }
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    """Test staleness is bounded by the TTL"""
+    now = [1000.0]
+    monkeypatch.setattr(user_cache_service.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(settings, "user_cache_ttl_seconds", 30)
+    UserCacheService.put(make_user("jane@example.com"))
+
+    now[0] += 29
+    assert UserCacheService.get("jane@example.com") is not None
+    now[0] += 2
+    assert UserCacheService.get("jane@example.com") is None
+
+
+def test_least_recently_used_is_evicted(monkeypatch):
+    """Test the cache keeps the most recently used users when full"""
+    monkeypatch.setattr(settings, "user_cache_size", 2)
+    for email in ("a@example.com", "b@example.com"):
+        UserCacheService.put(make_user(email))
+    UserCacheService.get("a@example.com")
+    UserCacheService.put(make_user("c@example.com"))
+
+    assert UserCacheService.get("b@example.com") is None
+    assert UserCacheService.get("a@example.com") is not None
+    assert UserCacheService.get("c@example.com") is not None
+
+
+def test_inactive_and_invalidated_users_are_not_served():
+    """Test inactive users are never cached and invalidation drops entries"""
+    UserCacheService.put(make_user("gone@example.com", is_active=False))
+    UserCacheService.put(make_user("jane@example.com"))
+    UserCacheService.invalidate("jane@example.com")
+
+    assert UserCacheService.get("gone@example.com") is None
+    assert UserCacheService.get("jane@example.com") is None
@@ -0,0 +1,41 @@
+"""Archive audit log months past the retention window
+
+Expired months are written to gzipped JSONL files under storage/audit_archive
+and removed from audit_logs (whole partitions are dropped on PostgreSQL).
+Partitions for the coming months are created as well. Run it from cron:
+
+    cd backend && python ../scripts/archive_audit_logs.py --retention-days 365
+"""
+
+import argparse
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from app.config import settings
+from app.database import SessionLocal, init_db
+from app.services.audit_archive_service import AuditArchiveService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--retention-days", type=int, default=settings.audit_retention_days
+    )
+    args = parser.parse_args()
+    settings.audit_retention_days = args.retention_days
+
+    init_db()
+    with SessionLocal() as db:
+        service = AuditArchiveService(db)
+        archived = service.archive_expired()
+
+    for name, rows in archived.items():
+        print(f"{name}: archived {rows} entries")
+    print(f"Archived {len(archived)} months to {service.archive_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Benchmark request latency while slow queries run, with blocking vs awaited sessions
+
+Fires fast requests (GET /api/jobs) while slow report-style queries run
+concurrently, first through a synchronous Session inside an async handler
+(the old pattern, which blocks the event loop) and then through an
+AsyncSession, and reports the fast requests' latency percentiles. The slow
+query waits server-side (like a long-running query on a database server)
+rather than burning local CPU:
+
+    cd backend && python ../scripts/benchmark_async_routes.py --slow 4 --fast 200
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+WORKDIR = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(WORKDIR, 'benchmark.db')}"
+os.environ["DEBUG"] = "False"
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+import httpx
+from sqlalchemy import event, text
+
+from app.database import AsyncSessionLocal, SessionLocal, async_engine, engine, init_db
+from app.main import app
+from app.models import Job, User
+from app.utils.auth import create_access_token
+
+SLOW_QUERY = text("SELECT benchmark_sleep(:seconds)")
+
+
+def _add_sleep_function(dbapi_connection, connection_record):
+    """Register benchmark_sleep() on each SQLite connection"""
+    create_function = getattr(dbapi_connection, "create_function", None)
+    if create_function is None:  # aiosqlite adapter
+        create_function = dbapi_connection.driver_connection._conn.create_function
+    create_function("benchmark_sleep", 1, lambda seconds: time.sleep(seconds) or 1)
+
+
+event.listen(engine, "connect", _add_sleep_function)
+event.listen(async_engine.sync_engine, "connect", _add_sleep_function)
+
+
+@app.get("/benchmark/slow-blocking")
+async def slow_blocking(seconds: float):
+    """Slow query through a sync Session, blocking the event loop"""
+    with SessionLocal() as db:
+        return {"result": db.execute(SLOW_QUERY, {"seconds": seconds}).scalar()}
+
+
+@app.get("/benchmark/slow-async")
+async def slow_async(seconds: float):
+    """Slow query through an AsyncSession"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(SLOW_QUERY, {"seconds": seconds})
+        return {"result": result.scalar()}
+
+
+def seed() -> str:
+    """Create a user and some jobs, returning a bearer token"""
+    init_db()
+    with SessionLocal() as db:
+        user = User(
+            email="bench@example.com",
+            full_name="Benchmark",
+            role="HR_ADMIN",
+            hashed_password="unused",
+        )
+        db.add(user)
+        db.flush()
+        db.add_all(
+            Job(
+                title=f"Job {i}",
+                required_skills=["Python"],
+                nice_to_have=[],
+                keywords=[],
+                created_by=user.id,
+            )
+            for i in range(50)
+        )
+        db.commit()
+    return create_access_token({"sub": "bench@example.com"})
+
+
+async def run_scenario(client, headers, slow_path: str, args):
+    """Run slow queries in the background and time fast requests"""
+    latencies = []
+
+    async def slow_requests():
+        for _ in range(args.rounds):
+            await asyncio.gather(
+                *(
+                    client.get(slow_path, params={"seconds": args.query_seconds})
+                    for _ in range(args.slow)
+                )
+            )
+
+    async def fast_request():
+        started = time.perf_counter()
+        response = await client.get("/api/jobs", headers=headers)
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    async def fast_requests():
+        for _ in range(args.fast // args.concurrency):
+            await asyncio.gather(*(fast_request() for _ in range(args.concurrency)))
+            await asyncio.sleep(args.interval)
+
+    await asyncio.gather(slow_requests(), fast_requests())
+
+    latencies.sort()
+    return {
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "max": latencies[-1],
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--slow", type=int, default=4, help="Concurrent slow queries")
+    parser.add_argument("--fast", type=int, default=200, help="Fast requests")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds of slow queries")
+    parser.add_argument(
+        "--query-seconds", type=float, default=0.5, help="Duration of a slow query"
+    )
+    parser.add_argument(
+        "--interval", type=float, default=0.01, help="Pause between fast batches"
+    )
+    args = parser.parse_args()
+
+    headers = {"Authorization": f"Bearer {seed()}"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark", timeout=None
+    ) as client:
+        await client.get("/api/jobs", headers=headers)  # Warm up
+
+        print(f"{'Slow queries via':<18} {'p50':>9} {'p99':>9} {'max':>9}")
+        for label, path in [
+            ("sync Session", "/benchmark/slow-blocking"),
+            ("AsyncSession", "/benchmark/slow-async"),
+        ]:
+            stats = await run_scenario(client, headers, path, args)
+            print(
+                f"{label:<18} {stats['p50']:>7.1f}ms {stats['p99']:>7.1f}ms "
+                f"{stats['max']:>7.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,93 @@
+"""Benchmark memory use of the streaming audit log export
+
+Fills a SQLite audit_logs table and measures peak Python memory (tracemalloc)
+of exporting it as CSV through the streaming export, next to loading the same
+rows in one query the way a plain list endpoint would:
+
+    cd backend && python ../scripts/benchmark_audit_export.py --rows 1000000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+os.environ["DEBUG"] = "False"
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from sqlalchemy.orm import Session
+
+from app.database import Base, build_engine
+from app.models import AuditLog
+from app.services.audit_export_service import AuditExportService
+
+
+def build_database(engine, rows: int, batch_size: int = 50000):
+    """Insert synthetic audit entries, one per second"""
+    start = datetime(2026, 1, 1)
+    insert = AuditLog.__table__.insert()
+    for offset in range(0, rows, batch_size):
+        batch = [
+            {
+                "user_id": i % 50,
+                "action": "cv_uploaded",
+                "entity_type": "candidate",
+                "entity_id": i,
+                "details": {"filename": f"cv_{i}.pdf", "status": "success"},
+                "ip_address": "10.0.0.1",
+                "timestamp": start + timedelta(seconds=i),
+            }
+            for i in range(offset, min(offset + batch_size, rows))
+        ]
+        with engine.begin() as connection:
+            connection.execute(insert, batch)
+
+
+def measure(func):
+    """Return (result, seconds, peak MB) of a call"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000, help="Audit entries")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = build_engine(f"sqlite:///{os.path.join(workdir, 'benchmark.db')}")
+        Base.metadata.create_all(bind=engine)
+        build_database(engine, args.rows)
+
+        def stream():
+            with Session(bind=engine) as db:
+                service = AuditExportService(db)
+                return sum(len(chunk) for chunk in service.to_csv(service.entries()))
+
+        def load_all():
+            with Session(bind=engine) as db:
+                return len(db.query(AuditLog).order_by(AuditLog.timestamp).all())
+
+        size, elapsed, peak = measure(stream)
+        print(
+            f"streaming CSV  {args.rows} rows, {size / 1024 / 1024:.0f}MB "
+            f"in {elapsed:.1f}s ({args.rows / elapsed:,.0f} rows/s), "
+            f"peak {peak:.1f}MB"
+        )
+        _, elapsed, peak = measure(load_all)
+        print(f"load all rows  {elapsed:.1f}s, peak {peak:.1f}MB")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
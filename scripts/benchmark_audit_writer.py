@@ -0,0 +1,94 @@
+"""Benchmark the cost of audit logging inside a request
+
+Times AuditService.log_action per call with a synchronous commit and with the
+background writer, on a SQLite database using the production profile:
+
+    cd backend && python ../scripts/benchmark_audit_writer.py --actions 2000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ["DEBUG"] = "False"
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config import settings
+from app.database import Base, build_engine
+from app.models import AuditLog
+from app.services import audit_service
+from app.services.audit_service import AuditService, AuditWriter
+
+
+def percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def log_actions(engine, actions: int):
+    """Call log_action the way a request handler does, timing each call"""
+    latencies = []
+    with Session(bind=engine) as db:
+        for i in range(actions):
+            started = time.perf_counter()
+            AuditService.log_action(
+                db,
+                action="job_updated",
+                user_id=1,
+                entity_type="job",
+                entity_id=i,
+                details={"fields": ["title", "description"]},
+                ip_address="127.0.0.1",
+            )
+            latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def report(label: str, latencies, total: float):
+    print(
+        f"{label:<12} p50 {percentile(latencies, 0.5):>7.3f}ms "
+        f"p99 {percentile(latencies, 0.99):>7.3f}ms "
+        f"total {total:>7.0f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--actions", type=int, default=2000, help="Audit entries")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = build_engine(f"sqlite:///{os.path.join(workdir, 'benchmark.db')}")
+        Base.metadata.create_all(bind=engine)
+        audit_service.engine = engine
+
+        settings.audit_async_writes = False
+        started = time.perf_counter()
+        latencies = log_actions(engine, args.actions)
+        report("sync commit", latencies, (time.perf_counter() - started) * 1000)
+
+        settings.audit_async_writes = True
+        writer = AuditWriter(
+            sessionmaker(bind=engine),
+            flush_interval_ms=settings.audit_flush_interval_ms,
+            batch_size=settings.audit_batch_size,
+        )
+        audit_service._writer = writer
+        started = time.perf_counter()
+        latencies = log_actions(engine, args.actions)
+        writer.shutdown()
+        report("queued", latencies, (time.perf_counter() - started) * 1000)
+
+        with Session(bind=engine) as db:
+            print(f"Audit rows written: {db.query(AuditLog).count()}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Benchmark full-text candidate search over a large synthetic corpus
+
+Builds a SQLite database of synthetic candidates (indexed by the FTS5
+triggers as they are inserted) and times search queries, first page and
+after following the cursor a few pages deep:
+
+    cd backend && python ../scripts/benchmark_candidate_search.py --cvs 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ["DEBUG"] = "False"
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from benchmark_cv_parser import TAXONOMY_PATH, generate_cv
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import Base, build_engine
+from app.models import Candidate
+from app.services.search_service import SearchService
+from app.utils.cv_parser import CVParser
+
+QUERIES = ["kubernetes", "python kubernetes", "rust terraform graphql", "zyxwvut"]
+
+
+def build_database(engine, cvs: int, seed: int, batch_size: int = 10000):
+    """Insert synthetic candidates in batches"""
+    taxonomy = CVParser(TAXONOMY_PATH).skills_taxonomy
+    rng = random.Random(seed)
+    insert = Candidate.__table__.insert()
+
+    for start in range(0, cvs, batch_size):
+        batch = []
+        for i in range(start, min(start + batch_size, cvs)):
+            cv = generate_cv(rng, taxonomy["technical"], taxonomy["languages"])
+            batch.append(
+                {
+                    "name": cv.split("\n", 1)[0],
+                    "email": f"candidate{i}@example.com",
+                    "skills": rng.sample(taxonomy["technical"], 5),
+                    "languages": [],
+                    "raw_text": cv,
+                    "parse_status": "success",
+                }
+            )
+        with engine.begin() as connection:
+            connection.execute(insert, batch)
+        print(f"\rIndexed {min(start + batch_size, cvs)}/{cvs}", end="", flush=True)
+    print()
+
+
+def count_matches(db, query: str) -> int:
+    """Number of candidates matching every word of a query"""
+    fts_query = " ".join(f'"{term}"' for term in SearchService.terms(query))
+    return db.execute(
+        text("SELECT count(*) FROM candidates_fts WHERE candidates_fts MATCH :q"),
+        {"q": fts_query},
+    ).scalar()
+
+
+def timed(func, rounds: int) -> float:
+    """Return the best wall time in milliseconds over several rounds"""
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cvs", type=int, default=1000000, help="Candidates")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds")
+    parser.add_argument("--limit", type=int, default=20, help="Page size")
+    parser.add_argument("--pages", type=int, default=5, help="Depth of the deep page")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = build_engine(f"sqlite:///{os.path.join(workdir, 'benchmark.db')}")
+        Base.metadata.create_all(bind=engine)
+
+        started = time.perf_counter()
+        build_database(engine, args.cvs, args.seed)
+        print(f"Built in {time.perf_counter() - started:.0f}s")
+
+        deep_label = f"page {args.pages}"
+        print(f"SEARCH_RANK_WINDOW={settings.search_rank_window}")
+        print(
+            f"{'Query':<26} {'matches':>8} {'page 1':>10} {deep_label:>10} "
+            f"{'windowed':>9}"
+        )
+        with Session(bind=engine) as db:
+            search = SearchService(db)
+            for query in QUERIES:
+                cursor = None
+                for _ in range(args.pages - 1):
+                    _, cursor = search.search(query, cursor, args.limit)
+                    if cursor is None:
+                        break
+                first = timed(
+                    lambda: search.search(query, None, args.limit), args.rounds
+                )
+                deep = "-"
+                if cursor:
+                    deep_ms = timed(
+                        lambda: search.search(query, cursor, args.limit), args.rounds
+                    )
+                    deep = f"{deep_ms:.1f}ms"
+                print(
+                    f"{query:<26} {count_matches(db, query):>8} "
+                    f"{first:>8.1f}ms {deep:>10} {str(search.windowed):>9}"
+                )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""Benchmark single-pass CV feature extraction against the original multi-pass extractors
+
+Generates a corpus of synthetic CVs, checks both implementations extract identical
+fields and reports throughput:
+
+    cd backend && python ../scripts/benchmark_cv_parser.py --cvs 2000 --rounds 3
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from app.utils.cv_parser import CVParser
+
+TAXONOMY_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "data", "skills_taxonomy.json"
+)
+
+FIRST_NAMES = ["John", "Sarah", "Michael", "Emma", "David", "Noa", "Omar", "Lena"]
+LAST_NAMES = ["Doe", "Johnson", "Chen", "Rodriguez", "Kumar", "Levi", "Haddad"]
+DEGREES = [
+    "Bachelor of Science in Computer Science, Tel Aviv University",
+    "Master of Engineering, Technion College",
+    "MBA, Business School",
+    "B.Sc Software Engineering",
+]
+FILLER = (
+    "Designed and delivered features end to end, collaborating with product, "
+    "design and QA teams while mentoring junior engineers and improving "
+    "observability, reliability and deployment automation across services."
+)
+
+
+class LegacyCVParser(CVParser):
+    """Extractors as they were before the single-pass pipeline (baseline)"""
+
+    def extract_fields(self, text):
+        return {
+            "name": self._extract_name(text),
+            "email": self._extract_email(text),
+            "phone": self._extract_phone(text),
+            "education": self._extract_education(text),
+            "years_of_experience": self._estimate_experience(text),
+            "skills": self._extract_skills(text),
+            "languages": self._extract_languages(text),
+            "raw_text": text,
+        }
+
+    def _extract_name(self, text):
+        lines = text.strip().split("\n")
+        for line in lines[:5]:
+            line = line.strip()
+            if line and len(line) < 100:
+                name = re.sub(r"[^a-zA-Z\s]", "", line).strip()
+                if name and 2 <= len(name.split()) <= 4:
+                    return name
+        return "Unknown"
+
+    def _extract_email(self, text):
+        email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
+        match = re.search(email_pattern, text)
+        return match.group(0) if match else None
+
+    def _extract_phone(self, text):
+        phone_patterns = [
+            r"\+?1?\d{9,15}",
+            r"\(\d{3}\)\s*\d{3}-\d{4}",
+            r"\d{3}-\d{3}-\d{4}",
+        ]
+        for pattern in phone_patterns:
+            match = re.search(pattern, text)
+            if match:
+                return match.group(0)
+        return None
+
+    def _extract_education(self, text):
+        education_keywords = [
+            "bachelor",
+            "master",
+            "phd",
+            "doctorate",
+            "mba",
+            "b.sc",
+            "m.sc",
+            "university",
+            "college",
+            "degree",
+            "diploma",
+        ]
+        lines = text.lower().split("\n")
+        education_lines = []
+        for line in lines:
+            if any(keyword in line for keyword in education_keywords):
+                education_lines.append(line.strip())
+        return "; ".join(education_lines[:3]) if education_lines else "Not specified"
+
+    def _estimate_experience(self, text):
+        exp_patterns = [
+            r"(\d+)\+?\s*years?\s+(?:of\s+)?experience",
+            r"experience[:\s]+(\d+)\+?\s*years?",
+        ]
+        for pattern in exp_patterns:
+            match = re.search(pattern, text.lower())
+            if match:
+                return float(match.group(1))
+
+        year_pattern = r"(20\d{2})\s*(?:[-–]|to)\s*(20\d{2}|present|current)"
+        matches = re.findall(year_pattern, text.lower())
+        if matches:
+            total_years = 0
+            for start, end in matches:
+                end_year = 2026 if end in ["present", "current"] else int(end)
+                total_years += max(0, end_year - int(start))
+            return min(float(total_years), 50.0)
+        return 0.0
+
+    def _extract_skills(self, text):
+        text_lower = text.lower()
+        found_skills = []
+        all_skills = self.skills_taxonomy.get(
+            "technical", []
+        ) + self.skills_taxonomy.get("soft", [])
+        for skill in all_skills:
+            if skill.lower() in text_lower:
+                found_skills.append(skill)
+        return list(set(found_skills))
+
+    def _extract_languages(self, text):
+        text_lower = text.lower()
+        found_languages = []
+        for language in self.skills_taxonomy.get("languages", []):
+            if language.lower() in text_lower:
+                found_languages.append(language)
+        return list(set(found_languages))
+
+
+def generate_cv(rng: random.Random, skills, languages) -> str:
+    """Build one synthetic CV"""
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    lines = [
+        f"{first} {last}",
+        f"{first.lower()}.{last.lower()}@example.com | +1{rng.randint(10**9, 10**10 - 1)}",
+        "",
+        "SUMMARY",
+        f"Engineer with a focus on {', '.join(rng.sample(skills, 3))}.",
+        rng.choice(["", f"{rng.randint(2, 15)}+ years of experience."]),
+        "",
+        "EXPERIENCE",
+    ]
+
+    year = rng.randint(2008, 2016)
+    for _ in range(rng.randint(2, 5)):
+        end = min(year + rng.randint(1, 4), 2026)
+        lines.append(f"Senior Engineer, Company {rng.randint(1, 99)} ({year} - {end})")
+        lines.extend(FILLER for _ in range(rng.randint(2, 6)))
+        lines.append(f"Stack: {', '.join(rng.sample(skills, 5))}")
+        year = end
+
+    lines.extend(["", "EDUCATION", rng.choice(DEGREES), "", "LANGUAGES"])
+    lines.append(", ".join(rng.sample(languages, 2)))
+    return "\n".join(lines)
+
+
+def run(parser: CVParser, corpus, rounds: int) -> float:
+    """Return the best throughput (CVs/second) over several rounds"""
+    best = 0.0
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for text in corpus:
+            parser.extract_fields(text)
+        best = max(best, len(corpus) / (time.perf_counter() - started))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cvs", type=int, default=2000, help="Corpus size")
+    parser.add_argument("--rounds", type=int, default=3, help="Timed rounds")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    legacy = LegacyCVParser(TAXONOMY_PATH)
+    single_pass = CVParser(TAXONOMY_PATH)
+    taxonomy = single_pass.skills_taxonomy
+
+    rng = random.Random(args.seed)
+    corpus = [
+        generate_cv(rng, taxonomy["technical"], taxonomy["languages"])
+        for _ in range(args.cvs)
+    ]
+    average_kb = sum(len(text) for text in corpus) / len(corpus) / 1024
+
+    for text in corpus:
+        expected, actual = legacy.extract_fields(text), single_pass.extract_fields(text)
+        for fields in (expected, actual):
+            fields["skills"].sort()
+            fields["languages"].sort()
+        assert expected == actual, "single-pass output differs from baseline"
+
+    legacy_rate = run(legacy, corpus, args.rounds)
+    single_pass_rate = run(single_pass, corpus, args.rounds)
+
+    print(f"Corpus: {len(corpus)} CVs, {average_kb:.1f} KB average")
+    print(f"Multi-pass (baseline): {legacy_rate:10.0f} CVs/s")
+    print(f"Single-pass:           {single_pass_rate:10.0f} CVs/s")
+    print(f"Speedup:               {single_pass_rate / legacy_rate:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
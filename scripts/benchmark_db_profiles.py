@@ -0,0 +1,158 @@
+"""Benchmark concurrent reads and writes under each database engine profile
+
+Runs a mixed workload (candidate listing reads, upload-style writes) from
+several threads against a fresh database per profile:
+
+    cd backend && python ../scripts/benchmark_db_profiles.py --threads 8 --seconds 10
+
+By default a temporary SQLite file is used; pass --url to benchmark another
+database (its candidates table will be written to).
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, build_engine
+from app.models import AuditLog, Candidate
+
+PROFILES = ["default", "production"]
+
+
+def seed(Session, rows: int):
+    """Insert an initial set of candidates"""
+    with Session() as db:
+        db.add_all(
+            Candidate(
+                name=f"Candidate {i}",
+                email=f"candidate{i}@example.com",
+                skills=["Python", "SQL"],
+                languages=["English"],
+                raw_text="Python developer " * 100,
+                parse_status="success",
+            )
+            for i in range(rows)
+        )
+        db.commit()
+
+
+def worker(Session, deadline: float, write_ratio: float, seed_value: int, results):
+    """Run reads and writes until the deadline, recording latencies"""
+    rng = random.Random(seed_value)
+    reads, writes, errors = [], [], 0
+
+    while time.perf_counter() < deadline:
+        is_write = rng.random() < write_ratio
+        started = time.perf_counter()
+        try:
+            with Session() as db:
+                if is_write:
+                    candidate = Candidate(
+                        name="New Candidate",
+                        skills=["Python"],
+                        languages=[],
+                        raw_text="Uploaded CV " * 100,
+                        parse_status="success",
+                    )
+                    db.add(candidate)
+                    db.flush()
+                    db.add(
+                        AuditLog(
+                            action="cv_uploaded",
+                            entity_type="candidate",
+                            entity_id=candidate.id,
+                        )
+                    )
+                    db.commit()
+                else:
+                    db.query(Candidate).order_by(Candidate.id.desc()).limit(100).all()
+        except OperationalError:
+            errors += 1
+            continue
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        (writes if is_write else reads).append(elapsed_ms)
+
+    results.append((reads, writes, errors))
+
+
+def percentile(values, fraction: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def run_profile(url: str, profile: str, args):
+    """Run the workload against one engine profile"""
+    engine = build_engine(url, profile)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    seed(Session, args.rows)
+
+    results = []
+    deadline = time.perf_counter() + args.seconds
+    threads = [
+        threading.Thread(
+            target=worker, args=(Session, deadline, args.write_ratio, i, results)
+        )
+        for i in range(args.threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+
+    reads = [ms for r, _, _ in results for ms in r]
+    writes = [ms for _, w, _ in results for ms in w]
+    errors = sum(e for _, _, e in results)
+    return {
+        "ops_per_second": (len(reads) + len(writes)) / args.seconds,
+        "read_p50": statistics.median(reads) if reads else 0.0,
+        "read_p99": percentile(reads, 0.99),
+        "write_p50": statistics.median(writes) if writes else 0.0,
+        "write_p99": percentile(writes, 0.99),
+        "errors": errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=None, help="Database URL to benchmark")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--rows", type=int, default=2000, help="Seeded candidates")
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    args = parser.parse_args()
+
+    print(
+        f"{'Profile':<12} {'ops/s':>8} {'read p50':>9} {'read p99':>9} "
+        f"{'write p50':>10} {'write p99':>10} {'errors':>7}"
+    )
+    for profile in PROFILES:
+        with tempfile.TemporaryDirectory() as workdir:
+            url = args.url or f"sqlite:///{os.path.join(workdir, 'benchmark.db')}"
+            stats = run_profile(url, profile, args)
+        print(
+            f"{profile:<12} {stats['ops_per_second']:>8.0f} "
+            f"{stats['read_p50']:>7.1f}ms {stats['read_p99']:>7.1f}ms "
+            f"{stats['write_p50']:>8.1f}ms {stats['write_p99']:>8.1f}ms "
+            f"{stats['errors']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Benchmark facet counts from facet_counts vs counting over candidates
+
+Builds a SQLite database of synthetic candidates and compares reading the
+precomputed facet counts with loading every candidate and counting skills,
+languages, experience bands and statuses in Python:
+
+    cd backend && python ../scripts/benchmark_facets.py --cvs 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+
+os.environ["DEBUG"] = "False"
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from benchmark_cv_parser import TAXONOMY_PATH
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.database import Base, build_engine
+from app.models import Candidate, FacetCount
+from app.models.facets import experience_band, rebuild_facets
+from app.utils.cv_parser import CVParser
+
+
+def build_database(engine, cvs: int, seed: int, batch_size: int = 10000):
+    """Insert synthetic candidates, then build their facet tables"""
+    taxonomy = CVParser(TAXONOMY_PATH).skills_taxonomy
+    rng = random.Random(seed)
+    with engine.begin() as connection:
+        for start in range(0, cvs, batch_size):
+            connection.execute(
+                Candidate.__table__.insert(),
+                [
+                    {
+                        "name": f"Candidate {i}",
+                        "skills": rng.sample(taxonomy["technical"], 8),
+                        "languages": rng.sample(taxonomy["languages"], 2),
+                        "years_of_experience": rng.randint(0, 20),
+                        "parse_status": rng.choice(["success"] * 9 + ["failed"]),
+                    }
+                    for i in range(start, min(start + batch_size, cvs))
+                ],
+            )
+        rebuild_facets(connection, batch_size=batch_size)
+
+
+def count_in_python(db):
+    """Facet counts the way they would be computed without facet_counts"""
+    counts = Counter()
+    for skills, languages, years, status in db.execute(
+        select(
+            Candidate.skills,
+            Candidate.languages,
+            Candidate.years_of_experience,
+            Candidate.parse_status,
+        )
+    ):
+        counts.update(("skill", skill) for skill in skills or [])
+        counts.update(("language", language) for language in languages or [])
+        counts[("experience", experience_band(years))] += 1
+        counts[("status", status)] += 1
+    return counts
+
+
+def read_facet_counts(db):
+    """Facet counts from the precomputed table"""
+    return {
+        (row.facet, row.value): row.count
+        for row in db.query(FacetCount).filter(FacetCount.count > 0)
+    }
+
+
+def timed(func, rounds: int) -> float:
+    """Return the best wall time in milliseconds over several rounds"""
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cvs", type=int, default=100000, help="Candidates")
+    parser.add_argument("--rounds", type=int, default=3, help="Timed rounds")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = build_engine(f"sqlite:///{os.path.join(workdir, 'benchmark.db')}")
+        Base.metadata.create_all(bind=engine)
+        build_database(engine, args.cvs, args.seed)
+
+        with Session(bind=engine) as db:
+            precomputed = read_facet_counts(db)
+            assert precomputed == dict(count_in_python(db))
+            python_ms = timed(lambda: count_in_python(db), args.rounds)
+            table_ms = timed(lambda: read_facet_counts(db), args.rounds)
+        engine.dispose()
+
+    print(f"Corpus: {args.cvs} candidates, {len(precomputed)} facet values")
+    print(f"Count over candidates: {python_ms:10.1f} ms")
+    print(f"Read facet_counts:     {table_ms:10.1f} ms ({python_ms / table_ms:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
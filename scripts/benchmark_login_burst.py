@@ -0,0 +1,134 @@
+"""Benchmark request latency during a burst of logins, inline vs pooled bcrypt
+
+Fires fast requests (GET /api/jobs) while a burst of logins runs, first with
+bcrypt verification inline in the async handler (the old pattern, which
+blocks the event loop) and then through POST /api/auth/login, which verifies
+on the bounded password hashing pool:
+
+    cd backend && python ../scripts/benchmark_login_burst.py --logins 20
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+WORKDIR = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(WORKDIR, 'benchmark.db')}"
+os.environ["DEBUG"] = "False"
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+import httpx
+
+from app.database import SessionLocal, init_db
+from app.main import app
+from app.models import Job, User
+from app.schemas import LoginRequest
+from app.services.password_pool import get_password_pool
+from app.utils.auth import create_access_token, get_password_hash, verify_password
+
+PASSWORD = "benchmark-password"
+
+
+@app.post("/benchmark/login-inline")
+async def login_inline(request: LoginRequest):
+    """Verify the password inside the handler, blocking the event loop"""
+    with SessionLocal() as db:
+        user = db.query(User).filter(User.email == request.email).first()
+        return {"valid": verify_password(request.password, user.hashed_password)}
+
+
+def seed() -> str:
+    """Create a user and some jobs, returning a bearer token"""
+    init_db()
+    with SessionLocal() as db:
+        user = User(
+            email="bench@example.com",
+            full_name="Benchmark",
+            role="HR_ADMIN",
+            hashed_password=get_password_hash(PASSWORD),
+        )
+        db.add(user)
+        db.flush()
+        db.add_all(
+            Job(
+                title=f"Job {i}",
+                required_skills=["Python"],
+                nice_to_have=[],
+                keywords=[],
+                created_by=user.id,
+            )
+            for i in range(50)
+        )
+        db.commit()
+    return create_access_token({"sub": "bench@example.com"})
+
+
+async def run_scenario(client, headers, login_path: str, args):
+    """Run a login burst and time fast requests issued meanwhile"""
+    latencies = []
+    credentials = {"email": "bench@example.com", "password": PASSWORD}
+    burst_done = asyncio.Event()
+
+    async def logins():
+        await asyncio.gather(
+            *(client.post(login_path, json=credentials) for _ in range(args.logins))
+        )
+        burst_done.set()
+
+    async def fast_requests():
+        while not burst_done.is_set():
+            started = time.perf_counter()
+            response = await client.get("/api/jobs", headers=headers)
+            response.raise_for_status()
+            latencies.append((time.perf_counter() - started) * 1000)
+            await asyncio.sleep(args.interval)
+
+    started = time.perf_counter()
+    await asyncio.gather(logins(), fast_requests())
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "burst": elapsed,
+        "requests": len(latencies),
+        "p50": statistics.median(latencies),
+        "max": latencies[-1],
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=20, help="Concurrent logins")
+    parser.add_argument(
+        "--interval", type=float, default=0.01, help="Pause between fast requests"
+    )
+    args = parser.parse_args()
+
+    headers = {"Authorization": f"Bearer {seed()}"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark", timeout=None
+    ) as client:
+        await client.get("/api/jobs", headers=headers)  # Warm up
+
+        print(f"{'bcrypt':<8} {'burst':>7} {'fast reqs':>10} {'p50':>9} {'max':>9}")
+        for label, path in [
+            ("inline", "/benchmark/login-inline"),
+            ("pooled", "/api/auth/login"),
+        ]:
+            stats = await run_scenario(client, headers, path, args)
+            print(
+                f"{label:<8} {stats['burst']:>6.1f}s {stats['requests']:>10} "
+                f"{stats['p50']:>7.1f}ms {stats['max']:>7.1f}ms"
+            )
+        print(f"Pool: {get_password_pool().get_stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+"""Benchmark deep audit log pages with offset vs cursor pagination
+
+Seeds a temporary SQLite database with audit log entries and times fetching
+the first and a deep page both ways:
+
+    cd backend && python ../scripts/benchmark_pagination.py --rows 1000000 --page 10000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+os.environ["DEBUG"] = "False"
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from sqlalchemy.orm import Session
+
+from app.database import Base, build_engine
+from app.models import AuditLog
+from app.utils.pagination import encode_cursor, paginate
+
+ORDER = (AuditLog.timestamp, AuditLog.id)
+
+
+def seed(engine, rows: int):
+    """Insert audit log entries a second apart"""
+    start = datetime(2026, 1, 1)
+    batch = []
+    with engine.begin() as connection:
+        for i in range(rows):
+            batch.append(
+                {
+                    "action": "cv_uploaded",
+                    "entity_type": "candidate",
+                    "entity_id": i,
+                    "timestamp": start + timedelta(seconds=i),
+                }
+            )
+            if len(batch) == 10000:
+                connection.execute(AuditLog.__table__.insert(), batch)
+                batch = []
+        if batch:
+            connection.execute(AuditLog.__table__.insert(), batch)
+
+
+def time_query(query, repeat: int) -> float:
+    """Best-of-N time of a query in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        query.all()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--page", type=int, default=10000, help="Deep page number")
+    parser.add_argument("--limit", type=int, default=100, help="Page size")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = build_engine(f"sqlite:///{os.path.join(workdir, 'benchmark.db')}")
+        Base.metadata.create_all(bind=engine)
+        seed(engine, args.rows)
+
+        with Session(bind=engine) as db:
+            skip = (args.page - 1) * args.limit
+            # The cursor a client would hold after reading the previous page
+            last = paginate(
+                db.query(AuditLog), ORDER, None, skip - 1, 1, descending=True
+            ).one()
+            cursor = encode_cursor([last.timestamp, last.id])
+
+            def query(**kwargs):
+                return paginate(
+                    db.query(AuditLog),
+                    ORDER,
+                    limit=args.limit,
+                    descending=True,
+                    **kwargs,
+                )
+
+            print(f"{'Page':<16} {'offset':>10} {'cursor':>10}")
+            print(
+                f"{'1':<16} {time_query(query(), args.repeat):>8.2f}ms "
+                f"{time_query(query(), args.repeat):>8.2f}ms"
+            )
+            print(
+                f"{args.page:<16} {time_query(query(skip=skip), args.repeat):>8.2f}ms "
+                f"{time_query(query(cursor=cursor), args.repeat):>8.2f}ms"
+            )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Benchmark database size and query time with plain and compressed raw_text
+
+Builds a SQLite database of synthetic candidates with uncompressed raw_text,
+measures it, compresses the column in place and measures again:
+
+    cd backend && python ../scripts/benchmark_raw_text_compression.py --cvs 5000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from benchmark_cv_parser import TAXONOMY_PATH, generate_cv
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker, undefer
+
+from app.database import Base
+from app.models import Candidate
+from app.utils.compression import compress_column, default_codec
+from app.utils.cv_parser import CVParser
+
+KEYWORDS = ["kubernetes", "mentoring", "observability", "fintech"]
+
+
+def build_database(path: str, corpus):
+    """Create a database whose raw_text values are stored uncompressed"""
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO candidates (name, email, skills, languages, raw_text, "
+                "parse_status) VALUES (:name, :email, '[]', '[]', :raw_text, 'success')"
+            ),
+            [
+                {
+                    "name": cv.split("\n", 1)[0],
+                    "email": f"candidate{i}@example.com",
+                    "raw_text": cv,
+                }
+                for i, cv in enumerate(corpus)
+            ],
+        )
+    engine.dispose()
+
+
+def timed(func, rounds: int) -> float:
+    """Return the best wall time in milliseconds over several rounds"""
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def measure(path: str, rounds: int):
+    """Measure file size and the main read patterns against one database"""
+    engine = create_engine(f"sqlite:///{path}")
+    Session = sessionmaker(bind=engine)
+
+    def list_candidates():
+        with Session() as db:
+            db.query(Candidate).all()
+
+    def keyword_match():
+        with Session() as db:
+            candidates = db.query(Candidate).options(undefer(Candidate.raw_text)).all()
+            for candidate in candidates:
+                body = candidate.raw_text.lower()
+                sum(1 for keyword in KEYWORDS if keyword in body)
+
+    results = {
+        "size_kb": os.path.getsize(path) / 1024,
+        "list_ms": timed(list_candidates, rounds),
+        "keyword_ms": timed(keyword_match, rounds),
+    }
+    engine.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cvs", type=int, default=5000, help="Candidates")
+    parser.add_argument("--rounds", type=int, default=3, help="Timed rounds")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    taxonomy = CVParser(TAXONOMY_PATH).skills_taxonomy
+    rng = random.Random(args.seed)
+    corpus = [
+        generate_cv(rng, taxonomy["technical"], taxonomy["languages"])
+        for _ in range(args.cvs)
+    ]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "benchmark.db")
+        build_database(path, corpus)
+        before = measure(path, args.rounds)
+
+        engine = create_engine(f"sqlite:///{path}")
+        stats = compress_column(engine, "candidates", "raw_text")
+        with engine.connect() as connection:
+            connection.execute(text("VACUUM"))
+        engine.dispose()
+        after = measure(path, args.rounds)
+
+    codec = {b"\x01": "zlib", b"\x02": "zstd"}[default_codec()]
+    print(f"Corpus: {len(corpus)} CVs, codec {codec}")
+    print(
+        f"raw_text bytes:        {stats['bytes_before'] / 1024:10.0f} KB "
+        f"-> {stats['bytes_after'] / 1024:.0f} KB"
+    )
+    for label, key, unit in [
+        ("Database size", "size_kb", "KB"),
+        ("List candidates", "list_ms", "ms"),
+        ("Keyword match scan", "keyword_ms", "ms"),
+    ]:
+        print(
+            f"{label + ':':<22} {before[key]:10.1f} {unit} -> {after[key]:.1f} {unit} "
+            f"({before[key] / after[key]:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark the skills frequency report, SQL aggregation vs counting in Python
+
+Builds a SQLite database of synthetic candidates and compares the report's
+SQL top-N query over candidate_tags with loading every successfully parsed
+candidate's skills and counting them with a Counter, reporting wall time and
+peak Python memory (tracemalloc):
+
+    cd backend && python ../scripts/benchmark_skills_report.py --cvs 200000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+
+os.environ["DEBUG"] = "False"
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from benchmark_facets import build_database
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.database import Base, build_engine
+from app.models import Candidate
+from app.routes.reports import top_skills_query
+
+
+def count_in_python(db, limit: int):
+    """The report as it was computed before, loading every candidate"""
+    counts = Counter()
+    for skills in db.scalars(
+        select(Candidate.skills).filter(Candidate.parse_status == "success")
+    ):
+        counts.update(skills or [])
+    return counts.most_common(limit)
+
+
+def count_in_sql(db, limit: int):
+    """The report's top-N aggregation in the database"""
+    return db.execute(top_skills_query(limit)).all()
+
+
+def measure(func):
+    """Return (result, milliseconds, peak MB) of a call"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed * 1000, peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cvs", type=int, default=200000, help="Candidates")
+    parser.add_argument("--limit", type=int, default=20, help="Top skills")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = build_engine(f"sqlite:///{os.path.join(workdir, 'benchmark.db')}")
+        Base.metadata.create_all(bind=engine)
+        build_database(engine, args.cvs, args.seed)
+
+        with Session(bind=engine) as db:
+            python_top, python_ms, python_mb = measure(
+                lambda: count_in_python(db, args.limit)
+            )
+            sql_top, sql_ms, sql_mb = measure(lambda: count_in_sql(db, args.limit))
+
+        assert [count for _, count in python_top] == [count for _, count in sql_top]
+        print(f"Python Counter {python_ms:>8.0f}ms  peak {python_mb:>7.1f}MB")
+        print(f"SQL top-N      {sql_ms:>8.0f}ms  peak {sql_mb:>7.1f}MB")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
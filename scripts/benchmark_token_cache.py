@@ -0,0 +1,87 @@
+"""Micro-benchmark of per-request authentication overhead
+
+Times get_current_user (JWT verification plus user lookup) against a SQLite
+database with the verified-token and user caches disabled and enabled:
+
+    cd backend && python ../scripts/benchmark_token_cache.py --requests 20000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ["DEBUG"] = "False"
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import Base, build_engine
+from app.models import User
+from app.services.token_cache_service import TokenCacheService
+from app.services.user_cache_service import UserCacheService
+from app.utils.auth import create_access_token, decode_access_token, get_current_user
+
+SCENARIOS = [
+    ("no caches", 0, 0),
+    ("token cache", 10000, 0),
+    ("token + user", 10000, 30),
+]
+
+
+def per_call_us(func, requests: int) -> float:
+    """Average microseconds per call"""
+    started = time.perf_counter()
+    for _ in range(requests):
+        func()
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000, help="Calls per case")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = build_engine(f"sqlite:///{os.path.join(workdir, 'benchmark.db')}")
+        Base.metadata.create_all(bind=engine)
+        with Session(bind=engine) as db:
+            db.add(
+                User(
+                    email="bench@example.com",
+                    full_name="Benchmark",
+                    role="HR_RECRUITER",
+                    hashed_password="unused",
+                )
+            )
+            db.commit()
+
+        token = create_access_token({"sub": "bench@example.com"})
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        print(f"{'Caches':<14} {'decode':>10} {'get_current_user':>18}")
+        for label, token_cache_size, user_cache_ttl in SCENARIOS:
+            settings.token_cache_size = token_cache_size
+            settings.user_cache_ttl_seconds = user_cache_ttl
+            TokenCacheService.clear()
+            UserCacheService.clear()
+
+            decode = per_call_us(lambda: decode_access_token(token), args.requests)
+
+            def authenticate():
+                # A fresh session per request, as with the get_db dependency
+                with Session(bind=engine) as db:
+                    get_current_user(credentials, db)
+
+            full = per_call_us(authenticate, args.requests)
+            print(f"{label:<14} {decode:>8.1f}us {full:>16.1f}us")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
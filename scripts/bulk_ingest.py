@@ -0,0 +1,90 @@
+"""Bulk-ingest a directory or ZIP archive of CVs with checkpoint/resume
+
+Run from the backend directory so relative storage/database paths resolve:
+
+    cd backend && python ../scripts/bulk_ingest.py /data/client_cvs.zip --workers 8
+
+Re-running the same command after an interruption skips files that were already
+committed (tracked in <source>.checkpoint unless --checkpoint is given).
+"""
+
+import argparse
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from app.database import SessionLocal, init_db
+from app.services.ingest_service import BulkIngestService
+
+
+def print_progress(stats):
+    """Print a one-line progress report"""
+    print(
+        f"  {stats['processed']} files processed "
+        f"({stats['files_per_second']:.1f} files/s, "
+        f"{stats['parse_failed']} parse failures, {stats['errors']} errors, "
+        f"{stats['skipped']} skipped from checkpoint)",
+        flush=True,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", help="Directory or .zip archive of CV files")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Parser processes (default: CPUs)"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=500, help="Candidates per transaction"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default=None,
+        help="Checkpoint file (default: <source>.checkpoint)",
+    )
+    parser.add_argument(
+        "--restart", action="store_true", help="Ignore and reset an existing checkpoint"
+    )
+    args = parser.parse_args()
+
+    source = os.path.abspath(args.source)
+    if not os.path.exists(source):
+        print(f"Source not found: {source}")
+        sys.exit(1)
+
+    checkpoint = args.checkpoint or f"{source.rstrip(os.sep)}.checkpoint"
+    if args.restart and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+
+    init_db()
+    db = SessionLocal()
+
+    print(f"Ingesting {source} (checkpoint: {checkpoint})")
+    try:
+        stats = BulkIngestService(
+            db,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            checkpoint_path=checkpoint,
+            progress=print_progress,
+        ).run(source)
+    except KeyboardInterrupt:
+        print("\nInterrupted - re-run the same command to resume")
+        sys.exit(130)
+    finally:
+        db.close()
+
+    print_progress(stats)
+    for error in stats["error_details"][:20]:
+        print(f"  error: {error['file']}: {error['error']}")
+
+    print(
+        f"Done: {stats['ingested']} candidates in {stats['elapsed_seconds']}s "
+        f"({stats['files_per_second']:.1f} files/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
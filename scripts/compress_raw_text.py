@@ -0,0 +1,74 @@
+"""Compress raw_text of existing candidates and parse cache entries in place
+
+Run from the backend directory so the relative database path resolves:
+
+    cd backend && python ../scripts/compress_raw_text.py [--dry-run]
+
+On PostgreSQL the TEXT columns are first converted to BYTEA. SQLite stores the
+compressed BLOBs in the existing columns without a schema change. Run VACUUM
+afterwards to give the freed pages back to the filesystem.
+"""
+
+import argparse
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from sqlalchemy import LargeBinary, inspect, text
+
+from app.database import engine, init_db
+from app.utils.compression import compress_column
+
+COLUMNS = [("candidates", "raw_text"), ("parse_cache", "raw_text")]
+
+
+def ensure_binary_columns():
+    """Convert TEXT columns to BYTEA on PostgreSQL, keeping values readable"""
+    if engine.dialect.name != "postgresql":
+        return
+
+    for table, column in COLUMNS:
+        columns = {c["name"]: c["type"] for c in inspect(engine).get_columns(table)}
+        if isinstance(columns[column], LargeBinary):
+            continue
+
+        print(f"Converting {table}.{column} to BYTEA...")
+        with engine.begin() as connection:
+            # Prefix the uncompressed codec byte so rows read back as plain text
+            connection.execute(
+                text(
+                    f"ALTER TABLE {table} ALTER COLUMN {column} TYPE BYTEA "
+                    f"USING decode('00', 'hex') || convert_to({column}, 'UTF8')"
+                )
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report savings without writing"
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    init_db()
+    if not args.dry_run:
+        ensure_binary_columns()
+
+    prefix = "Would compress" if args.dry_run else "Compressed"
+    for table, column in COLUMNS:
+        stats = compress_column(
+            engine, table, column, batch_size=args.batch_size, dry_run=args.dry_run
+        )
+        saved = stats["bytes_before"] - stats["bytes_after"]
+        print(
+            f"{table}.{column}: {prefix} {stats['compressed']} of {stats['rows']} rows, "
+            f"{stats['bytes_before'] / 1024:.0f} KB -> "
+            f"{stats['bytes_after'] / 1024:.0f} KB ({saved / 1024:.0f} KB saved)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Migrate CV files from flat storage/cvs/<filename> into the content-addressed store
+
+Run from the backend directory so relative storage/database paths resolve:
+
+    cd backend && python ../scripts/migrate_cv_storage.py [--dry-run]
+"""
+
+import argparse
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from sqlalchemy import inspect, text
+
+from app.database import SessionLocal, engine, init_db
+from app.services.storage_service import StorageService
+
+
+def ensure_file_hash_column():
+    """Add candidates.file_hash to databases created before content addressing"""
+    columns = {column["name"] for column in inspect(engine).get_columns("candidates")}
+    if "file_hash" in columns:
+        return
+
+    print("Adding candidates.file_hash column...")
+    with engine.begin() as connection:
+        connection.execute(
+            text("ALTER TABLE candidates ADD COLUMN file_hash VARCHAR(64)")
+        )
+        connection.execute(
+            text("CREATE INDEX ix_candidates_file_hash ON candidates (file_hash)")
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report what would be migrated"
+    )
+    args = parser.parse_args()
+
+    init_db()
+    ensure_file_hash_column()
+
+    db = SessionLocal()
+    try:
+        stats = StorageService().migrate_legacy_files(db, dry_run=args.dry_run)
+    finally:
+        db.close()
+
+    prefix = "Would migrate" if args.dry_run else "Migrated"
+    print(
+        f"{prefix} {stats['files']} files for {stats['candidates']} candidates "
+        f"({stats['deduplicated']} already stored, {stats['missing']} missing)"
+    )
+
+
+if __name__ == "__main__":
+    main()
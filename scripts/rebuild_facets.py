@@ -0,0 +1,39 @@
+"""Rebuild candidate facet tags and counts from the candidates table
+
+The tags and counts are maintained as candidates change through the
+application; rebuild them after writing candidates with raw SQL:
+
+    cd backend && python ../scripts/rebuild_facets.py
+"""
+
+import argparse
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from sqlalchemy import func, select
+
+from app.database import engine, init_db
+from app.models import CandidateTag, FacetCount
+from app.models.facets import rebuild_facets
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    init_db()
+    with engine.begin() as connection:
+        rebuild_facets(connection, batch_size=args.batch_size)
+        tags = connection.scalar(select(func.count()).select_from(CandidateTag))
+        values = connection.scalar(
+            select(func.count()).select_from(FacetCount).where(FacetCount.count > 0)
+        )
+    print(f"Rebuilt {tags} candidate tags over {values} facet values")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Rebuild the materialized pipeline statistics from the source tables
+
+Candidate, job and score counts are maintained as rows change through the
+application; rebuild them after writing those tables with raw SQL, or to
+fix any drift:
+
+    cd backend && python ../scripts/rebuild_pipeline_stats.py
+"""
+
+import argparse
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from sqlalchemy import func, select
+
+from app.database import engine, init_db
+from app.models import JobScoreStats, PipelineSummary
+from app.models.pipeline_stats import SUMMARY_ID, rebuild_pipeline_stats
+
+
+def main():
+    argparse.ArgumentParser(description=__doc__.splitlines()[0]).parse_args()
+
+    init_db()
+    with engine.begin() as connection:
+        rebuild_pipeline_stats(connection)
+        summary = connection.execute(
+            select(PipelineSummary).where(PipelineSummary.id == SUMMARY_ID)
+        ).one()
+        jobs_scored = connection.scalar(select(func.count()).select_from(JobScoreStats))
+    print(
+        f"Rebuilt pipeline stats: {summary.candidates} candidates "
+        f"({summary.candidates_parsed} parsed, {summary.candidates_failed} failed), "
+        f"{summary.jobs} jobs ({summary.jobs_active} active), "
+        f"score aggregates for {jobs_scored} jobs"
+    )
+
+
+if __name__ == "__main__":
+    main()
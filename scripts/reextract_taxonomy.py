@@ -0,0 +1,66 @@
+"""Refresh candidate skills/languages from stored raw_text after a taxonomy change
+
+Run from the backend directory so relative database/taxonomy paths resolve:
+
+    cd backend && python ../scripts/reextract_taxonomy.py --taxonomy ../data/skills_taxonomy.json
+"""
+
+import argparse
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from app.database import SessionLocal
+from app.services.reextraction_service import ReextractionService
+from app.utils.cv_parser import CVParser
+
+
+def print_diff(title, gained, lost):
+    """Print per-value gained/lost counts"""
+    values = sorted(
+        set(gained) | set(lost), key=lambda v: -(gained.get(v, 0) + lost.get(v, 0))
+    )
+    if not values:
+        return
+
+    print(f"\n{title:<30} {'gained':>8} {'lost':>8}")
+    for value in values:
+        print(f"{value:<30} {gained.get(value, 0):>8} {lost.get(value, 0):>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--taxonomy", default="./data/skills_taxonomy.json", help="Skills taxonomy JSON"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report the diff without writing"
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        report = ReextractionService(
+            db,
+            parser=CVParser(args.taxonomy),
+            workers=args.workers,
+            batch_size=args.batch_size,
+        ).run(dry_run=args.dry_run)
+    finally:
+        db.close()
+
+    prefix = "Would update" if args.dry_run else "Updated"
+    print(
+        f"{prefix} {report['changed']} of {report['scanned']} candidates "
+        f"(taxonomy {report['taxonomy_version']}, {report['elapsed_seconds']}s)"
+    )
+    print_diff("Skill", report["skills_gained"], report["skills_lost"])
+    print_diff("Language", report["languages_gained"], report["languages_lost"])
+
+
+if __name__ == "__main__":
+    main()